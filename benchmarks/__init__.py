@@ -0,0 +1,10 @@
+"""
+Standalone performance benchmarks.
+
+Run a benchmark as a module from the project root, e.g.::
+
+    python -m benchmarks.bench_pagination --rows 20000
+
+They run against a throwaway test database created from the configured
+DATABASES setting (in-memory SQLite unless DATABASE_URL is set).
+"""
@@ -0,0 +1,53 @@
+import os
+import statistics
+import sys
+import time
+from pathlib import Path
+
+ROOT = Path(__file__).resolve().parent.parent
+
+
+def setup_django():
+    """
+    Configure Django and create a throwaway test database.
+
+    Falls back to SQLite when no database is configured through the
+    environment, mirroring the DEV_DB switch in settings.py.
+    """
+    sys.path.insert(0, str(ROOT))
+    os.environ.setdefault('DJANGO_SETTINGS_MODULE', 'lazydog_api.settings')
+    os.environ.setdefault('SECRET_KEY', 'benchmark-secret-key')
+    if not (os.environ.get('DATABASE_URL')
+            or os.environ.get('GITHUB_WORKFLOW')):
+        os.environ.setdefault('DEV_DB', '1')
+
+    import django
+    django.setup()
+
+    from django.db import connection
+    from django.test.utils import setup_test_environment
+
+    setup_test_environment()
+    connection.creation.create_test_db(verbosity=0, autoclobber=True)
+    return connection
+
+
+def teardown_django(connection):
+    """
+    Drop the test database created by `setup_django`.
+    """
+    connection.creation.destroy_test_db(
+        connection.settings_dict['NAME'], verbosity=0
+    )
+
+
+def timeit(func, repeat=20):
+    """
+    Call `func` `repeat` times and return the median wall time in ms.
+    """
+    samples = []
+    for _ in range(repeat):
+        start = time.perf_counter()
+        func()
+        samples.append((time.perf_counter() - start) * 1000)
+    return statistics.median(samples)
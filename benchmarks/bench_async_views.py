@@ -0,0 +1,149 @@
+"""
+Load-test the async read-only endpoints against the sync DRF viewsets.
+
+    python -m benchmarks.bench_async_views --requests 500 --concurrency 50
+
+Both kinds of endpoint are driven through the ASGI application in-process
+(no network or server needed), with `--concurrency` requests in flight at
+a time. Reports requests/sec and p50/p99 latency per endpoint. Uses the
+database from DATABASE_URL when set (PostgreSQL), SQLite otherwise.
+"""
+import argparse
+import asyncio
+import time
+
+from benchmarks._bootstrap import setup_django, teardown_django
+
+ENDPOINTS = [
+    ('sync resources', '/api/v1/resources/', 'page_size=50'),
+    ('async resources', '/api/v1/async/resources/', 'limit=50'),
+    ('sync comments', '/api/v1/comments/', ''),
+    ('async comments', '/api/v1/async/comments/', 'limit=50'),
+    ('sync ratings', '/api/v1/ratings/', ''),
+    ('async ratings', '/api/v1/async/ratings/', 'limit=50'),
+]
+
+
+def seed(rows):
+    from django.contrib.auth.models import User
+    from comment.models import Comment
+    from rating.models import Rating
+    from resource_item.canonical import url_hash
+    from resource_item.models import ResourceItem
+    from tag.models import Tag
+
+    owner = User.objects.create_user(username='bench', password='bench')
+    rater = User.objects.create_user(username='rater', password='bench')
+    tags = Tag.objects.bulk_create_with_slugs(
+        [Tag(name=f'bench-{i}') for i in range(3)]
+    )
+    items = ResourceItem.objects.bulk_create([
+        ResourceItem(
+            title=f'Resource {i}',
+            description='Benchmark resource description',
+            user=owner,
+            url=f'https://example.com/bench/{i}',
+            url_hash=url_hash(f'https://example.com/bench/{i}'),
+        )
+        for i in range(rows)
+    ])
+    ResourceItem.tags.through.objects.bulk_create([
+        ResourceItem.tags.through(resourceitem_id=item.pk, tag_id=tag.pk)
+        for item in items for tag in tags
+    ])
+    # The sync comment and rating lists are not paginated; keep them to
+    # a comparable 50 rows.
+    Comment.objects.bulk_create([
+        Comment(user=rater, resource_item=item, content='Benchmark comment')
+        for item in items[:50]
+    ])
+    Rating.objects.bulk_create([
+        Rating(user=rater, resource_item=item, score=4) for item in items[:50]
+    ])
+
+
+async def request(application, path, query):
+    scope = {
+        'type': 'http',
+        'asgi': {'version': '3.0'},
+        'http_version': '1.1',
+        'method': 'GET',
+        'scheme': 'http',
+        'path': path,
+        'raw_path': path.encode(),
+        'query_string': query.encode(),
+        'root_path': '',
+        'headers': [
+            (b'host', b'testserver'),
+            (b'accept', b'application/json'),
+        ],
+        'client': ('127.0.0.1', 0),
+        'server': ('testserver', 80),
+    }
+    sent = False
+
+    async def receive():
+        nonlocal sent
+        if sent:
+            await asyncio.sleep(3600)
+        sent = True
+        return {'type': 'http.request', 'body': b'', 'more_body': False}
+
+    status = None
+
+    async def send(message):
+        nonlocal status
+        if message['type'] == 'http.response.start':
+            status = message['status']
+
+    await application(scope, receive, send)
+    if status != 200:
+        raise RuntimeError(f'{path}?{query} returned {status}')
+
+
+async def load(application, path, query, total, concurrency):
+    semaphore = asyncio.Semaphore(concurrency)
+    latencies = []
+
+    async def one():
+        async with semaphore:
+            start = time.perf_counter()
+            await request(application, path, query)
+            latencies.append((time.perf_counter() - start) * 1000)
+
+    start = time.perf_counter()
+    await asyncio.gather(*(one() for _ in range(total)))
+    return total / (time.perf_counter() - start), sorted(latencies)
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument('--rows', type=int, default=2000)
+    parser.add_argument('--requests', type=int, default=500)
+    parser.add_argument('--concurrency', type=int, default=50)
+    args = parser.parse_args()
+
+    connection = setup_django()
+    try:
+        from django.core.asgi import get_asgi_application
+        from lazydog_api.metrics import percentile
+
+        seed(args.rows)
+        application = get_asgi_application()
+        print(f'{args.requests} requests, concurrency {args.concurrency}, '
+              f'{connection.vendor}')
+        print(f'{"endpoint":<18}{"req/s":>10}{"p50 ms":>10}{"p99 ms":>10}')
+        for label, path, query in ENDPOINTS:
+            asyncio.run(load(application, path, query, 10, 10))  # warm up
+            rps, latencies = asyncio.run(load(
+                application, path, query, args.requests, args.concurrency
+            ))
+            print(f'{label:<18}{rps:>10.1f}'
+                  f'{percentile(latencies, 50):>10.1f}'
+                  f'{percentile(latencies, 99):>10.1f}')
+    finally:
+        teardown_django(connection)
+
+
+if __name__ == '__main__':
+    main()
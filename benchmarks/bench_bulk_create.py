@@ -0,0 +1,66 @@
+"""
+Time the resource bulk create endpoint against one POST per item.
+
+    python -m benchmarks.bench_bulk_create --items 1000
+
+Each run creates a fresh set of resources with two tags each; the
+per-item baseline goes through the regular list endpoint.
+"""
+import argparse
+import time
+
+from benchmarks._bootstrap import setup_django, teardown_django
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument('--items', type=int, default=1000)
+    args = parser.parse_args()
+
+    connection = setup_django()
+    try:
+        from django.contrib.auth.models import User
+        from django.urls import reverse
+        from rest_framework.test import APIClient
+        from category.models import Category
+        from tag.models import Tag
+
+        user = User.objects.create_user(username='bench', password='bench')
+        category = Category.objects.create(name='bench')
+        tags = [Tag.objects.create(name=f'bench-{i}').pk for i in range(2)]
+        client = APIClient()
+        client.force_authenticate(user)
+
+        def payload(prefix):
+            return [
+                {
+                    'title': f'{prefix} {i}',
+                    'description': 'Benchmark resource description',
+                    'category': category.pk,
+                    'tags': tags,
+                    'url': f'https://example.com/{prefix}/{i}',
+                }
+                for i in range(args.items)
+            ]
+
+        start = time.perf_counter()
+        response = client.post(
+            reverse('resourceitem-bulk'), payload('bulk'), format='json'
+        )
+        bulk_seconds = time.perf_counter() - start
+        assert len(response.data['created']) == args.items, response.data
+
+        start = time.perf_counter()
+        for item in payload('single'):
+            client.post(reverse('resourceitem-list'), item, format='json')
+        single_seconds = time.perf_counter() - start
+
+        print(f'{args.items} items')
+        print(f'  bulk endpoint:  {bulk_seconds:8.3f} s')
+        print(f'  one POST each:  {single_seconds:8.3f} s')
+    finally:
+        teardown_django(connection)
+
+
+if __name__ == '__main__':
+    main()
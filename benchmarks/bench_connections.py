@@ -0,0 +1,76 @@
+"""
+Measure per-request connection setup with and without persistent
+connections.
+
+    DATABASE_URL=postgres://... python -m benchmarks.bench_connections
+
+Simulates request cycles the way Django's handler runs them
+(request_started, one query, request_finished) under three settings:
+a new connection per request (CONN_MAX_AGE=0), persistent connections,
+and persistent connections with health checks. Reports the median cost
+of a request and how many connections were opened. Only meaningful
+against PostgreSQL: the SQLite test database lives in memory and is
+never closed.
+"""
+import argparse
+import statistics
+import time
+
+from benchmarks._bootstrap import setup_django, teardown_django
+
+MODES = [
+    ('new connection per request', 0, False),
+    ('persistent (CONN_MAX_AGE=60)', 60, False),
+    ('persistent + health checks', 60, True),
+]
+
+
+def run(connection, requests, max_age, health_checks):
+    from django.core.signals import request_finished, request_started
+    from django.db.backends.signals import connection_created
+    from tag.models import Tag
+
+    opened = []
+
+    def count(sender, connection, **kwargs):
+        opened.append(connection.alias)
+
+    connection.close()
+    connection.settings_dict['CONN_MAX_AGE'] = max_age
+    connection.settings_dict['CONN_HEALTH_CHECKS'] = health_checks
+    connection_created.connect(count)
+    samples = []
+    try:
+        for _ in range(requests):
+            start = time.perf_counter()
+            request_started.send(sender=None)
+            Tag.objects.exists()
+            request_finished.send(sender=None)
+            samples.append((time.perf_counter() - start) * 1000)
+    finally:
+        connection_created.disconnect(count)
+    return statistics.median(samples), len(opened)
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument('--requests', type=int, default=500)
+    args = parser.parse_args()
+
+    connection = setup_django()
+    try:
+        if connection.vendor == 'sqlite':
+            print('Note: SQLite in-memory test database, connections are '
+                  'never closed; set DATABASE_URL for PostgreSQL.')
+        print(f'{"mode":<32}{"median ms":>12}{"connections":>14}')
+        for label, max_age, health_checks in MODES:
+            median, opened = run(
+                connection, args.requests, max_age, health_checks
+            )
+            print(f'{label:<32}{median:>12.3f}{opened:>14}')
+    finally:
+        teardown_django(connection)
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,102 @@
+"""
+Compare OFFSET paging with keyset paging on the resource list endpoint.
+
+    python -m benchmarks.bench_pagination --rows 20000 --page-size 50
+
+For each depth the benchmark requests the same page through
+LimitOffsetPagination and through KeysetCursorPagination and prints the
+median response time. OFFSET cost grows with the depth; keyset cost
+stays flat.
+"""
+import argparse
+from urllib.parse import parse_qs, urlparse
+
+from benchmarks._bootstrap import setup_django, teardown_django, timeit
+
+
+def seed(rows):
+    from django.contrib.auth.models import User
+    from category.models import Category
+    from resource_item.canonical import url_hash
+    from resource_item.models import ResourceItem
+
+    user = User.objects.create_user(username='bench', password='bench')
+    category = Category.objects.create(name='bench')
+    ResourceItem.objects.bulk_create(
+        [
+            ResourceItem(
+                title=f'Resource {i}',
+                description='Benchmark resource description',
+                user=user,
+                category=category,
+                url=f'https://example.com/bench/{i}',
+                url_hash=url_hash(f'https://example.com/bench/{i}'),
+            )
+            for i in range(rows)
+        ],
+        batch_size=1000,
+    )
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument('--rows', type=int, default=20000)
+    parser.add_argument('--page-size', type=int, default=50)
+    parser.add_argument('--repeat', type=int, default=20)
+    args = parser.parse_args()
+
+    connection = setup_django()
+    try:
+        from rest_framework.pagination import Cursor, LimitOffsetPagination
+        from rest_framework.test import APIRequestFactory
+        from lazydog_api.pagination import KeysetCursorPagination
+        from resource_item.models import ResourceItem
+        from resource_item.views import ResourceItemViewSet
+
+        seed(args.rows)
+        factory = APIRequestFactory()
+        offset_view = ResourceItemViewSet.as_view(
+            {'get': 'list'}, pagination_class=LimitOffsetPagination
+        )
+        keyset_view = ResourceItemViewSet.as_view({'get': 'list'})
+
+        def cursor_for(instance):
+            paginator = KeysetCursorPagination()
+            paginator.base_url = 'http://testserver/'
+            position = paginator._get_position_from_instance(
+                instance, paginator.ordering
+            )
+            link = paginator.encode_cursor(
+                Cursor(offset=0, reverse=False, position=position)
+            )
+            return parse_qs(urlparse(link).query)['cursor'][0]
+
+        print(f'{"depth":>8} {"offset ms":>10} {"keyset ms":>10}')
+        depths = [0, args.rows // 10, args.rows // 2, args.rows - args.page_size]
+        for depth in depths:
+            offset_request = factory.get(
+                '/', {'limit': args.page_size, 'offset': depth}
+            )
+
+            # Build the cursor a client would hold after reading `depth` rows.
+            params = {'page_size': args.page_size}
+            if depth:
+                boundary = ResourceItem.objects.order_by(
+                    '-created_at', '-id'
+                )[depth - 1]
+                params['cursor'] = cursor_for(boundary)
+            keyset_request = factory.get('/', params)
+
+            offset_ms = timeit(
+                lambda: offset_view(offset_request).render(), args.repeat
+            )
+            keyset_ms = timeit(
+                lambda: keyset_view(keyset_request).render(), args.repeat
+            )
+            print(f'{depth:>8} {offset_ms:>10.2f} {keyset_ms:>10.2f}')
+    finally:
+        teardown_django(connection)
+
+
+if __name__ == '__main__':
+    main()
@@ -1,17 +1,23 @@
 from django.contrib import admin
+from lazydog_api.admin import LargeTableAdminMixin
 from .models import Bookmark
 
 @admin.register(Bookmark)
-class BookmarkAdmin(admin.ModelAdmin):
+class BookmarkAdmin(LargeTableAdminMixin, admin.ModelAdmin):
     """
     Admin interface customization for the Bookmark model.
 
     This class defines the display and interaction options for bookmarks
     in the Django admin interface, including list display fields, filters,
     search capabilities, date hierarchy, and default ordering.
+
+    Users and resources are joined into the changelist query and picked
+    by ID in the change form, since both tables are large.
     """
     list_display = ('user', 'resource', 'created_at')
+    list_select_related = ('user', 'resource')
     list_filter = ('created_at',)
     search_fields = ('user__username', 'resource__title')
     date_hierarchy = 'created_at'
-    ordering = ('-created_at',)
\ No newline at end of file
+    ordering = ('-created_at',)
+    raw_id_fields = ('user', 'resource')
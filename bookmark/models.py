@@ -9,21 +9,26 @@ class Bookmark(models.Model):
     Ensures each user can only bookmark a resource once.
     """
     user = models.ForeignKey(
-        User, on_delete=models.CASCADE, related_name='bookmarks')
+        User, on_delete=models.CASCADE, related_name='bookmarks',
+        db_index=False)
     resource = models.ForeignKey(
         ResourceItem, on_delete=models.CASCADE,
         related_name='bookmarks'
     )
-    created_at = models.DateTimeField(auto_now_add=True)
+    # Indexed for the admin's date hierarchy and newest-first ordering.
+    created_at = models.DateTimeField(auto_now_add=True, db_index=True)
 
     class Meta:
         unique_together = ('user', 'resource')  # Prevent duplicate bookmarks
         ordering = ['-created_at']
         verbose_name = 'Bookmark'
+        # The unique constraint already indexes (user, resource); the list
+        # is always filtered by user and sorted newest first.
         indexes = [
             models.Index(
-                fields=['user', 'resource']
-            ),  # Optimize lookup
+                fields=['user', '-created_at'],
+                name='bookmark_user_created_idx',
+            ),
         ]
 
     def __str__(self):
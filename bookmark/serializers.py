@@ -1,13 +1,67 @@
+from functools import cached_property
+
+from django.db import IntegrityError, transaction
 from rest_framework import serializers
 from .models import Bookmark
+from category.serializers import CategorySerializer
+from resource_item.models import ResourceItem
+from resource_item.serializers import (
+    USER_STATE_FIELDS, ResourceItemSerializer,
+)
+from tag.serializers import TagSerializer
+from lazydog_api.serializers import (
+    SparseFieldsetSerializerMixin, TimedSerializerMixin,
+)
+
+
+class ExpandedResourceSerializer(ResourceItemSerializer):
+    """
+    Read-only representation of a bookmarked resource with its category
+    and tags inlined. Expects `category` to be selected and `tags` to be
+    prefetched on the instance.
+    """
+    category = CategorySerializer(read_only=True)
+    tags = TagSerializer(many=True, read_only=True)
+
+    class Meta(ResourceItemSerializer.Meta):
+        fields = [
+            name for name in ResourceItemSerializer.Meta.fields
+            if name not in USER_STATE_FIELDS
+        ]
+
+
+class ExpandableResourceField(serializers.PrimaryKeyRelatedField):
+    """
+    Accepts a resource PK on input. On output it renders the PK, or the
+    full resource when "resource" is in the `expand` set of the serializer
+    context (see BookmarkViewSet.get_expand).
+    """
+
+    @property
+    def expanded(self):
+        return 'resource' in self.context.get('expand', ())
+
+    @cached_property
+    def expanded_serializer(self):
+        return ExpandedResourceSerializer(context=self.context)
 
+    def use_pk_only_optimization(self):
+        return not self.expanded
 
-class BookmarkSerializer(serializers.ModelSerializer):
+    def to_representation(self, value):
+        if self.expanded:
+            return self.expanded_serializer.to_representation(value)
+        return super().to_representation(value)
+
+
+class BookmarkSerializer(TimedSerializerMixin, SparseFieldsetSerializerMixin,
+                         serializers.ModelSerializer):
     """
     Serializers for the Bookmark model.
     Ensures that user is set from the request and fields are validated.
     The user is not allowed to bookmark the same resource item multiple times.
     """
+    resource = ExpandableResourceField(queryset=ResourceItem.objects.all())
 
     class Meta:
         model = Bookmark
@@ -15,20 +69,19 @@ class BookmarkSerializer(serializers.ModelSerializer):
         read_only_fields = ['user', 'created_at']
         # Prevent mass assignment of user
 
-    def validate(self, data):
-        user = self.context['request'].user
-        resource = data.get('resource')
-
-        if Bookmark.objects.filter(user=user, resource=resource).exists():
-            raise serializers.ValidationError(
-                "You have already bookmarked this resource."
-            )
-
-        return data
-
     def create(self, validated_data):
         """
         Assign the currently authenticated user automatically.
+
+        Duplicates are caught by the unique (user, resource) constraint
+        rather than a lookup beforehand, which two concurrent requests
+        could both pass.
         """
         validated_data['user'] = self.context['request'].user
-        return super().create(validated_data)
+        try:
+            with transaction.atomic():
+                return super().create(validated_data)
+        except IntegrityError:
+            raise serializers.ValidationError(
+                "You have already bookmarked this resource."
+            )
@@ -75,7 +75,8 @@ class BookmarkSerializerTest(TestCase):
 
     def test_duplicate_bookmark_rejected(self):
         """
-        Serializer should reject duplicate bookmarks
+        Serializer should reject duplicate bookmarks when saving; the
+        unique constraint decides, not a lookup during validation
         """
         request = self.factory.post("/")
         request.user = self.testuser1
@@ -83,9 +84,16 @@ class BookmarkSerializerTest(TestCase):
             data={"resource": self.resource1.id},  # type: ignore[attr-defined]
             context={"request": request}
         )
+        self.assertTrue(serializer.is_valid())
         with self.assertRaises(ValidationError) as ctx:
-            serializer.is_valid(raise_exception=True)
+            serializer.save()
         self.assertIn("already bookmarked", str(ctx.exception))
+        self.assertEqual(
+            Bookmark.objects.filter(
+                user=self.testuser1, resource=self.resource1
+            ).count(),
+            1,
+        )
 
     def test_missing_resource_field_should_fail(self):
         """
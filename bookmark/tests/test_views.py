@@ -6,15 +6,24 @@ Covers:
 - Rejection of unauthenticated actions
 - Creation and deletion of bookmarks through API
 - Permission handling (only owner can delete)
+- ?expand=resource inlining at a constant query count
+- contains/ membership lookup in a single query
+- Idempotent PUT / DELETE resource/<id>/ toggle
+- PUT resource/<id>/ on a resource deleted mid-request answers 404
 """
 
-from django.test import TestCase
+from unittest import mock
+
+from django.db.models.query import QuerySet
+from django.test import TestCase, TransactionTestCase
 from django.urls import reverse
 from rest_framework.test import APIClient
 from rest_framework import status
 from django.contrib.auth.models import User
 from resource_item.models import ResourceItem
 from bookmark.models import Bookmark
+from category.models import Category
+from tag.models import Tag
 
 
 # SETUP
@@ -175,3 +184,174 @@ class BookmarkViewTest(TestCase):
         self.assertTrue(
             Bookmark.objects.filter(id=self.bookmark.id).exists()  # type: ignore[attr-defined]
         )
+
+
+class BookmarkExpandTest(TestCase):
+    @classmethod
+    def setUpTestData(cls):
+        cls.user = User.objects.create_user(
+            username="expander", password="testpassword"
+        )
+        cls.category = Category.objects.create(name="Docs")
+        cls.tags = [Tag.objects.create(name=f"expand-{n}") for n in range(2)]
+        cls.list_url = reverse("bookmark-list")
+
+    def setUp(self):
+        self.client = APIClient()
+        self.client.force_authenticate(self.user)
+
+    def create_bookmarks(self, count):
+        start = ResourceItem.objects.count()
+        for n in range(start, start + count):
+            resource = ResourceItem.objects.create(
+                title=f"Expanded {n}",
+                user=self.user,
+                category=self.category,
+                url=f"https://example.com/expand-{n}",
+            )
+            resource.tags.set(self.tags)
+            Bookmark.objects.create(user=self.user, resource=resource)
+
+    def test_resource_is_a_pk_by_default(self):
+        self.create_bookmarks(1)
+        response = self.client.get(self.list_url)
+        self.assertIsInstance(response.data[0]["resource"], int)
+
+    def test_expand_resource_inlines_category_and_tags(self):
+        self.create_bookmarks(1)
+        response = self.client.get(self.list_url, {"expand": "resource"})
+        resource = response.data[0]["resource"]
+        self.assertEqual(resource["title"], "Expanded 0")
+        self.assertEqual(resource["category"]["name"], "Docs")
+        self.assertEqual(
+            sorted(tag["name"] for tag in resource["tags"]),
+            ["expand-0", "expand-1"],
+        )
+
+    def test_expand_resource_query_count_is_constant(self):
+        """
+        Bookmarks, resources and categories come from one joined query and
+        the tags from one prefetch, whatever the number of bookmarks.
+        """
+        self.create_bookmarks(2)
+        with self.assertNumQueries(2):
+            self.client.get(self.list_url, {"expand": "resource"})
+        self.create_bookmarks(8)
+        with self.assertNumQueries(2):
+            self.client.get(self.list_url, {"expand": "resource"})
+
+    def test_create_still_accepts_a_resource_pk(self):
+        resource = ResourceItem.objects.create(
+            title="New", user=self.user, url="https://example.com/new"
+        )
+        response = self.client.post(
+            f"{self.list_url}?expand=resource", {"resource": resource.pk}
+        )
+        self.assertEqual(response.status_code, status.HTTP_201_CREATED)
+        self.assertEqual(response.data["resource"]["id"], resource.pk)
+
+
+class BookmarkToggleTest(TestCase):
+    @classmethod
+    def setUpTestData(cls):
+        cls.user = User.objects.create_user(
+            username="toggler", password="testpassword"
+        )
+        cls.resources = [
+            ResourceItem.objects.create(
+                title=f"Toggle {n}",
+                user=cls.user,
+                url=f"https://example.com/toggle-{n}",
+            )
+            for n in range(3)
+        ]
+        Bookmark.objects.create(user=cls.user, resource=cls.resources[0])
+        Bookmark.objects.create(user=cls.user, resource=cls.resources[2])
+        cls.contains_url = reverse("bookmark-contains")
+
+    def setUp(self):
+        self.client = APIClient()
+        self.client.force_authenticate(self.user)
+
+    def resource_url(self, resource_id):
+        return reverse("bookmark-resource", args=[resource_id])
+
+    def test_contains_returns_bookmarked_subset_in_one_query(self):
+        ids = ",".join(str(resource.pk) for resource in self.resources)
+        with self.assertNumQueries(1):
+            response = self.client.get(
+                self.contains_url, {"resources": f"{ids},9999"}
+            )
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertEqual(
+            response.data["bookmarked"],
+            [self.resources[0].pk, self.resources[2].pk],
+        )
+
+    def test_contains_ignores_other_users_bookmarks(self):
+        other = User.objects.create_user(username="other", password="pw")
+        self.client.force_authenticate(other)
+        response = self.client.get(
+            self.contains_url, {"resources": str(self.resources[0].pk)}
+        )
+        self.assertEqual(response.data["bookmarked"], [])
+
+    def test_contains_rejects_invalid_ids(self):
+        response = self.client.get(self.contains_url, {"resources": "1,x"})
+        self.assertEqual(response.status_code, status.HTTP_400_BAD_REQUEST)
+
+    def test_contains_requires_authentication(self):
+        self.client.force_authenticate(None)
+        response = self.client.get(self.contains_url, {"resources": "1"})
+        self.assertEqual(response.status_code, status.HTTP_403_FORBIDDEN)
+
+    def test_put_is_idempotent(self):
+        url = self.resource_url(self.resources[1].pk)
+        for _ in range(2):
+            response = self.client.put(url)
+            self.assertEqual(response.status_code, status.HTTP_200_OK)
+            self.assertTrue(response.data["bookmarked"])
+        self.assertEqual(
+            Bookmark.objects.filter(
+                user=self.user, resource=self.resources[1]
+            ).count(),
+            1,
+        )
+
+    def test_put_existing_bookmark_does_not_fail(self):
+        response = self.client.put(self.resource_url(self.resources[0].pk))
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+
+    def test_put_unknown_resource_is_404(self):
+        response = self.client.put(self.resource_url(9999))
+        self.assertEqual(response.status_code, status.HTTP_404_NOT_FOUND)
+
+    def test_delete_is_idempotent(self):
+        url = self.resource_url(self.resources[0].pk)
+        for _ in range(2):
+            response = self.client.delete(url)
+            self.assertEqual(
+                response.status_code, status.HTTP_204_NO_CONTENT
+            )
+        self.assertFalse(
+            Bookmark.objects.filter(
+                user=self.user, resource=self.resources[0]
+            ).exists()
+        )
+
+
+class BookmarkToggleRaceTest(TransactionTestCase):
+    # Foreign keys are checked when the transaction commits, which needs
+    # real transactions rather than TestCase's wrapping one.
+    def test_put_resource_deleted_after_the_check_is_404(self):
+        user = User.objects.create_user(username="racer", password="pw")
+        client = APIClient()
+        client.force_authenticate(user)
+        # The existence check passes, then the resource is gone by the
+        # time the bookmark is inserted.
+        with mock.patch.object(QuerySet, "exists", return_value=True):
+            response = client.put(
+                reverse("bookmark-resource", args=[9999])
+            )
+        self.assertEqual(response.status_code, status.HTTP_404_NOT_FOUND)
+        self.assertFalse(Bookmark.objects.exists())
@@ -1,15 +1,32 @@
 from django.urls import path, include
+from rest_framework.permissions import IsAuthenticated
 from rest_framework.routers import DefaultRouter
 from .views import BookmarkViewSet
 
 """
 This file defines the available API endpoints for the Bookmark model.
-Provides standard CRUD operations through DRF's DefaultRouter.
+Provides standard CRUD operations through DRF's DefaultRouter, plus the
+membership lookup and the idempotent per-resource toggle.
 """
 
 router = DefaultRouter()
 router.register(r'bookmarks', BookmarkViewSet, basename='bookmark')
 
 urlpatterns = [
+    path(
+        'contains/',
+        BookmarkViewSet.as_view(
+            {'get': 'contains'}, permission_classes=[IsAuthenticated]
+        ),
+        name='bookmark-contains',
+    ),
+    path(
+        'resource/<int:resource_id>/',
+        BookmarkViewSet.as_view(
+            {'put': 'put_resource', 'delete': 'delete_resource'},
+            permission_classes=[IsAuthenticated],
+        ),
+        name='bookmark-resource',
+    ),
     path('', include(router.urls)),
-]
\ No newline at end of file
+]
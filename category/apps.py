@@ -4,3 +4,7 @@ from django.apps import AppConfig
 class CategoryConfig(AppConfig):
     default_auto_field = "django.db.models.BigAutoField"
     name = "category"
+
+    def ready(self):
+        # Register the signal handlers that invalidate the list cache.
+        from . import signals  # noqa: F401
@@ -1,8 +1,12 @@
 from rest_framework import serializers
 from .models import Category
+from lazydog_api.serializers import (
+    SparseFieldsetSerializerMixin, TimedSerializerMixin,
+)
 
 
-class CategorySerializer(serializers.ModelSerializer):
+class CategorySerializer(TimedSerializerMixin, SparseFieldsetSerializerMixin,
+                         serializers.ModelSerializer):
     """
     Serializer for the Category model.
     """
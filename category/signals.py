@@ -0,0 +1,20 @@
+from functools import partial
+
+from django.db import transaction
+from django.db.models.signals import post_delete, post_save
+from django.dispatch import receiver
+
+from lazydog_api.cache import bump_generation
+from .models import Category
+
+
+@receiver(post_save, sender=Category)
+@receiver(post_delete, sender=Category)
+def invalidate_category_list_cache(sender, **kwargs):
+    """
+    Drop every cached category list once a category changes.
+
+    The bump waits for the commit: a request between the bump and the
+    commit would otherwise cache the old rows under the new generation.
+    """
+    transaction.on_commit(partial(bump_generation, 'category'))
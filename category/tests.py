@@ -1,3 +1,119 @@
-from django.test import TestCase
+from io import StringIO
+from rest_framework.test import APITestCase
+from django.core.cache import cache
+from django.core.management import call_command
+from django.urls import reverse
+from rest_framework import status
+from django.utils.http import http_date
+from category.models import Category
+from lazydog_api.cache import get_cache_stats, reset_cache_stats
 
-# Create your tests here.
+
+class CategoryConditionalGetTestCase(APITestCase):
+    @classmethod
+    def setUpTestData(cls):
+        cls.category = Category.objects.create(
+            name="music", description="Music resources"
+        )
+        cls.url = reverse("category-list")
+        cls.url_detail = reverse("category-detail", args=[cls.category.pk])
+
+    def setUp(self):
+        cache.clear()
+
+    def test_list_has_validators(self):
+        response = self.client.get(self.url)
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertIn("ETag", response)
+        self.assertEqual(
+            response["Last-Modified"],
+            http_date(int(self.category.updated_at.timestamp()))
+        )
+
+    def test_list_not_modified(self):
+        etag = self.client.get(self.url)["ETag"]
+        response = self.client.get(self.url, HTTP_IF_NONE_MATCH=etag)
+        self.assertEqual(response.status_code, status.HTTP_304_NOT_MODIFIED)
+        self.assertEqual(response["ETag"], etag)
+
+    def test_list_modified_after_delete(self):
+        Category.objects.create(name="books", description="Book resources")
+        etag = self.client.get(self.url)["ETag"]
+        with self.captureOnCommitCallbacks(execute=True):
+            Category.objects.filter(name="books").delete()
+        response = self.client.get(self.url, HTTP_IF_NONE_MATCH=etag)
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+
+    def test_detail_if_modified_since(self):
+        last_modified = self.client.get(self.url_detail)["Last-Modified"]
+        response = self.client.get(
+            self.url_detail, HTTP_IF_MODIFIED_SINCE=last_modified
+        )
+        self.assertEqual(response.status_code, status.HTTP_304_NOT_MODIFIED)
+
+
+class CategoryListCacheTestCase(APITestCase):
+    @classmethod
+    def setUpTestData(cls):
+        cls.category = Category.objects.create(
+            name="music", description="Music resources"
+        )
+        cls.url = reverse("category-list")
+
+    def setUp(self):
+        cache.clear()
+
+    def test_cache_keyed_by_query_params(self):
+        self.client.get(self.url, {"ordering": "name"})
+        self.assertEqual(
+            self.client.get(self.url, {"ordering": "name"})["X-Cache"], "HIT"
+        )
+        self.assertEqual(
+            self.client.get(self.url, {"ordering": "-name"})["X-Cache"],
+            "MISS"
+        )
+
+    def test_invalidated_on_save_and_delete(self):
+        self.client.get(self.url)
+        with self.captureOnCommitCallbacks(execute=True):
+            self.category.description = "Changed"
+            self.category.save()
+        response = self.client.get(self.url)
+        self.assertEqual(response["X-Cache"], "MISS")
+        self.assertEqual(response.json()[0]["description"], "Changed")
+
+        with self.captureOnCommitCallbacks(execute=True):
+            self.category.delete()
+        response = self.client.get(self.url)
+        self.assertEqual(response["X-Cache"], "MISS")
+        self.assertEqual(response.json(), [])
+
+    def test_invalidated_only_after_commit(self):
+        self.client.get(self.url)
+        with self.captureOnCommitCallbacks() as callbacks:
+            Category.objects.create(name="books")
+            self.assertEqual(self.client.get(self.url)["X-Cache"], "HIT")
+        for callback in callbacks:
+            callback()
+        self.assertEqual(self.client.get(self.url)["X-Cache"], "MISS")
+
+    def test_cached_response_supports_etag(self):
+        etag = self.client.get(self.url)["ETag"]
+        with self.assertNumQueries(0):
+            response = self.client.get(self.url, HTTP_IF_NONE_MATCH=etag)
+        self.assertEqual(response.status_code, status.HTTP_304_NOT_MODIFIED)
+
+    def test_browsable_api_not_cached(self):
+        self.client.get(self.url, HTTP_ACCEPT="text/html")
+        response = self.client.get(self.url, HTTP_ACCEPT="text/html")
+        self.assertNotIn("X-Cache", response)
+
+    def test_hit_and_miss_counters(self):
+        reset_cache_stats()
+        self.client.get(self.url)
+        self.client.get(self.url)
+        self.client.get(self.url)
+        self.assertEqual(get_cache_stats(), {"hits": 2, "misses": 1})
+        out = StringIO()
+        call_command("response_cache_stats", stdout=out)
+        self.assertIn("hits: 2", out.getvalue())
@@ -1,14 +1,20 @@
 from rest_framework import viewsets, filters
 from .models import Category
 from .serializers import CategorySerializer
+from lazydog_api.cache import CachedListMixin
+from lazydog_api.mixins import ConditionalGetMixin, SparseFieldsetMixin
 from lazydog_api.permissions import AdminOnly
 
 
-class CategoryViewSet(viewsets.ModelViewSet):
+class CategoryViewSet(CachedListMixin, SparseFieldsetMixin,
+                      ConditionalGetMixin, viewsets.ModelViewSet):
     """
     This viewset allows only admin users to create, update,
     and delete categories.
-    All users can list and retrieve categories.
+    All users can list and retrieve categories; both responses support
+    conditional requests (ETag / Last-Modified).
+    JSON list responses are served from the versioned response cache,
+    invalidated by category/signals.py.
     """
     queryset = Category.objects.all()
     serializer_class = CategorySerializer
@@ -16,3 +22,4 @@ class CategoryViewSet(viewsets.ModelViewSet):
     filter_backends = [filters.OrderingFilter, filters.SearchFilter]
     ordering_fields = ['created_at', 'name']
     search_fields = ['name', 'description']
+    cache_namespace = 'category'
@@ -1,5 +1,20 @@
 from django.contrib import admin
+from django.utils.text import Truncator
+from lazydog_api.admin import LargeTableAdminMixin
 from .models import Comment
 
-# Register your models here.
-admin.site.register(Comment)
\ No newline at end of file
+
+@admin.register(Comment)
+class CommentAdmin(LargeTableAdminMixin, admin.ModelAdmin):
+    list_display = ('id', 'user', 'resource_item', 'excerpt', 'created_at')
+    list_select_related = ('user', 'resource_item')
+    search_fields = ('content',)
+    list_filter = ('created_at',)
+    # Newest first; the primary key avoids sorting the whole table.
+    ordering = ('-id',)
+    readonly_fields = ('created_at', 'updated_at')
+    raw_id_fields = ('user', 'resource_item')
+
+    @admin.display(description='content')
+    def excerpt(self, obj):
+        return Truncator(obj.content).chars(80)
@@ -4,3 +4,7 @@ from django.apps import AppConfig
 class CommentConfig(AppConfig):
     default_auto_field = 'django.db.models.BigAutoField'
     name = 'comment'
+
+    def ready(self):
+        # Register the signal handlers that maintain the comment counts.
+        from . import signals  # noqa: F401
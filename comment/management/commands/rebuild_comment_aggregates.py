@@ -0,0 +1,105 @@
+from django.core.management.base import BaseCommand, CommandError
+from django.db import transaction
+from django.db.models import Count, Max
+from django.utils import timezone
+
+from comment.models import Comment
+from resource_item.models import ResourceItem
+
+
+class Command(BaseCommand):
+    """
+    Recompute ResourceItem.comment_count / last_commented_at from the
+    Comment table.
+
+    Resource items are processed in chunks of --batch-size. Each chunk's
+    rows are locked with SELECT ... FOR UPDATE before its true values are
+    computed with one grouped aggregate query, so a comment written
+    meanwhile either is counted or applies its delta after the chunk's
+    correction, never lost. Drifted rows are reported and, unless --check
+    is given, corrected with one bulk_update per chunk.
+    """
+    help = "Rebuild the denormalized comment counts on resource items."
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            "--check",
+            action="store_true",
+            help="Only report drift; exit with an error if any is found.",
+        )
+        parser.add_argument(
+            "--batch-size",
+            type=int,
+            default=1000,
+            help="Number of resource items checked and written per batch.",
+        )
+
+    def handle(self, *args, **options):
+        drifted = 0
+        last_id = 0
+        while True:
+            ids = list(ResourceItem.objects.filter(
+                id__gt=last_id
+            ).order_by("id").values_list("id", flat=True)[
+                :options["batch_size"]
+            ])
+            if not ids:
+                break
+            last_id = ids[-1]
+            with transaction.atomic():
+                drifted += self.rebuild_chunk(ids, options["check"])
+
+        if options["check"]:
+            if drifted:
+                raise CommandError(
+                    f"{drifted} resource item(s) have drifted "
+                    "comment counts."
+                )
+            self.stdout.write(self.style.SUCCESS("No drift found."))
+            return
+
+        self.stdout.write(self.style.SUCCESS(
+            f"Rebuilt comment counts for {drifted} resource item(s)."
+        ))
+
+    def rebuild_chunk(self, ids, check):
+        """
+        Compare and, unless `check`, correct the resource items `ids`.
+        Must run inside a transaction. Returns the number of drifted rows.
+        """
+        items = ResourceItem.objects.filter(id__in=ids).only(
+            "id", "comment_count", "last_commented_at", "changed_at"
+        ).order_by("id")
+        if not check:
+            items = items.select_for_update()
+        items = list(items)
+
+        expected = {
+            row["resource_item"]: (row["count"], row["latest"])
+            for row in Comment.objects.filter(
+                resource_item__in=ids
+            ).order_by().values("resource_item").annotate(
+                count=Count("id"), latest=Max("created_at")
+            )
+        }
+
+        drifted = []
+        now = timezone.now()
+        for item in items:
+            count, latest = expected.get(item.pk, (0, None))
+            if (item.comment_count, item.last_commented_at) != (count, latest):
+                self.stdout.write(
+                    f"Resource {item.pk}: stored "
+                    f"{item.comment_count}/{item.last_commented_at}, "
+                    f"actual {count}/{latest}"
+                )
+                item.comment_count = count
+                item.last_commented_at = latest
+                item.changed_at = now
+                drifted.append(item)
+
+        if drifted and not check:
+            ResourceItem.objects.bulk_update(
+                drifted, ["comment_count", "last_commented_at", "changed_at"]
+            )
+        return len(drifted)
@@ -0,0 +1,65 @@
+# Generated by Django 5.1.9 on 2026-10-17 22:47
+
+import django.contrib.postgres.search
+from django.db import migrations
+
+# The trigger and GIN index only exist on PostgreSQL; on SQLite (dev and CI)
+# the column stays empty and search falls back to ILIKE.
+FORWARD_SQL = [
+    """
+    CREATE OR REPLACE FUNCTION comment_search_vector_update()
+    RETURNS trigger AS $$
+    BEGIN
+        NEW.search_vector :=
+            to_tsvector('pg_catalog.english', coalesce(NEW.content, ''));
+        RETURN NEW;
+    END
+    $$ LANGUAGE plpgsql;
+    """,
+    """
+    CREATE TRIGGER comment_search_vector_trigger
+    BEFORE INSERT OR UPDATE OF content
+    ON comment_comment
+    FOR EACH ROW EXECUTE FUNCTION comment_search_vector_update();
+    """,
+    # Fire the trigger once for the existing rows.
+    "UPDATE comment_comment SET content = content;",
+    """
+    CREATE INDEX comment_search_vector_gin
+    ON comment_comment USING GIN (search_vector);
+    """,
+]
+
+BACKWARD_SQL = [
+    "DROP INDEX IF EXISTS comment_search_vector_gin;",
+    "DROP TRIGGER IF EXISTS comment_search_vector_trigger "
+    "ON comment_comment;",
+    "DROP FUNCTION IF EXISTS comment_search_vector_update();",
+]
+
+
+def run_on_postgresql(statements):
+    def run(apps, schema_editor):
+        if schema_editor.connection.vendor != 'postgresql':
+            return
+        for statement in statements:
+            schema_editor.execute(statement)
+    return run
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('comment', '0001_initial'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='comment',
+            name='search_vector',
+            field=django.contrib.postgres.search.SearchVectorField(editable=False, null=True),
+        ),
+        migrations.RunPython(
+            run_on_postgresql(FORWARD_SQL), run_on_postgresql(BACKWARD_SQL)
+        ),
+    ]
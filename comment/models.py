@@ -1,15 +1,34 @@
 from django.contrib.auth.models import User
+from django.contrib.postgres.search import SearchVectorField
 from django.db import models
 from resource_item.models import ResourceItem
 
 
 class Comment(models.Model):
-    user = models.ForeignKey(User, on_delete=models.CASCADE)
+    user = models.ForeignKey(User, on_delete=models.CASCADE, db_index=False)
     resource_item = models.ForeignKey(
-        ResourceItem, on_delete=models.CASCADE, related_name='comments')
+        ResourceItem, on_delete=models.CASCADE, related_name='comments',
+        db_index=False)
     content = models.TextField()
     created_at = models.DateTimeField(auto_now_add=True)
     updated_at = models.DateTimeField(auto_now=True)
+    # Full-text search document over `content`, maintained by a database
+    # trigger on PostgreSQL and left empty on other backends.
+    search_vector = SearchVectorField(null=True, editable=False)
+
+    class Meta:
+        # One index per filterable column, in the list's default order.
+        # They also cover the plain foreign key lookups.
+        indexes = [
+            models.Index(
+                fields=['resource_item', '-created_at'],
+                name='comment_item_created_idx',
+            ),
+            models.Index(
+                fields=['user', '-created_at'],
+                name='comment_user_created_idx',
+            ),
+        ]
 
     def __str__(self):
         return self.content
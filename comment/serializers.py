@@ -1,8 +1,12 @@
 from rest_framework import serializers
 from .models import Comment
+from lazydog_api.serializers import (
+    SparseFieldsetSerializerMixin, TimedSerializerMixin,
+)
 
 
-class CommentSerializer(serializers.ModelSerializer):
+class CommentSerializer(TimedSerializerMixin, SparseFieldsetSerializerMixin,
+                        serializers.ModelSerializer):
     """
     Serializer for the Comment model.
     """
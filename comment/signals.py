@@ -0,0 +1,63 @@
+"""
+Keep ResourceItem.comment_count / last_commented_at in step with the
+Comment table.
+
+The handlers run for every write path that goes through the model layer:
+CommentSerializer, CommentViewSet, the admin (including bulk delete
+actions) and cascades from deleted users.
+"""
+from django.db.models import F, OuterRef, Subquery, Value
+from django.db.models.functions import Coalesce, Greatest
+from django.db.models.signals import post_delete, post_save, pre_save
+from django.dispatch import receiver
+
+from resource_item.models import ResourceItem
+from .models import Comment
+
+
+def latest_comment_time():
+    """
+    Subquery for the creation time of a resource's newest comment.
+    """
+    return Subquery(
+        Comment.objects.filter(
+            resource_item=OuterRef('pk')
+        ).order_by('-created_at').values('created_at')[:1]
+    )
+
+
+@receiver(pre_save, sender=Comment)
+def remember_previous_resource(sender, instance, **kwargs):
+    """
+    Record which resource an existing comment belonged to, so moving it
+    (possible through the admin) updates both resources.
+    """
+    if instance.pk is None or instance._state.adding:
+        instance._previous_resource_id = None
+    else:
+        instance._previous_resource_id = Comment.objects.filter(
+            pk=instance.pk
+        ).values_list('resource_item_id', flat=True).first()
+
+
+@receiver(post_save, sender=Comment)
+def add_comment_to_counts(sender, instance, created, **kwargs):
+    previous = getattr(instance, '_previous_resource_id', None)
+    if not created and previous in (None, instance.resource_item_id):
+        return
+    if previous is not None:
+        ResourceItem.apply_comment_delta(previous, -1, latest_comment_time())
+    commented_at = Value(instance.created_at)
+    ResourceItem.apply_comment_delta(
+        instance.resource_item_id,
+        1,
+        Greatest(Coalesce(F('last_commented_at'), commented_at),
+                 commented_at),
+    )
+
+
+@receiver(post_delete, sender=Comment)
+def remove_comment_from_counts(sender, instance, **kwargs):
+    ResourceItem.apply_comment_delta(
+        instance.resource_item_id, -1, latest_comment_time()
+    )
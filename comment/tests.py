@@ -1,3 +1,8 @@
+from datetime import timedelta
+from io import StringIO
+
+from django.core.management import call_command
+from django.core.management.base import CommandError
 from rest_framework.test import APITestCase
 from django.urls import reverse
 from rest_framework import status
@@ -180,3 +185,92 @@ class CommentAPITestCase(APITestCase):
         self.assertEqual(response.status_code, status.HTTP_200_OK)
         self.assertEqual(response.data[0]["content"], "Another comment")
         self.assertEqual(response.data[1]["content"], "Test Comment")
+
+
+class CommentAggregateTest(APITestCase):
+    """
+    ResourceItem.comment_count / last_commented_at follow comment writes,
+    and rebuild_comment_aggregates repairs drift.
+    """
+    @classmethod
+    def setUpTestData(cls):
+        cls.user = User.objects.create_user(
+            username="commenter", password="testpassword"
+        )
+        cls.resource1 = ResourceItem.objects.create(
+            title="Counted 1", user=cls.user, url="https://example.com/c-1"
+        )
+        cls.resource2 = ResourceItem.objects.create(
+            title="Counted 2", user=cls.user, url="https://example.com/c-2"
+        )
+
+    def assertCounts(self, resource, count, last_commented_at):
+        resource.refresh_from_db()
+        self.assertEqual(resource.comment_count, count)
+        self.assertEqual(resource.last_commented_at, last_commented_at)
+
+    def test_create_and_delete_through_api(self):
+        self.client.force_authenticate(self.user)
+        response = self.client.post(reverse("comment-list"), {
+            "content": "First", "resource_item": self.resource1.pk
+        })
+        first = Comment.objects.get(pk=response.data["id"])
+        second = Comment.objects.create(
+            user=self.user, resource_item=self.resource1, content="Second"
+        )
+        self.assertCounts(self.resource1, 2, second.created_at)
+
+        self.client.delete(reverse("comment-detail", args=[second.pk]))
+        self.assertCounts(self.resource1, 1, first.created_at)
+        first.delete()
+        self.assertCounts(self.resource1, 0, None)
+
+    def test_moving_comment_between_resources(self):
+        comment = Comment.objects.create(
+            user=self.user, resource_item=self.resource1, content="Move"
+        )
+        comment.resource_item = self.resource2
+        comment.save()
+        self.assertCounts(self.resource1, 0, None)
+        self.assertCounts(self.resource2, 1, comment.created_at)
+
+    def test_counts_are_serialized_and_orderable(self):
+        Comment.objects.create(
+            user=self.user, resource_item=self.resource2, content="Hi"
+        )
+        response = self.client.get(
+            reverse("resourceitem-list"), {"ordering": "-comment_count"}
+        )
+        self.assertEqual(response.data[0]["id"], self.resource2.pk)
+        self.assertEqual(response.data[0]["comment_count"], 1)
+        self.assertIsNotNone(response.data[0]["last_commented_at"])
+
+    def test_rebuild_command_fixes_drift(self):
+        comment = Comment.objects.create(
+            user=self.user, resource_item=self.resource1, content="Drift"
+        )
+        ResourceItem.objects.filter(pk=self.resource1.pk).update(
+            comment_count=7,
+            last_commented_at=comment.created_at - timedelta(days=1),
+        )
+        with self.assertRaises(CommandError):
+            call_command(
+                "rebuild_comment_aggregates", "--check", stdout=StringIO()
+            )
+        call_command("rebuild_comment_aggregates", stdout=StringIO())
+        self.assertCounts(self.resource1, 1, comment.created_at)
+        call_command(
+            "rebuild_comment_aggregates", "--check", stdout=StringIO()
+        )
+
+    def test_rebuild_command_works_in_chunks(self):
+        comment = Comment.objects.create(
+            user=self.user, resource_item=self.resource2, content="Chunk"
+        )
+        ResourceItem.objects.update(comment_count=3)
+        call_command(
+            "rebuild_comment_aggregates", "--batch-size", "1",
+            stdout=StringIO(),
+        )
+        self.assertCounts(self.resource1, 0, None)
+        self.assertCounts(self.resource2, 1, comment.created_at)
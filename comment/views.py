@@ -2,28 +2,49 @@ from django_filters.rest_framework import DjangoFilterBackend
 from rest_framework import viewsets, filters
 from .models import Comment
 from .serializers import CommentSerializer
+from lazydog_api.async_views import AsyncReadOnlyView
+from lazydog_api.filters import FullTextSearchFilter
+from lazydog_api.mixins import SparseFieldsetMixin
+from lazydog_api.pagination import EstimatedCountPagination
 from lazydog_api.permissions import IsOwnerOrReadOnly
 
 
-class CommentViewSet(viewsets.ModelViewSet):
+class CommentViewSet(SparseFieldsetMixin, viewsets.ModelViewSet):
     """
     API endpoint that allows comments to be viewed, created, edited,
     or deleted.
 
     Filtering:
     - Filter by resource_item and user
-    - Search by comment content
+    - Search by comment content and resource title (ranked full-text
+      search on PostgreSQL)
     - Order by created_at
+
+    Pagination:
+    - Opt-in page numbers with ?page= / ?page_size=; the total is
+      estimated or capped unless ?count=exact is given
     """
     serializer_class = CommentSerializer
-    queryset = Comment.objects.all()
+    # The search document is only used in WHERE clauses, never rendered.
+    queryset = Comment.objects.defer('search_vector')
     permission_classes = [IsOwnerOrReadOnly]
     filter_backends = [
         DjangoFilterBackend,
-        filters.SearchFilter,
-        filters.OrderingFilter
+        filters.OrderingFilter,
+        FullTextSearchFilter,
     ]
     filterset_fields = ['resource_item', 'user']
     search_fields = ['content', 'resource_item__title']
+    search_vector_fields = ['search_vector', 'resource_item__search_vector']
     ordering_fields = ['created_at']
     ordering = ['-created_at']
+    pagination_class = EstimatedCountPagination
+
+
+class AsyncCommentView(AsyncReadOnlyView):
+    """
+    Async read-only comment list and detail for the ASGI application.
+    """
+    queryset = Comment.objects.defer('search_vector')
+    serializer_class = CommentSerializer
+    filter_fields = ['resource_item', 'user']
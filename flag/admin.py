@@ -1,5 +1,16 @@
 from django.contrib import admin
+from lazydog_api.admin import LargeTableAdminMixin
 from .models import Flag
 
-# Register your models here.
-admin.site.register(Flag)
+
+@admin.register(Flag)
+class FlagAdmin(LargeTableAdminMixin, admin.ModelAdmin):
+    list_display = (
+        'flag_id', 'user', 'resource', 'comment', 'status', 'created_at'
+    )
+    list_select_related = ('user', 'resource', 'comment')
+    search_fields = ('reason',)
+    list_filter = ('status', 'created_at')
+    ordering = ('-created_at',)
+    readonly_fields = ('created_at', 'updated_at', 'reviewed_at')
+    raw_id_fields = ('user', 'resource', 'comment', 'reviewed_by')
@@ -0,0 +1,21 @@
+# Generated by Django 5.1.9 on 2026-10-17 23:04
+
+from django.conf import settings
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('comment', '0002_comment_search_vector'),
+        ('flag', '0001_initial'),
+        ('resource_item', '0006_resourceitem_search_vector'),
+        migrations.swappable_dependency(settings.AUTH_USER_MODEL),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name='flag',
+            index=models.Index(condition=models.Q(('status', 'Pending')), fields=['created_at', 'flag_id'], name='flag_pending_queue_idx'),
+        ),
+    ]
@@ -0,0 +1,49 @@
+# Generated by Django 5.1.9 on 2026-10-17 23:19
+
+import django.db.models.deletion
+from django.conf import settings
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('comment', '0003_alter_comment_resource_item_alter_comment_user_and_more'),
+        ('flag', '0002_flag_flag_pending_queue_idx'),
+        ('resource_item', '0009_resourceitem_comment_aggregates'),
+        migrations.swappable_dependency(settings.AUTH_USER_MODEL),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name='flag',
+            index=models.Index(fields=['status', '-created_at'], name='flag_status_created_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='flag',
+            index=models.Index(fields=['user', '-created_at'], name='flag_user_created_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='flag',
+            index=models.Index(fields=['resource', '-created_at'], name='flag_resource_created_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='flag',
+            index=models.Index(fields=['comment', '-created_at'], name='flag_comment_created_idx'),
+        ),
+        migrations.AlterField(
+            model_name='flag',
+            name='comment',
+            field=models.ForeignKey(blank=True, db_index=False, null=True, on_delete=django.db.models.deletion.CASCADE, to='comment.comment'),
+        ),
+        migrations.AlterField(
+            model_name='flag',
+            name='resource',
+            field=models.ForeignKey(blank=True, db_index=False, null=True, on_delete=django.db.models.deletion.CASCADE, to='resource_item.resourceitem'),
+        ),
+        migrations.AlterField(
+            model_name='flag',
+            name='user',
+            field=models.ForeignKey(db_index=False, on_delete=django.db.models.deletion.CASCADE, to=settings.AUTH_USER_MODEL),
+        ),
+    ]
@@ -14,9 +14,13 @@ class Flag(models.Model):
     ]
 
     flag_id = models.AutoField(primary_key=True)
-    user = models.ForeignKey(User, on_delete=models.CASCADE)
-    resource = models.ForeignKey(ResourceItem, on_delete=models.CASCADE, null=True, blank=True)
-    comment = models.ForeignKey(Comment, on_delete=models.CASCADE, null=True, blank=True)
+    user = models.ForeignKey(User, on_delete=models.CASCADE, db_index=False)
+    resource = models.ForeignKey(
+        ResourceItem, on_delete=models.CASCADE, null=True, blank=True, db_index=False
+    )
+    comment = models.ForeignKey(
+        Comment, on_delete=models.CASCADE, null=True, blank=True, db_index=False
+    )
     reason = models.TextField()
     created_at = models.DateTimeField(auto_now_add=True)
     updated_at = models.DateTimeField(auto_now=True)
@@ -26,5 +30,32 @@ class Flag(models.Model):
     )
     reviewed_at = models.DateTimeField(null=True, blank=True)
 
+    class Meta:
+        indexes = [
+            # Moderation queue: only the (few) pending flags are indexed,
+            # in the order they are reviewed.
+            models.Index(
+                fields=["created_at", "flag_id"],
+                condition=models.Q(status="Pending"),
+                name="flag_pending_queue_idx",
+            ),
+            # One index per filterable column, in the list's default order.
+            # They also cover the plain foreign key lookups.
+            models.Index(
+                fields=["status", "-created_at"], name="flag_status_created_idx"
+            ),
+            models.Index(
+                fields=["user", "-created_at"], name="flag_user_created_idx"
+            ),
+            models.Index(
+                fields=["resource", "-created_at"],
+                name="flag_resource_created_idx",
+            ),
+            models.Index(
+                fields=["comment", "-created_at"],
+                name="flag_comment_created_idx",
+            ),
+        ]
+
     def __str__(self):
         return f"Flag {self.flag_id} - {self.status}"
\ No newline at end of file
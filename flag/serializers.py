@@ -1,7 +1,11 @@
 from rest_framework import serializers
 from .models import Flag
+from lazydog_api.serializers import (
+    SparseFieldsetSerializerMixin, TimedSerializerMixin,
+)
 
-class FlagSerializer(serializers.ModelSerializer):
+class FlagSerializer(TimedSerializerMixin, SparseFieldsetSerializerMixin,
+                     serializers.ModelSerializer):
     """
     Serializer for the Flag model.
     Handles validation and serialization of flag data.
@@ -66,3 +70,16 @@ class FlagSerializer(serializers.ModelSerializer):
         """
         validated_data['user'] = self.context['request'].user
         return super().create(validated_data)
+
+
+class FlagReviewSerializer(serializers.Serializer):
+    """
+    Input of the bulk review action: the pending flags to close and the
+    outcome to record on all of them.
+    """
+    flags = serializers.ListField(
+        child=serializers.IntegerField(min_value=1),
+        allow_empty=False,
+        max_length=1000,
+    )
+    status = serializers.ChoiceField(choices=["Reviewed", "Rejected"])
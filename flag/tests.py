@@ -1,3 +1,117 @@
-from django.test import TestCase
+"""
+Unit tests for the flag moderation endpoints.
 
-# Create your tests here.
+Covered cases:
+- queue/ lists only pending flags, oldest first, with keyset cursors
+- queue/ and review/ are restricted to staff
+- review/ closes many pending flags with a single UPDATE
+- review/ leaves flags that were already reviewed untouched
+"""
+
+from django.contrib.auth.models import User
+from django.urls import reverse
+from rest_framework import status
+from rest_framework.test import APITestCase
+
+from flag.models import Flag
+from resource_item.models import ResourceItem
+
+
+class FlagModerationTest(APITestCase):
+    @classmethod
+    def setUpTestData(cls):
+        cls.user = User.objects.create_user(username="flagger", password="pw")
+        cls.moderator = User.objects.create_user(
+            username="moderator", password="pw", is_staff=True
+        )
+        cls.resource = ResourceItem.objects.create(
+            title="Flagged",
+            user=cls.user,
+            url="https://example.com/flagged",
+        )
+        cls.pending = [
+            Flag.objects.create(
+                user=cls.user, resource=cls.resource, reason=f"Reason {n}"
+            )
+            for n in range(5)
+        ]
+        cls.closed = Flag.objects.create(
+            user=cls.user, resource=cls.resource, reason="Old",
+            status="Rejected",
+        )
+        cls.queue_url = reverse("flag-queue")
+        cls.review_url = reverse("flag-review")
+
+    def test_queue_requires_staff(self):
+        self.client.force_authenticate(self.user)
+        self.assertEqual(
+            self.client.get(self.queue_url).status_code,
+            status.HTTP_403_FORBIDDEN,
+        )
+        self.assertEqual(
+            self.client.post(
+                self.review_url, {"flags": [1], "status": "Reviewed"}
+            ).status_code,
+            status.HTTP_403_FORBIDDEN,
+        )
+
+    def test_queue_lists_pending_flags_oldest_first(self):
+        self.client.force_authenticate(self.moderator)
+        response = self.client.get(self.queue_url, {"page_size": 3})
+        self.assertEqual(
+            [flag["flag_id"] for flag in response.data["results"]],
+            [flag.flag_id for flag in self.pending[:3]],
+        )
+
+        response = self.client.get(response.data["next"])
+        self.assertEqual(
+            [flag["flag_id"] for flag in response.data["results"]],
+            [flag.flag_id for flag in self.pending[3:]],
+        )
+        self.assertIsNone(response.data["next"])
+
+    def test_review_updates_flags_in_one_query(self):
+        self.client.force_authenticate(self.moderator)
+        ids = [flag.flag_id for flag in self.pending[:4]]
+        with self.assertNumQueries(1):
+            response = self.client.post(
+                self.review_url, {"flags": ids, "status": "Reviewed"},
+                format="json",
+            )
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertEqual(response.data, {"updated": 4})
+
+        reviewed = Flag.objects.filter(flag_id__in=ids)
+        self.assertTrue(all(
+            flag.status == "Reviewed"
+            and flag.reviewed_by == self.moderator
+            and flag.reviewed_at is not None
+            for flag in reviewed
+        ))
+        self.assertEqual(
+            Flag.objects.filter(status="Pending").count(), 1
+        )
+
+    def test_review_skips_closed_flags(self):
+        self.client.force_authenticate(self.moderator)
+        response = self.client.post(
+            self.review_url,
+            {"flags": [self.closed.flag_id], "status": "Reviewed"},
+            format="json",
+        )
+        self.assertEqual(response.data, {"updated": 0})
+        self.closed.refresh_from_db()
+        self.assertEqual(self.closed.status, "Rejected")
+
+    def test_review_rejects_invalid_payload(self):
+        self.client.force_authenticate(self.moderator)
+        for payload in (
+            {"flags": [], "status": "Reviewed"},
+            {"flags": [self.pending[0].flag_id], "status": "Pending"},
+        ):
+            response = self.client.post(
+                self.review_url, payload, format="json"
+            )
+            self.assertEqual(
+                response.status_code, status.HTTP_400_BAD_REQUEST
+            )
@@ -1,12 +1,46 @@
 # flag/views.py
-from rest_framework import viewsets, filters
+from django.utils import timezone
+from rest_framework import viewsets, filters, permissions
+from rest_framework.decorators import action
+from rest_framework.response import Response
 from django_filters.rest_framework import DjangoFilterBackend
 from .models import Flag
-from .serializers import FlagSerializer
+from .serializers import FlagReviewSerializer, FlagSerializer
+from lazydog_api.mixins import SparseFieldsetMixin
+from lazydog_api.pagination import (
+    EstimatedCountPagination, KeysetCursorPagination,
+)
 from lazydog_api.permissions import IsAdminOrOwner
 
 
-class FlagViewSet(viewsets.ModelViewSet):
+class FlagQueuePagination(KeysetCursorPagination):
+    """
+    Always-on keyset pagination over pending flags, oldest first, matching
+    the flag_pending_queue_idx index.
+    """
+    page_size = 100
+    ordering = ("created_at",)
+    tie_breaker = "flag_id"
+
+    def is_requested(self, request):
+        return True
+
+    def get_ordering(self, request, queryset, view):
+        return self.ordering
+
+
+class FlagViewSet(SparseFieldsetMixin, viewsets.ModelViewSet):
+    """
+    API endpoint for flagging resources and comments.
+
+    Pagination:
+    - Opt-in page numbers with ?page= / ?page_size=; the total is
+      estimated or capped unless ?count=exact is given
+
+    Moderation (staff only):
+    - GET queue/ pages through pending flags, oldest first
+    - POST review/ closes many pending flags with one UPDATE
+    """
     queryset = Flag.objects.all()
     serializer_class = FlagSerializer
     permission_classes = [IsAdminOrOwner]
@@ -19,6 +53,48 @@ class FlagViewSet(viewsets.ModelViewSet):
     search_fields = ["reason"]
     ordering_fields = ["created_at", "status"]
     ordering = ["-created_at"]
+    pagination_class = EstimatedCountPagination
 
     def perform_create(self, serializer):
         serializer.save(user=self.request.user)
+
+    @action(
+        detail=False,
+        methods=["get"],
+        permission_classes=[permissions.IsAdminUser],
+        pagination_class=FlagQueuePagination,
+    )
+    def queue(self, request):
+        """
+        List pending flags in review order.
+        """
+        queryset = self.filter_queryset(self.get_queryset()).filter(
+            status="Pending"
+        )
+        page = self.paginate_queryset(queryset)
+        serializer = self.get_serializer(page, many=True)
+        return self.get_paginated_response(serializer.data)
+
+    @action(
+        detail=False,
+        methods=["post"],
+        permission_classes=[permissions.IsAdminUser],
+    )
+    def review(self, request):
+        """
+        Set status, reviewed_by and reviewed_at on the given flags.
+        Flags that are no longer pending are left untouched.
+        """
+        serializer = FlagReviewSerializer(data=request.data)
+        serializer.is_valid(raise_exception=True)
+        now = timezone.now()
+        updated = Flag.objects.filter(
+            flag_id__in=serializer.validated_data["flags"],
+            status="Pending",
+        ).update(
+            status=serializer.validated_data["status"],
+            reviewed_by=request.user,
+            reviewed_at=now,
+            updated_at=now,
+        )
+        return Response({"updated": updated})
@@ -0,0 +1,35 @@
+from django.core.paginator import Paginator
+from django.utils.functional import cached_property
+
+from .counts import estimated_row_count, is_unfiltered
+
+
+class EstimatedCountPaginator(Paginator):
+    """
+    Paginator for admin changelists of large tables.
+
+    The unfiltered changelist takes its total from the planner's estimate
+    instead of COUNT(*), once the table holds at least
+    `estimate_threshold` rows; below that, and for filtered or searched
+    changelists, the count is exact.
+    """
+    estimate_threshold = 10000
+
+    @cached_property
+    def count(self):
+        queryset = self.object_list
+        if hasattr(queryset, 'query') and is_unfiltered(queryset):
+            estimate = estimated_row_count(queryset.model, queryset.db)
+            if estimate is not None and estimate >= self.estimate_threshold:
+                return estimate
+        return super().count
+
+
+class LargeTableAdminMixin:
+    """
+    ModelAdmin settings for tables that grow to millions of rows: the
+    estimated-count paginator, and no second COUNT(*) for the "(N total)"
+    shown next to filtered results.
+    """
+    paginator = EstimatedCountPaginator
+    show_full_result_count = False
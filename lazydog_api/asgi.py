@@ -11,6 +11,8 @@ import os
 
 from django.core.asgi import get_asgi_application
 
-os.environ.setdefault('DJANGO_SETTINGS_MODULE', 'lazydog.settings')
+os.environ.setdefault('DJANGO_SETTINGS_MODULE', 'lazydog_api.settings')
+# Read by settings.py to pick ASGI-safe database connection defaults.
+os.environ.setdefault('DJANGO_SERVER_INTERFACE', 'asgi')
 
 application = get_asgi_application()
@@ -0,0 +1,123 @@
+"""
+Async read-only endpoints for the busiest read paths.
+
+Served by the ASGI application (lazydog_api/asgi.py), these views await
+the database through Django's async ORM (`aiterator`, `aget`, `acount`)
+instead of holding a worker thread for the whole request. They reuse the
+DRF serializers of the regular viewsets; querysets must prefetch every
+relation the serializer renders, since serializing happens in the event
+loop where lazy queries are not allowed. For the same reason the session
+user is resolved with `auser()` before anything reads `request.user`.
+"""
+from django.http import Http404, JsonResponse
+from django.views import View
+
+from rest_framework.settings import api_settings
+
+
+class AsyncReadOnlyView(View):
+    """
+    List (`GET <prefix>/`) and detail (`GET <prefix>/<pk>/`) handler.
+
+    The list is ordered by descending primary key and paginated with a
+    keyset on it: `?limit=` (default `page_size`, at most
+    `max_page_size`) and `?before=<pk>` taken from the `next_before` of
+    the previous page. Fields listed in `filter_fields` can be filtered
+    on by primary key, as on the sync viewsets. The response carries a
+    total `count` only when the client asks for it with `?count=exact`,
+    as counting the whole list on every page would cost more than the
+    page itself. Serializer fields listed in `omit_fields` are not
+    rendered, e.g. values the sync viewset annotates but the async
+    queryset does not.
+    """
+    http_method_names = ['get', 'head', 'options']
+    queryset = None
+    serializer_class = None
+    filter_fields = ()
+    omit_fields = ()
+    page_size = 50
+    max_page_size = 500
+    count_query_param = 'count'
+
+    async def get(self, request, pk=None):
+        request.user = await request.auser()
+        if pk is not None:
+            try:
+                return await self.retrieve(request, pk)
+            except Http404:
+                return JsonResponse({'detail': 'Not found.'}, status=404)
+        try:
+            params = self.parse_params(request)
+        except ValueError as error:
+            return JsonResponse({'detail': str(error)}, status=400)
+        return await self.list(request, params)
+
+    def get_queryset(self):
+        return self.queryset.all()
+
+    def get_serializer(self, *args, **kwargs):
+        kwargs['context'] = {'request': self.request, 'view': self}
+        if self.omit_fields:
+            kwargs['omit'] = set(self.omit_fields)
+        return self.serializer_class(*args, **kwargs)
+
+    def parse_params(self, request):
+        """
+        Validate the query parameters of a list request; malformed values
+        raise ValueError, which `get` turns into a 400.
+        """
+        query = request.GET
+        limit = self.parse_int('limit', query.get('limit'), self.page_size)
+        return {
+            'limit': min(max(limit, 1), self.max_page_size),
+            'before': self.parse_int('before', query.get('before')),
+            'count': query.get(self.count_query_param) == 'exact',
+            'filters': {
+                field: self.parse_int(field, query[field])
+                for field in self.filter_fields if field in query
+            },
+        }
+
+    def filter_queryset(self, queryset, filters):
+        return queryset.filter(**filters) if filters else queryset
+
+    @staticmethod
+    def parse_int(name, value, default=None):
+        if value in (None, ''):
+            return default
+        try:
+            return int(value)
+        except ValueError:
+            raise ValueError(f'{name} must be an integer.')
+
+    async def list(self, request, params):
+        queryset = self.filter_queryset(self.get_queryset(), params['filters'])
+        data = {}
+        if params['count']:
+            data['count'] = await queryset.acount()
+
+        limit, before = params['limit'], params['before']
+        if before is not None:
+            queryset = queryset.filter(pk__lt=before)
+
+        page = [
+            item async for item in
+            queryset.order_by('-pk')[:limit].aiterator(chunk_size=limit)
+        ]
+        data['next_before'] = page[-1].pk if len(page) == limit else None
+        data['results'] = self.get_serializer(page, many=True).data
+        return JsonResponse(data, json_dumps_params=self.json_params())
+
+    async def retrieve(self, request, pk):
+        try:
+            instance = await self.get_queryset().aget(pk=pk)
+        except self.queryset.model.DoesNotExist:
+            raise Http404
+        return JsonResponse(
+            self.get_serializer(instance).data,
+            json_dumps_params=self.json_params(),
+        )
+
+    @staticmethod
+    def json_params():
+        return {'ensure_ascii': not api_settings.UNICODE_JSON}
@@ -0,0 +1,160 @@
+"""
+Versioned response cache for small, rarely-changing list endpoints.
+
+Rendered JSON list responses are stored in the Django cache selected by
+the API_CACHE_ALIAS setting, under a key made of the view's namespace, the
+namespace's current generation and the query parameters. Saving or
+deleting a model bumps the generation (see `bump_generation`), which makes
+every cached list of that namespace unreachable at once; stale entries
+simply expire after API_CACHE_TIMEOUT seconds.
+
+Hits and misses are counted in the same cache so they can be read back
+with `manage.py response_cache_stats` when a shared backend is used.
+"""
+import hashlib
+import time
+
+from django.conf import settings
+from django.core.cache import caches
+from django.http import HttpResponse
+from django.utils.cache import get_conditional_response
+from django.utils.http import parse_http_date_safe
+
+CACHED_HEADERS = ('ETag', 'Last-Modified')
+STATS_EVENTS = ('hits', 'misses')
+
+
+def get_cache():
+    return caches[getattr(settings, 'API_CACHE_ALIAS', 'default')]
+
+
+def _generation_key(namespace):
+    return f'api:{namespace}:generation'
+
+
+def get_generation(namespace):
+    """
+    Return the current generation of `namespace`.
+
+    A missing counter (never set, or evicted) is seeded from the clock
+    rather than from zero, so it can never fall back to a generation that
+    still has entries in the cache.
+    """
+    cache = get_cache()
+    key = _generation_key(namespace)
+    generation = cache.get(key)
+    if generation is None:
+        cache.add(key, time.time_ns(), timeout=None)
+        generation = cache.get(key)
+    return generation
+
+
+def bump_generation(namespace):
+    """
+    Invalidate every cached response of `namespace`.
+    """
+    cache = get_cache()
+    try:
+        cache.incr(_generation_key(namespace))
+    except ValueError:
+        get_generation(namespace)
+
+
+def record_cache_event(event):
+    cache = get_cache()
+    key = f'api:stats:{event}'
+    if not cache.add(key, 1, timeout=None):
+        try:
+            cache.incr(key)
+        except ValueError:
+            cache.set(key, 1, timeout=None)
+
+
+def get_cache_stats():
+    """
+    Return the hit and miss counters as a dict.
+    """
+    stored = get_cache().get_many([f'api:stats:{e}' for e in STATS_EVENTS])
+    return {
+        event: stored.get(f'api:stats:{event}', 0) for event in STATS_EVENTS
+    }
+
+
+def reset_cache_stats():
+    get_cache().delete_many([f'api:stats:{e}' for e in STATS_EVENTS])
+
+
+class CachedListMixin:
+    """
+    Serve the JSON `list` action of a viewset from the versioned response
+    cache. Views set `cache_namespace` and connect `bump_generation` to the
+    post_save/post_delete signals of every model the list depends on.
+
+    Only JSON responses are cached: the browsable API embeds per-user
+    content. Cached entries keep their ETag / Last-Modified headers, so
+    conditional requests are answered from the cache as well.
+    """
+    cache_namespace = None
+    cache_format = 'json'
+
+    def get_list_cache_key(self, request):
+        params = sorted(
+            (key, value)
+            for key, values in request.query_params.lists()
+            for value in values
+        )
+        digest = hashlib.md5(
+            repr(params).encode(), usedforsecurity=False
+        ).hexdigest()
+        generation = get_generation(self.cache_namespace)
+        return f'api:{self.cache_namespace}:{generation}:list:{digest}'
+
+    def list(self, request, *args, **kwargs):
+        if request.accepted_renderer.format != self.cache_format:
+            return super().list(request, *args, **kwargs)
+
+        cache = get_cache()
+        key = self.get_list_cache_key(request)
+        cached = cache.get(key)
+        if cached is not None:
+            record_cache_event('hits')
+            return self.cached_response(request, *cached)
+
+        record_cache_event('misses')
+        response = super().list(request, *args, **kwargs)
+        if response.status_code != 200:
+            return response
+
+        # DRF only attaches the renderer after the handler returns, so
+        # render here to get the bytes that go into the cache.
+        response.accepted_renderer = request.accepted_renderer
+        response.accepted_media_type = request.accepted_media_type
+        response.renderer_context = self.get_renderer_context()
+        response.render()
+        headers = {
+            name: response[name] for name in CACHED_HEADERS
+            if name in response
+        }
+        cache.set(
+            key,
+            (response.content, response['Content-Type'], headers),
+            getattr(settings, 'API_CACHE_TIMEOUT', 300),
+        )
+        response['X-Cache'] = 'MISS'
+        return response
+
+    def cached_response(self, request, content, content_type, headers):
+        last_modified = headers.get('Last-Modified')
+        response = get_conditional_response(
+            request,
+            etag=headers.get('ETag'),
+            last_modified=last_modified and parse_http_date_safe(
+                last_modified
+            ),
+        )
+        if response is None:
+            response = HttpResponse(content, content_type=content_type)
+        for name, value in headers.items():
+            response[name] = value
+        response['X-Cache'] = 'HIT'
+        return response
@@ -0,0 +1,49 @@
+"""
+Row counts that stay cheap on large tables.
+
+An exact COUNT(*) reads every matching row (or index entry). For an
+unfiltered table PostgreSQL's planner already keeps an estimate in
+pg_class.reltuples, refreshed by VACUUM / ANALYZE; other backends have no
+equivalent, so callers fall back to counting.
+"""
+from django.db import connections
+
+
+def estimated_row_count(model, using='default'):
+    """
+    Return the planner's row estimate for the table of `model`, or None
+    when the backend has none or the table was never analyzed.
+    """
+    connection = connections[using]
+    if connection.vendor != 'postgresql':
+        return None
+    with connection.cursor() as cursor:
+        cursor.execute(
+            'SELECT reltuples FROM pg_class WHERE oid = %s::regclass',
+            [connection.ops.quote_name(model._meta.db_table)],
+        )
+        row = cursor.fetchone()
+    if row is None or row[0] < 0:
+        return None
+    return int(row[0])
+
+
+def is_unfiltered(queryset):
+    """
+    Return True if `queryset` selects every row of its table.
+    """
+    query = queryset.query
+    return (
+        not query.where
+        and not query.distinct
+        and query.low_mark == 0
+        and query.high_mark is None
+    )
+
+
+def capped_count(queryset, cap):
+    """
+    Count the rows of `queryset`, stopping at cap + 1. A result above
+    `cap` only means "more than cap".
+    """
+    return queryset.order_by()[:cap + 1].count()
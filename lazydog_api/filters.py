@@ -0,0 +1,57 @@
+from functools import reduce
+from operator import or_
+
+from django.contrib.postgres.search import SearchQuery, SearchRank
+from django.db import connections
+from django.db.models import F, Q
+from rest_framework import filters
+
+# Relevance of each row to ?search=, annotated by FullTextSearchFilter.
+RANK_ANNOTATION = 'search_rank'
+
+
+class FullTextSearchFilter(filters.SearchFilter):
+    """
+    Drop-in replacement for DRF's SearchFilter backed by PostgreSQL
+    full-text search.
+
+    Views list the SearchVectorField paths to match in
+    `search_vector_fields`; the first one is used for ranking. On
+    PostgreSQL the `?search=` terms are matched against those GIN-indexed
+    columns and, unless the client asked for an explicit `?ordering=`,
+    results are ordered by relevance. On any other backend (SQLite in
+    development) the regular ILIKE search over `search_fields` is used.
+
+    Place this backend after OrderingFilter so the relevance ordering is
+    not replaced by the view's default ordering. KeysetCursorPagination
+    pages ranked results by the rank as well.
+    """
+    search_config = 'english'
+    ordering_param = 'ordering'
+
+    def get_search_vector_fields(self, view, request):
+        return getattr(view, 'search_vector_fields', None)
+
+    def filter_queryset(self, request, queryset, view):
+        vector_fields = self.get_search_vector_fields(view, request)
+        search_terms = self.get_search_terms(request)
+        vendor = connections[queryset.db].vendor
+        if not vector_fields or not search_terms or vendor != 'postgresql':
+            return super().filter_queryset(request, queryset, view)
+
+        query = SearchQuery(
+            ' '.join(search_terms),
+            search_type='websearch',
+            config=self.search_config,
+        )
+        queryset = queryset.filter(
+            reduce(or_, (Q(**{field: query}) for field in vector_fields))
+        ).annotate(
+            **{RANK_ANNOTATION: SearchRank(F(vector_fields[0]), query)}
+        )
+        if self.ordering_param not in request.query_params:
+            queryset = queryset.order_by(
+                F(RANK_ANNOTATION).desc(nulls_last=True),
+                *queryset.query.order_by
+            )
+        return queryset
@@ -0,0 +1,33 @@
+from django.core.management.base import BaseCommand
+
+from lazydog_api.cache import get_cache_stats, reset_cache_stats
+
+
+class Command(BaseCommand):
+    """
+    Print the hit/miss counters of the versioned list response cache.
+
+    The counters live in the configured cache backend, so they are only
+    visible here when that backend is shared between processes (Redis,
+    Memcached, database); the local-memory default is per process.
+    """
+    help = "Show hit and miss counts of the API list response cache."
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            "--reset",
+            action="store_true",
+            help="Reset the counters after printing them.",
+        )
+
+    def handle(self, *args, **options):
+        stats = get_cache_stats()
+        total = stats["hits"] + stats["misses"]
+        ratio = stats["hits"] / total if total else 0.0
+        self.stdout.write(
+            f"hits: {stats['hits']}  misses: {stats['misses']}  "
+            f"hit ratio: {ratio:.1%}"
+        )
+        if options["reset"]:
+            reset_cache_stats()
+            self.stdout.write("Counters reset.")
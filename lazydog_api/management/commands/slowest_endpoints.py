@@ -0,0 +1,63 @@
+from django.core.management.base import BaseCommand
+
+from lazydog_api.metrics import load_published_samples, registry, summarize
+
+SORT_KEYS = (
+    'p50', 'p95', 'p99', 'queries', 'db', 'serialize', 'render', 'count'
+)
+
+
+class Command(BaseCommand):
+    """
+    Print the slowest endpoints recorded by RequestMetricsMiddleware.
+
+    Samples are read from the snapshots every process publishes to the
+    cache (see lazydog_api/metrics.py), merged per endpoint and sorted by
+    the chosen column. Times are in milliseconds; queries, db, serialize
+    and render are per-request means.
+    """
+    help = "Show the slowest API endpoints by latency percentile."
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            "--limit", type=int, default=10,
+            help="Number of endpoints to show.",
+        )
+        parser.add_argument(
+            "--sort", choices=SORT_KEYS, default="p95",
+            help="Column to sort by (descending).",
+        )
+
+    def handle(self, *args, **options):
+        samples = load_published_samples()
+        # Include this process too, so the command is useful in a shell
+        # session that served requests itself.
+        for endpoint, local in registry.snapshot().items():
+            samples.setdefault(endpoint, []).extend(local)
+
+        if not samples:
+            self.stdout.write(
+                "No request metrics found. Is REQUEST_METRICS_ENABLED set "
+                "and a shared cache backend configured?"
+            )
+            return
+
+        rows = sorted(
+            ((endpoint, summarize(values))
+             for endpoint, values in samples.items()),
+            key=lambda row: row[1][options["sort"]],
+            reverse=True,
+        )[:options["limit"]]
+
+        self.stdout.write(
+            f"{'endpoint':<45} {'count':>7} {'p50':>9} {'p95':>9} "
+            f"{'p99':>9} {'queries':>8} {'db':>9} {'serialize':>9} "
+            f"{'render':>9}"
+        )
+        for endpoint, stats in rows:
+            self.stdout.write(
+                f"{endpoint:<45} {stats['count']:>7} {stats['p50']:>9.2f} "
+                f"{stats['p95']:>9.2f} {stats['p99']:>9.2f} "
+                f"{stats['queries']:>8.1f} {stats['db']:>9.2f} "
+                f"{stats['serialize']:>9.2f} {stats['render']:>9.2f}"
+            )
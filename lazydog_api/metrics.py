@@ -0,0 +1,157 @@
+"""
+In-process request metrics used by RequestMetricsMiddleware.
+
+Every endpoint ("<METHOD> <url name>") keeps a bounded reservoir of its
+most recent samples, from which percentiles are computed on demand. Each
+process periodically publishes its reservoirs to the Django cache so
+`manage.py slowest_endpoints` can merge them; with the per-process
+local-memory cache only the publishing process itself can see them.
+"""
+import math
+import os
+import socket
+import threading
+import time
+from collections import deque
+from contextlib import contextmanager
+
+from django.conf import settings
+from django.core.cache import caches
+
+SAMPLE_FIELDS = ('total', 'db', 'queries', 'render', 'serialize')
+INDEX_KEY = 'api:metrics:index'
+SNAPSHOT_TIMEOUT = 24 * 60 * 60
+
+
+def percentile(values, pct):
+    """
+    Nearest-rank percentile of an already sorted list.
+    """
+    if not values:
+        return 0.0
+    rank = max(math.ceil(pct / 100 * len(values)), 1)
+    return values[rank - 1]
+
+
+def summarize(samples):
+    """
+    Reduce a list of sample tuples (see SAMPLE_FIELDS) to summary numbers.
+    """
+    totals = sorted(sample[0] for sample in samples)
+    count = len(samples)
+    return {
+        'count': count,
+        'p50': percentile(totals, 50),
+        'p95': percentile(totals, 95),
+        'p99': percentile(totals, 99),
+        'queries': sum(sample[2] for sample in samples) / count,
+        'db': sum(sample[1] for sample in samples) / count,
+        'render': sum(sample[3] for sample in samples) / count,
+        # Snapshots published before serialize was recorded lack it.
+        'serialize': sum(
+            sample[4] if len(sample) > 4 else 0.0 for sample in samples
+        ) / count,
+    }
+
+
+@contextmanager
+def serialize_timer(request):
+    """
+    Add the time spent in the block to the request's serialization total,
+    which RequestMetricsMiddleware starts at zero. Nested blocks (nested
+    serializers) are only counted once; without the middleware this does
+    nothing.
+    """
+    request = getattr(request, '_request', request)
+    if (getattr(request, '_metrics_serialize', None) is None
+            or request._metrics_serializing):
+        yield
+        return
+    request._metrics_serializing = True
+    start = time.perf_counter()
+    try:
+        yield
+    finally:
+        request._metrics_serialize += time.perf_counter() - start
+        request._metrics_serializing = False
+
+
+def get_cache():
+    return caches[getattr(settings, 'API_CACHE_ALIAS', 'default')]
+
+
+class MetricsRegistry:
+    """
+    Thread-safe per-endpoint sample reservoirs for one process.
+    """
+
+    def __init__(self, max_samples=1000):
+        self.max_samples = max_samples
+        self._lock = threading.Lock()
+        self._samples = {}
+        self._last_publish = time.monotonic()
+        self.key = f'api:metrics:{socket.gethostname()}:{os.getpid()}'
+
+    def record(self, endpoint, total, db, queries, render, serialize):
+        with self._lock:
+            samples = self._samples.get(endpoint)
+            if samples is None:
+                samples = self._samples[endpoint] = deque(
+                    maxlen=self.max_samples
+                )
+            samples.append((total, db, queries, render, serialize))
+
+    def snapshot(self):
+        with self._lock:
+            return {
+                endpoint: list(samples)
+                for endpoint, samples in self._samples.items()
+            }
+
+    def summary(self):
+        return {
+            endpoint: summarize(samples)
+            for endpoint, samples in self.snapshot().items()
+        }
+
+    def reset(self):
+        with self._lock:
+            self._samples.clear()
+
+    def maybe_publish(self, interval):
+        """
+        Publish the reservoirs if `interval` seconds passed since the last
+        publish. Returns True when a snapshot was written.
+        """
+        now = time.monotonic()
+        if now - self._last_publish < interval:
+            return False
+        self._last_publish = now
+        self.publish()
+        return True
+
+    def publish(self):
+        cache = get_cache()
+        cache.set(self.key, self.snapshot(), SNAPSHOT_TIMEOUT)
+        index = cache.get(INDEX_KEY) or set()
+        if self.key not in index:
+            cache.set(INDEX_KEY, index | {self.key}, None)
+
+
+def load_published_samples():
+    """
+    Merge the snapshots published by every process into one
+    {endpoint: [samples]} dict.
+    """
+    cache = get_cache()
+    index = cache.get(INDEX_KEY) or set()
+    merged = {}
+    for snapshot in cache.get_many(list(index)).values():
+        for endpoint, samples in snapshot.items():
+            merged.setdefault(endpoint, []).extend(samples)
+    return merged
+
+
+registry = MetricsRegistry(
+    max_samples=getattr(settings, 'REQUEST_METRICS_MAX_SAMPLES', 1000)
+)
@@ -0,0 +1,102 @@
+import time
+from contextlib import ExitStack
+
+from django.conf import settings
+from django.core.exceptions import MiddlewareNotUsed
+from django.db import connections
+
+from .metrics import registry
+
+
+class QueryTimer:
+    """
+    Database execute wrapper that counts queries and sums their duration.
+    """
+
+    def __init__(self):
+        self.count = 0
+        self.duration = 0.0
+
+    def __call__(self, execute, sql, params, many, context):
+        start = time.perf_counter()
+        try:
+            return execute(sql, params, many, context)
+        finally:
+            self.duration += time.perf_counter() - start
+            self.count += 1
+
+
+class RequestMetricsMiddleware:
+    """
+    Measure every request and report the numbers per view.
+
+    For each request this records the number of SQL queries, the time
+    spent in the database, the time spent serializing (building
+    `serializer.data`, reported by TimedSerializerMixin), the time spent
+    rendering the response body (`response.render()`) and the total
+    time. The numbers are sent back in a `Server-Timing` header and added
+    to the in-process metrics registry, which `manage.py
+    slowest_endpoints` reads.
+
+    Enabled with the REQUEST_METRICS_ENABLED setting; otherwise Django
+    drops the middleware at startup.
+    """
+
+    def __init__(self, get_response):
+        if not getattr(settings, 'REQUEST_METRICS_ENABLED', False):
+            raise MiddlewareNotUsed
+        self.get_response = get_response
+        self.publish_interval = getattr(
+            settings, 'REQUEST_METRICS_PUBLISH_INTERVAL', 30
+        )
+
+    def __call__(self, request):
+        timer = QueryTimer()
+        request._metrics_serialize = 0.0
+        request._metrics_serializing = False
+        start = time.perf_counter()
+        with ExitStack() as stack:
+            for connection in connections.all():
+                stack.enter_context(connection.execute_wrapper(timer))
+            response = self.get_response(request)
+        total = time.perf_counter() - start
+
+        render = 0.0
+        window = getattr(request, '_metrics_render', None)
+        if window and len(window) == 2:
+            render = window[1] - window[0]
+
+        response['Server-Timing'] = ', '.join([
+            f'db;dur={timer.duration * 1000:.2f};desc="{timer.count} queries"',
+            f'serialize;dur={request._metrics_serialize * 1000:.2f}',
+            f'render;dur={render * 1000:.2f}',
+            f'total;dur={total * 1000:.2f}',
+        ])
+
+        registry.record(
+            self.get_endpoint(request),
+            total=total * 1000,
+            db=timer.duration * 1000,
+            queries=timer.count,
+            render=render * 1000,
+            serialize=request._metrics_serialize * 1000,
+        )
+        registry.maybe_publish(self.publish_interval)
+        return response
+
+    def process_template_response(self, request, response):
+        # Called right before DRF renders the response; the post-render
+        # callback closes the window.
+        request._metrics_render = [time.perf_counter()]
+        response.add_post_render_callback(
+            lambda rendered: request._metrics_render.append(
+                time.perf_counter()
+            )
+        )
+        return response
+
+    @staticmethod
+    def get_endpoint(request):
+        match = getattr(request, 'resolver_match', None)
+        view_name = match.view_name if match else 'unresolved'
+        return f'{request.method} {view_name}'
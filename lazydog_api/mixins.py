@@ -0,0 +1,234 @@
+import hashlib
+
+from django.core.exceptions import FieldDoesNotExist
+from django.db.models import Count, Max, Prefetch
+from django.utils.cache import get_conditional_response
+from django.utils.http import http_date, quote_etag
+from rest_framework.permissions import SAFE_METHODS
+from rest_framework.response import Response
+
+
+class ConditionalGetMixin:
+    """
+    Adds ETag / Last-Modified validators to the list and retrieve actions
+    of a ModelViewSet and answers matching conditional requests with
+    304 Not Modified before anything is serialized.
+
+    Unpaginated list validators come from one aggregate query (latest
+    `last_modified_field` and row count, so deletions change the ETag as
+    well). Paginated lists use the ids and `last_modified_field` of the
+    rows on the page instead, so a page never costs a query over the
+    whole list. The detail validators come from the fetched instance. The ETag
+    also covers the request path and the negotiated format, so the JSON
+    and browsable API representations never share a validator.
+    """
+    last_modified_field = 'updated_at'
+
+    def get_etag(self, request, *parts):
+        key = '|'.join(
+            [request.get_full_path(), request.accepted_renderer.format]
+            + [str(part) for part in parts]
+        )
+        return quote_etag(hashlib.md5(
+            key.encode(), usedforsecurity=False
+        ).hexdigest())
+
+    def conditional_response(self, request, etag, last_modified, render):
+        """
+        Return a 304 if the client's validators match, otherwise the
+        response built by `render`. Both carry the ETag and Last-Modified
+        headers.
+        """
+        # HTTP dates have one-second resolution; sub-second changes are
+        # still caught by the ETag.
+        timestamp = int(last_modified.timestamp()) if last_modified else None
+        response = get_conditional_response(
+            request, etag=etag, last_modified=timestamp
+        )
+        if response is None:
+            response = render()
+        response['ETag'] = etag
+        if timestamp is not None:
+            response['Last-Modified'] = http_date(timestamp)
+        return response
+
+    def list(self, request, *args, **kwargs):
+        queryset = self.filter_queryset(self.get_queryset())
+        page = self.paginate_queryset(queryset)
+        if page is not None:
+            return self.list_page(request, page)
+
+        state = queryset.order_by().aggregate(
+            last_modified=Max(self.last_modified_field), count=Count('pk')
+        )
+        etag = self.get_etag(
+            request, state['last_modified'], state['count']
+        )
+
+        def render():
+            serializer = self.get_serializer(queryset, many=True)
+            return Response(serializer.data)
+
+        return self.conditional_response(
+            request, etag, state['last_modified'], render
+        )
+
+    def list_page(self, request, page):
+        """
+        Validators of a paginated list, built from the page's own rows and
+        links so no query runs over the rest of the list. The request path
+        in the ETag already covers the cursor and the other parameters.
+        """
+        rows = [
+            (obj.pk, getattr(obj, self.last_modified_field)) for obj in page
+        ]
+        last_modified = max(
+            (changed for _, changed in rows if changed), default=None
+        )
+        etag = self.get_etag(
+            request, rows, self.paginator.get_next_link(),
+            self.paginator.get_previous_link(),
+        )
+
+        def render():
+            serializer = self.get_serializer(page, many=True)
+            return self.get_paginated_response(serializer.data)
+
+        return self.conditional_response(
+            request, etag, last_modified, render
+        )
+
+    def retrieve(self, request, *args, **kwargs):
+        instance = self.get_object()
+        last_modified = getattr(instance, self.last_modified_field)
+        etag = self.get_etag(request, instance.pk, last_modified)
+
+        def render():
+            serializer = self.get_serializer(instance)
+            return Response(serializer.data)
+
+        return self.conditional_response(
+            request, etag, last_modified, render
+        )
+
+
+def _split_param(value):
+    if value is None:
+        return None
+    return {name.strip() for name in value.split(',') if name.strip()}
+
+
+def _related_paths(select_related, prefix=''):
+    """
+    Flatten Query.select_related ({'a': {'b': {}}}) into ['a__b'].
+    """
+    paths = []
+    for name, nested in select_related.items():
+        path = f'{prefix}{name}'
+        paths.extend(_related_paths(nested, f'{path}__') or [path])
+    return paths
+
+
+class SparseFieldsetMixin:
+    """
+    Sparse fieldsets for read requests: `?fields=id,title` limits the
+    response to the listed serializer fields and `?omit=description`
+    drops the listed ones. The serializer must use
+    SparseFieldsetSerializerMixin.
+
+    The queryset is narrowed to match: columns behind unrequested fields
+    are deferred, and select_related / prefetch_related lookups for
+    unrequested relations are dropped. Columns named in
+    `sparse_required_fields`, the ordering fields and
+    `last_modified_field` stay loaded, since pagination cursors and
+    conditional GET validators read them. Write requests ignore both
+    parameters.
+    """
+    sparse_required_fields = ()
+
+    def get_sparse_fieldset(self):
+        """
+        Return the (fields, omit) sets requested, or (None, None).
+        """
+        request = getattr(self, 'request', None)
+        if request is None or request.method not in SAFE_METHODS:
+            return None, None
+        params = request.query_params
+        return _split_param(params.get('fields')), _split_param(
+            params.get('omit')
+        )
+
+    def get_serializer(self, *args, **kwargs):
+        fields, omit = self.get_sparse_fieldset()
+        if fields is not None:
+            kwargs.setdefault('fields', fields)
+        if omit:
+            kwargs.setdefault('omit', omit)
+        return super().get_serializer(*args, **kwargs)
+
+    def get_sparse_required_fields(self):
+        required = set(self.sparse_required_fields)
+        ordering_fields = getattr(self, 'ordering_fields', None)
+        if isinstance(ordering_fields, (list, tuple)):
+            required.update(ordering_fields)
+        required.update(
+            name.lstrip('-') for name in getattr(self, 'ordering', None) or ()
+        )
+        last_modified = getattr(self, 'last_modified_field', None)
+        if last_modified:
+            required.add(last_modified)
+        return required
+
+    def filter_queryset(self, queryset):
+        queryset = super().filter_queryset(queryset)
+        fields, omit = self.get_sparse_fieldset()
+        if fields is None and not omit:
+            return queryset
+        return self.narrow_queryset(queryset, self.get_serializer().fields)
+
+    def narrow_queryset(self, queryset, serializer_fields):
+        sources = set()
+        for field in serializer_fields.values():
+            source = field.source.split('.')[0]
+            if source == '*':
+                # The field reads the whole instance; nothing can be
+                # safely left out.
+                return queryset
+            sources.add(source)
+
+        opts = queryset.model._meta
+        for source in sources:
+            if source in queryset.query.annotations:
+                continue
+            try:
+                opts.get_field(source)
+            except FieldDoesNotExist:
+                # A property or method; its columns are unknown.
+                return queryset
+
+        select_related = queryset.query.select_related
+        if isinstance(select_related, dict):
+            queryset = queryset.select_related(None).select_related(*[
+                path for path in _related_paths(select_related)
+                if path.split('__')[0] in sources
+            ])
+
+        lookups = queryset._prefetch_related_lookups
+        kept_lookups = [
+            lookup for lookup in lookups
+            if (
+                lookup.prefetch_through if isinstance(lookup, Prefetch)
+                else lookup
+            ).split('__')[0] in sources
+        ]
+        if len(kept_lookups) != len(lookups):
+            queryset = queryset.prefetch_related(None).prefetch_related(
+                *kept_lookups
+            )
+
+        keep = sources | self.get_sparse_required_fields() | {opts.pk.name}
+        deferred = [
+            field.name for field in opts.concrete_fields
+            if field.name not in keep
+        ]
+        return queryset.defer(*deferred) if deferred else queryset
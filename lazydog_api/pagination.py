@@ -0,0 +1,306 @@
+import json
+
+from django.core.exceptions import FieldDoesNotExist, ValidationError
+from django.db.models import Q
+from rest_framework.exceptions import NotFound
+from rest_framework.pagination import (
+    Cursor, CursorPagination, PageNumberPagination,
+)
+from rest_framework.response import Response
+from rest_framework.utils.urls import remove_query_param, replace_query_param
+
+from .counts import capped_count, estimated_row_count, is_unfiltered
+from .filters import RANK_ANNOTATION, FullTextSearchFilter
+
+
+class KeysetCursorPagination(CursorPagination):
+    """
+    Opt-in keyset (seek) pagination.
+
+    Pages are addressed by the (ordering field, id) pair of the last row
+    seen instead of an OFFSET, so page N costs the same as page 1. The
+    ordering field follows the view's OrderingFilter; `id` is always added
+    as a tie-breaker so rows sharing a timestamp or title are never skipped
+    or repeated.
+
+    A relevance-ranked search (FullTextSearchFilter without ?ordering=)
+    is paged by `-search_rank` instead, so every page keeps rank order.
+
+    Pagination is only applied when the client sends `cursor` or
+    `page_size`, so existing clients keep receiving a plain list.
+    """
+    page_size = 50
+    page_size_query_param = 'page_size'
+    max_page_size = 500
+    ordering = ('-created_at',)
+    tie_breaker = 'id'
+
+    def is_requested(self, request):
+        """
+        Return True if the client opted in to paginated responses.
+        """
+        params = request.query_params
+        return (self.cursor_query_param in params
+                or self.page_size_query_param in params)
+
+    def paginate_queryset(self, queryset, request, view=None):
+        if not self.is_requested(request):
+            return None
+
+        self.request = request
+        self.page_size = self.get_page_size(request)
+        self.base_url = request.build_absolute_uri()
+        self.ordering = self.get_ordering(request, queryset, view)
+
+        self.cursor = self.decode_cursor(request)
+        if self.cursor is None:
+            reverse, current_position = False, None
+        else:
+            reverse = self.cursor.reverse
+            current_position = self.decode_position(
+                self.cursor.position, queryset
+            )
+
+        key = self.ordering[0]
+        descending = key.startswith('-')
+        key_attr = key.lstrip('-')
+        if reverse:
+            descending = not descending
+        prefix = '-' if descending else ''
+        queryset = queryset.order_by(
+            f'{prefix}{key_attr}', f'{prefix}{self.tie_breaker}'
+        )
+
+        # Seek past the last row of the previous page using the
+        # (key, tie-breaker) pair. The redundant inclusive bound on the key
+        # gives the database an index range to start from, so the skipped
+        # rows are never scanned.
+        if current_position is not None:
+            value, pk = current_position
+            lookup = 'lt' if descending else 'gt'
+            queryset = queryset.filter(
+                Q(**{f'{key_attr}__{lookup}e': value}),
+                Q(**{f'{key_attr}__{lookup}': value})
+                | Q(**{f'{self.tie_breaker}__{lookup}': pk}),
+            )
+
+        # Fetch one extra row to find out if another page follows.
+        results = list(queryset[:self.page_size + 1])
+        has_following = len(results) > self.page_size
+        self.page = results[:self.page_size]
+        if reverse:
+            self.page.reverse()
+
+        if reverse:
+            self.has_next = current_position is not None
+            self.has_previous = has_following
+        else:
+            self.has_next = has_following
+            self.has_previous = current_position is not None
+
+        if (self.has_previous or self.has_next) and self.template is not None:
+            self.display_page_controls = True
+
+        return self.page
+
+    def get_next_link(self):
+        if not self.has_next or not self.page:
+            return None
+        position = self._get_position_from_instance(
+            self.page[-1], self.ordering
+        )
+        return self.encode_cursor(
+            Cursor(offset=0, reverse=False, position=position)
+        )
+
+    def get_previous_link(self):
+        if not self.has_previous or not self.page:
+            return None
+        position = self._get_position_from_instance(
+            self.page[0], self.ordering
+        )
+        return self.encode_cursor(
+            Cursor(offset=0, reverse=True, position=position)
+        )
+
+    def get_ordering(self, request, queryset, view):
+        """
+        Only the first ordering term is used as the key; any tie-breakers
+        the view declares are replaced by `tie_breaker`.
+        """
+        if (RANK_ANNOTATION in queryset.query.annotations
+                and FullTextSearchFilter.ordering_param
+                not in request.query_params):
+            return (f'-{RANK_ANNOTATION}',)
+        ordering = super().get_ordering(request, queryset, view)
+        return (ordering[0],)
+
+    def _get_position_from_instance(self, instance, ordering):
+        key_attr = ordering[0].lstrip('-')
+        if isinstance(instance, dict):
+            value = instance[key_attr]
+            pk = instance[self.tie_breaker]
+        else:
+            value = getattr(instance, key_attr)
+            pk = getattr(instance, self.tie_breaker)
+        if hasattr(value, 'isoformat'):
+            value = value.isoformat()
+        # The ordering term is stored as well, so a cursor is only ever
+        # decoded against the key it was taken from.
+        return json.dumps([ordering[0], value, pk])
+
+    def decode_position(self, position, queryset):
+        """
+        Turn the encoded cursor position back into a (value, pk) pair,
+        converting the value with the ordering field's to_python(). Any
+        malformed position, or one taken under another ordering, is a
+        404 rather than a database error.
+        """
+        if position is None:
+            return None
+        try:
+            key, value, pk = json.loads(position)
+            if key != self.ordering[0]:
+                raise ValueError
+            if isinstance(value, bool) or not isinstance(
+                value, (str, int, float)
+            ):
+                raise ValueError
+            field = self.get_key_field(queryset, key.lstrip('-'))
+            value = field.to_python(value)
+            if value is None:
+                raise ValueError
+            return value, int(pk)
+        except (TypeError, ValueError, FieldDoesNotExist, ValidationError):
+            raise NotFound(self.invalid_cursor_message)
+
+    @staticmethod
+    def get_key_field(queryset, name):
+        """
+        The model field (or annotation output field) behind an ordering
+        key.
+        """
+        annotation = queryset.query.annotations.get(name)
+        if annotation is not None:
+            return annotation.output_field
+        field = queryset.model._meta.get_field(name)
+        return field.output_field if field.generated else field
+
+
+class EstimatedCountPagination(PageNumberPagination):
+    """
+    Opt-in page-number pagination that never runs an unbounded COUNT(*).
+
+    Each page is fetched with one extra row, which tells whether a next
+    page exists without knowing the total. The `count` in the response is
+    then, as reported by `count_type`:
+
+    - "exact" when the last page was reached, the total is at most
+      `count_cap`, or the client asked for ?count=exact
+    - "estimate" for unfiltered lists of large tables on PostgreSQL,
+      taken from the planner's statistics (pg_class.reltuples)
+    - "lower_bound" for larger filtered lists: at least `count` rows,
+      found by counting no further than `count_cap` + 1
+
+    Like KeysetCursorPagination, pagination is only applied when the
+    client sends `page` or `page_size`.
+    """
+    page_size = 50
+    page_size_query_param = 'page_size'
+    max_page_size = 500
+    count_query_param = 'count'
+    count_cap = 1000
+    template = None
+
+    def is_requested(self, request):
+        params = request.query_params
+        return (self.page_query_param in params
+                or self.page_size_query_param in params)
+
+    def paginate_queryset(self, queryset, request, view=None):
+        if not self.is_requested(request):
+            return None
+
+        self.request = request
+        self.page_size = self.get_page_size(request)
+        try:
+            self.number = int(
+                request.query_params.get(self.page_query_param) or 1
+            )
+            if self.number < 1:
+                raise ValueError
+        except (TypeError, ValueError):
+            raise NotFound('Invalid page.')
+
+        # OFFSET paging needs a total order to not skip or repeat rows.
+        pk_name = queryset.model._meta.pk.name
+        ordering = list(queryset.query.order_by
+                        or queryset.model._meta.ordering)
+        if not {'pk', pk_name, '-pk', f'-{pk_name}'} & set(ordering):
+            descending = bool(ordering) and str(ordering[0]).startswith('-')
+            queryset = queryset.order_by(
+                *ordering, f'-{pk_name}' if descending else pk_name
+            )
+
+        offset = (self.number - 1) * self.page_size
+        results = list(queryset[offset:offset + self.page_size + 1])
+        if not results and self.number > 1:
+            raise NotFound('Invalid page.')
+        self.has_next = len(results) > self.page_size
+        self.page = results[:self.page_size]
+
+        if not self.has_next:
+            self.count, self.count_type = offset + len(self.page), 'exact'
+        else:
+            self.count, self.count_type = self.get_count(queryset, offset)
+        return self.page
+
+    def get_count(self, queryset, offset):
+        """
+        Return (count, count_type) for a list that continues past the
+        current page.
+        """
+        if self.request.query_params.get(self.count_query_param) == 'exact':
+            return queryset.count(), 'exact'
+        if is_unfiltered(queryset):
+            estimate = estimated_row_count(queryset.model, queryset.db)
+            if estimate is not None and estimate > self.count_cap:
+                return estimate, 'estimate'
+        count = capped_count(queryset, self.count_cap)
+        if count > self.count_cap:
+            # Rows up to the start of the following page are known to
+            # exist even when they lie beyond the cap.
+            seen = offset + len(self.page) + 1
+            return max(self.count_cap, seen), 'lower_bound'
+        return count, 'exact'
+
+    def get_next_link(self):
+        if not self.has_next:
+            return None
+        url = self.request.build_absolute_uri()
+        return replace_query_param(url, self.page_query_param, self.number + 1)
+
+    def get_previous_link(self):
+        if self.number <= 1:
+            return None
+        url = self.request.build_absolute_uri()
+        if self.number == 2:
+            return remove_query_param(url, self.page_query_param)
+        return replace_query_param(url, self.page_query_param, self.number - 1)
+
+    def get_paginated_response(self, data):
+        return Response({
+            'count': self.count,
+            'count_type': self.count_type,
+            'next': self.get_next_link(),
+            'previous': self.get_previous_link(),
+            'results': data,
+        })
+
+    def get_paginated_response_schema(self, schema):
+        response = super().get_paginated_response_schema(schema)
+        response['properties']['count_type'] = {
+            'type': 'string',
+            'enum': ['exact', 'estimate', 'lower_bound'],
+        }
+        return response
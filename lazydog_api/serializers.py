@@ -0,0 +1,39 @@
+from .metrics import serialize_timer
+
+
+class SparseFieldsetSerializerMixin:
+    """
+    Lets a serializer be limited to a subset of its fields.
+
+    `fields` keeps only the named fields, `omit` drops the named ones;
+    unknown names are ignored. Both are optional keyword arguments, passed
+    by SparseFieldsetMixin views for `?fields=` / `?omit=` requests.
+    """
+
+    def __init__(self, *args, **kwargs):
+        self.sparse_fields = kwargs.pop('fields', None)
+        self.sparse_omit = kwargs.pop('omit', None)
+        super().__init__(*args, **kwargs)
+
+    def get_fields(self):
+        fields = super().get_fields()
+        if self.sparse_fields is not None:
+            fields = {
+                name: field for name, field in fields.items()
+                if name in self.sparse_fields
+            }
+        for name in self.sparse_omit or ():
+            fields.pop(name, None)
+        return fields
+
+
+class TimedSerializerMixin:
+    """
+    Reports the time spent in to_representation() to
+    RequestMetricsMiddleware, as the `serialize` timing. List serializers
+    are covered through their child.
+    """
+
+    def to_representation(self, instance):
+        with serialize_timer(self.context.get('request')):
+            return super().to_representation(instance)
@@ -11,8 +11,10 @@ https://docs.djangoproject.com/en/3.2/ref/settings/
 """
 
 from pathlib import Path
+import importlib.util
 import os
 import dj_database_url
+from django.core.exceptions import ImproperlyConfigured
 
 
 # Build paths inside the project like this: BASE_DIR / 'subdir'.
@@ -70,11 +72,15 @@ INSTALLED_APPS = [
     'flag',
     'tag',
     'rating',
-    'bookmark'
+    'bookmark',
+
+    'lazydog_api',
 
 ]
 
 MIDDLEWARE = [
+    # Per-view query count and latency metrics, see REQUEST_METRICS_* below.
+    'lazydog_api.middleware.RequestMetricsMiddleware',
     'django.middleware.security.SecurityMiddleware',
     'django.contrib.sessions.middleware.SessionMiddleware',
     'django.middleware.common.CommonMiddleware',
@@ -123,10 +129,93 @@ elif os.getenv("GITHUB_WORKFLOW"):  # Detect if running in GitHub Actions
         }
     }
 else:  # Use PostgreSQL in production
+    # Persistent connections: a connection is reused for up to
+    # DB_CONN_MAX_AGE seconds instead of being opened for every request,
+    # and checked with a cheap query before reuse so a connection the
+    # server or a proxy dropped meanwhile is replaced transparently.
+    # Under ASGI (lazydog_api/asgi.py sets DJANGO_SERVER_INTERFACE) the
+    # default is 0: sync code runs in a thread per request there, and each
+    # thread would keep its own connection open without ever reusing it.
+    # Use DB_POOL to share connections under ASGI.
+    under_asgi = os.environ.get('DJANGO_SERVER_INTERFACE') == 'asgi'
     DATABASES = {
-        'default': dj_database_url.parse(os.environ.get("DATABASE_URL"))
+        'default': dj_database_url.parse(
+            os.environ.get("DATABASE_URL"),
+            conn_max_age=int(os.environ.get(
+                'DB_CONN_MAX_AGE', 0 if under_asgi else 60
+            )),
+            conn_health_checks=os.environ.get(
+                'DB_CONN_HEALTH_CHECKS', 'true'
+            ).lower() in ('1', 'true', 'yes'),
+        )
     }
 
+    # Optional connection pool (psycopg 3 with psycopg_pool only). The
+    # pool replaces persistent connections, so CONN_MAX_AGE must be 0.
+    if os.environ.get('DB_POOL', '').lower() in ('1', 'true', 'yes'):
+        if importlib.util.find_spec('psycopg_pool') is None:
+            raise ImproperlyConfigured(
+                'DB_POOL requires the psycopg[pool] package (psycopg 3).'
+            )
+        DATABASES['default']['CONN_MAX_AGE'] = 0
+        DATABASES['default'].setdefault('OPTIONS', {})['pool'] = {
+            'min_size': int(os.environ.get('DB_POOL_MIN_SIZE', 2)),
+            'max_size': int(os.environ.get('DB_POOL_MAX_SIZE', 10)),
+            'timeout': int(os.environ.get('DB_POOL_TIMEOUT', 10)),
+        }
+
+
+# Cache
+# https://docs.djangoproject.com/en/5.1/topics/cache/
+# Local memory by default; point CACHE_BACKEND/CACHE_LOCATION at a shared
+# backend (e.g. django.core.cache.backends.redis.RedisCache) in production.
+
+CACHES = {
+    'default': {
+        'BACKEND': os.environ.get(
+            'CACHE_BACKEND', 'django.core.cache.backends.locmem.LocMemCache'
+        ),
+        'LOCATION': os.environ.get('CACHE_LOCATION', 'lazydog-api'),
+    }
+}
+
+# Cache alias and timeout (seconds) of the versioned list response cache
+# used by the Category and Tag endpoints (see lazydog_api/cache.py).
+API_CACHE_ALIAS = 'default'
+API_CACHE_TIMEOUT = int(os.environ.get('API_CACHE_TIMEOUT', 300))
+
+
+# Request metrics
+# Adds Server-Timing headers and per-view latency percentiles
+# (manage.py slowest_endpoints). Each process publishes its samples to the
+# cache above every REQUEST_METRICS_PUBLISH_INTERVAL seconds.
+
+REQUEST_METRICS_ENABLED = os.environ.get(
+    'REQUEST_METRICS_ENABLED', ''
+).lower() in ('1', 'true', 'yes')
+REQUEST_METRICS_MAX_SAMPLES = int(
+    os.environ.get('REQUEST_METRICS_MAX_SAMPLES', 1000)
+)
+REQUEST_METRICS_PUBLISH_INTERVAL = int(
+    os.environ.get('REQUEST_METRICS_PUBLISH_INTERVAL', 30)
+)
+
+
+# Trending resources
+# Activity loses half its weight every TRENDING_HALF_LIFE_HOURS. The first
+# (or a --rebuild) run of manage.py update_trending counts the last
+# TRENDING_WINDOW_DAYS of activity. Each run stops TRENDING_SETTLE_SECONDS
+# before the current time, so events whose transaction commits later than
+# their created_at are still counted by the next run.
+
+TRENDING_HALF_LIFE_HOURS = float(
+    os.environ.get('TRENDING_HALF_LIFE_HOURS', 24)
+)
+TRENDING_WINDOW_DAYS = int(os.environ.get('TRENDING_WINDOW_DAYS', 14))
+TRENDING_SETTLE_SECONDS = int(
+    os.environ.get('TRENDING_SETTLE_SECONDS', 300)
+)
+
 
 # Password validation
 # https://docs.djangoproject.com/en/3.2/ref/settings/#auth-password-validators
@@ -0,0 +1,98 @@
+"""
+Unit tests for the admin changelists of the large tables.
+
+Covered cases:
+- Every changelist costs the same number of queries for few and many rows
+- The paginator reports the planner's estimate for unfiltered changelists
+  of large tables, and an exact count otherwise
+- Backends without a row estimate always count exactly
+"""
+
+import unittest
+from unittest import mock
+
+from django.contrib.auth.models import User
+from django.db import connection
+from django.test import TestCase
+from django.test.utils import CaptureQueriesContext
+from django.urls import reverse
+
+from bookmark.models import Bookmark
+from comment.models import Comment
+from flag.models import Flag
+from lazydog_api.admin import EstimatedCountPaginator
+from lazydog_api.counts import estimated_row_count
+from rating.models import Rating
+from resource_item.models import ResourceItem
+
+ESTIMATE_PATH = "lazydog_api.admin.estimated_row_count"
+
+
+class LargeTableAdminTest(TestCase):
+    @classmethod
+    def setUpTestData(cls):
+        cls.admin = User.objects.create_superuser(
+            username="admin", password="pw", email="admin@example.com"
+        )
+
+    def setUp(self):
+        self.client.force_login(self.admin)
+
+    def create_rows(self, count):
+        start = ResourceItem.objects.count()
+        for n in range(start, start + count):
+            user = User.objects.create_user(username=f"admin-{n}")
+            item = ResourceItem.objects.create(
+                title=f"Admin {n}",
+                description="Admin changelist",
+                user=user,
+                url=f"https://example.com/admin-{n}",
+            )
+            comment = Comment.objects.create(
+                user=user, resource_item=item, content="Admin comment"
+            )
+            Rating.objects.create(user=user, resource_item=item, score=3)
+            Bookmark.objects.create(user=user, resource=item)
+            Flag.objects.create(user=user, comment=comment, reason="Spam")
+
+    def changelist_queries(self, model):
+        opts = model._meta
+        url = reverse(f"admin:{opts.app_label}_{opts.model_name}_changelist")
+        with CaptureQueriesContext(connection) as queries:
+            response = self.client.get(url)
+        self.assertEqual(response.status_code, 200)
+        return len(queries)
+
+    def test_changelist_query_count_is_constant(self):
+        models = [ResourceItem, Comment, Rating, Bookmark, Flag]
+        self.create_rows(2)
+        few = {model: self.changelist_queries(model) for model in models}
+        self.create_rows(8)
+        many = {model: self.changelist_queries(model) for model in models}
+        self.assertEqual(few, many)
+
+    def test_unfiltered_count_uses_estimate(self):
+        self.create_rows(1)
+        paginator = EstimatedCountPaginator(Rating.objects.all(), 100)
+        with mock.patch(ESTIMATE_PATH, return_value=2_000_000):
+            self.assertEqual(paginator.count, 2_000_000)
+
+    def test_small_or_filtered_count_is_exact(self):
+        self.create_rows(2)
+        with mock.patch(ESTIMATE_PATH, return_value=50):
+            paginator = EstimatedCountPaginator(Rating.objects.all(), 100)
+            self.assertEqual(paginator.count, 2)
+        with mock.patch(ESTIMATE_PATH, return_value=2_000_000):
+            paginator = EstimatedCountPaginator(
+                Rating.objects.filter(score=3), 100
+            )
+            self.assertEqual(paginator.count, 2)
+
+    @unittest.skipIf(
+        connection.vendor == "postgresql", "Backends without reltuples"
+    )
+    def test_no_estimate_without_postgresql(self):
+        self.assertIsNone(estimated_row_count(Rating))
+        self.create_rows(3)
+        paginator = EstimatedCountPaginator(Rating.objects.all(), 100)
+        self.assertEqual(paginator.count, 3)
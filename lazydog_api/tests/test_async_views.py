@@ -0,0 +1,115 @@
+"""
+Unit tests for the async read-only endpoints.
+
+Covered cases:
+- List responses match the sync serializers and carry a total count
+  only when ?count=exact asks for one
+- Keyset pagination with ?limit= and ?before=
+- Filtering by primary key and rejection of malformed parameters, while
+  errors raised past parameter parsing are not turned into a 400
+- Detail responses and 404 for unknown objects
+- Write methods are not allowed
+- Logged-in requests resolve the session user and leave out the per-user
+  fields
+"""
+from unittest import mock
+
+from django.contrib.auth.models import User
+from django.test import TestCase
+from django.urls import reverse
+
+from comment.models import Comment
+from rating.models import Rating
+from resource_item.models import ResourceItem
+from tag.models import Tag
+
+
+class AsyncReadOnlyViewTest(TestCase):
+    @classmethod
+    def setUpTestData(cls):
+        cls.owner = User.objects.create_user(username="owner", password="pw")
+        cls.rater = User.objects.create_user(username="rater", password="pw")
+        cls.tag = Tag.objects.create(name="async")
+        cls.items = []
+        for n in range(5):
+            item = ResourceItem.objects.create(
+                title=f"Async {n}",
+                user=cls.owner,
+                url=f"https://example.com/async-{n}",
+            )
+            item.tags.set([cls.tag])
+            cls.items.append(item)
+        Comment.objects.create(
+            user=cls.rater, resource_item=cls.items[0], content="Async"
+        )
+        Rating.objects.create(
+            user=cls.rater, resource_item=cls.items[1], score=4
+        )
+        cls.list_url = reverse("async-resourceitem-list")
+
+    async def test_list_is_paginated_newest_first(self):
+        response = await self.async_client.get(self.list_url, {"limit": 3})
+        self.assertEqual(response.status_code, 200)
+        data = response.json()
+        self.assertNotIn("count", data)
+        self.assertEqual(
+            [item["id"] for item in data["results"]],
+            [item.pk for item in self.items[:1:-1]],
+        )
+        self.assertEqual(data["results"][0]["tags"], [self.tag.pk])
+
+        response = await self.async_client.get(
+            self.list_url, {"limit": 3, "before": data["next_before"]}
+        )
+        data = response.json()
+        self.assertEqual(
+            [item["id"] for item in data["results"]],
+            [self.items[1].pk, self.items[0].pk],
+        )
+        self.assertIsNone(data["next_before"])
+
+    async def test_filters_and_bad_parameters(self):
+        response = await self.async_client.get(
+            reverse("async-comment-list"),
+            {"resource_item": self.items[0].pk, "count": "exact"},
+        )
+        self.assertEqual(response.json()["count"], 1)
+
+        response = await self.async_client.get(
+            reverse("async-rating-list"), {"user": "abc"}
+        )
+        self.assertEqual(response.status_code, 400)
+
+    async def test_internal_value_errors_are_not_bad_requests(self):
+        with mock.patch(
+            "lazydog_api.async_views.AsyncReadOnlyView.get_serializer",
+            side_effect=ValueError("broken"),
+        ), self.assertRaisesMessage(ValueError, "broken"):
+            await self.async_client.get(self.list_url)
+
+    async def test_detail(self):
+        response = await self.async_client.get(
+            reverse("async-resourceitem-detail", args=[self.items[2].pk])
+        )
+        self.assertEqual(response.json()["title"], "Async 2")
+
+        response = await self.async_client.get(
+            reverse("async-rating-detail", args=[999999])
+        )
+        self.assertEqual(response.status_code, 404)
+
+    async def test_logged_in_requests(self):
+        await self.async_client.aforce_login(self.rater)
+        response = await self.async_client.get(self.list_url)
+        self.assertEqual(response.status_code, 200)
+        self.assertNotIn("my_rating", response.json()["results"][0])
+
+        response = await self.async_client.get(
+            reverse("async-resourceitem-detail", args=[self.items[1].pk])
+        )
+        self.assertEqual(response.status_code, 200)
+        self.assertNotIn("is_bookmarked", response.json())
+
+    async def test_writes_are_not_allowed(self):
+        response = await self.async_client.post(self.list_url, {})
+        self.assertEqual(response.status_code, 405)
@@ -0,0 +1,113 @@
+"""
+Unit tests for EstimatedCountPagination, on the Rating list endpoint.
+
+Covered cases:
+- Unpaginated list when the client does not opt in
+- Walking through all pages without gaps or duplicates
+- Exact count from the last page without a COUNT query
+- Capped "lower_bound" count for long filtered lists
+- Planner estimate for unfiltered lists of large tables
+- ?count=exact escape hatch
+- Invalid page numbers are rejected
+"""
+
+from unittest import mock
+
+from django.contrib.auth.models import User
+from django.db import connection
+from django.test.utils import CaptureQueriesContext
+from django.urls import reverse
+from rest_framework import status
+from rest_framework.test import APITestCase
+
+from lazydog_api.pagination import EstimatedCountPagination
+from rating.models import Rating
+from resource_item.models import ResourceItem
+
+ESTIMATE_PATH = "lazydog_api.pagination.estimated_row_count"
+
+
+class EstimatedCountPaginationTest(APITestCase):
+    @classmethod
+    def setUpTestData(cls):
+        """Rate one resource by seven users (created_at values collide)."""
+        owner = User.objects.create_user(username="owner", password="pw")
+        cls.item = ResourceItem.objects.create(
+            title="Rated",
+            description="Rated a lot",
+            user=owner,
+            url="https://example.com/paged",
+        )
+        cls.ratings = [
+            Rating.objects.create(
+                user=User.objects.create_user(username=f"rater-{n}"),
+                resource_item=cls.item,
+                score=n % 5 + 1,
+            )
+            for n in range(7)
+        ]
+        Rating.objects.update(created_at=cls.ratings[0].created_at)
+        cls.list_url = reverse("rating-list")
+
+    def test_unpaginated_by_default(self):
+        response = self.client.get(self.list_url)
+        self.assertIsInstance(response.data, list)
+        self.assertEqual(len(response.data), 7)
+
+    def test_pages_cover_every_row_once(self):
+        seen, url = [], self.list_url + "?page_size=3"
+        while url:
+            response = self.client.get(url)
+            self.assertEqual(response.status_code, status.HTTP_200_OK)
+            seen.extend(rating["id"] for rating in response.data["results"])
+            url = response.data["next"]
+        self.assertEqual(
+            sorted(seen), sorted(rating.pk for rating in self.ratings)
+        )
+
+    def test_last_page_count_is_exact_without_count_query(self):
+        with CaptureQueriesContext(connection) as queries:
+            response = self.client.get(
+                self.list_url, {"page": 3, "page_size": 3}
+            )
+        self.assertEqual(response.data["count"], 7)
+        self.assertEqual(response.data["count_type"], "exact")
+        self.assertIsNone(response.data["next"])
+        self.assertEqual(len(queries), 1)
+
+    def test_small_filtered_count_is_exact(self):
+        response = self.client.get(
+            self.list_url, {"page_size": 2, "resource_item": self.item.pk}
+        )
+        self.assertEqual(response.data["count"], 7)
+        self.assertEqual(response.data["count_type"], "exact")
+
+    def test_long_filtered_count_is_capped(self):
+        with mock.patch.object(EstimatedCountPagination, "count_cap", 4):
+            response = self.client.get(
+                self.list_url,
+                {"page_size": 2, "resource_item": self.item.pk},
+            )
+            self.assertEqual(response.data["count"], 4)
+            self.assertEqual(response.data["count_type"], "lower_bound")
+
+            response = self.client.get(
+                self.list_url,
+                {"page_size": 2, "resource_item": self.item.pk,
+                 "count": "exact"},
+            )
+            self.assertEqual(response.data["count"], 7)
+            self.assertEqual(response.data["count_type"], "exact")
+
+    def test_unfiltered_count_uses_estimate(self):
+        with mock.patch(ESTIMATE_PATH, return_value=5_000_000):
+            response = self.client.get(self.list_url, {"page_size": 2})
+        self.assertEqual(response.data["count"], 5_000_000)
+        self.assertEqual(response.data["count_type"], "estimate")
+
+    def test_invalid_page_is_rejected(self):
+        for page in ("0", "x", "9"):
+            response = self.client.get(
+                self.list_url, {"page": page, "page_size": 3}
+            )
+            self.assertEqual(response.status_code, status.HTTP_404_NOT_FOUND)
@@ -0,0 +1,115 @@
+"""
+Unit tests for RequestMetricsMiddleware and the metrics registry.
+
+Covered cases:
+- Middleware is disabled unless REQUEST_METRICS_ENABLED is set
+- Server-Timing header with query count, db, serialize, render and total
+  timings; serialize covers building serializer.data
+- Samples are recorded per view and summarized into percentiles
+- The slowest_endpoints management command
+"""
+import re
+import time
+from io import StringIO
+from unittest import mock
+
+from django.contrib.auth.models import User
+from django.core.cache import cache
+from django.core.management import call_command
+from django.test import override_settings
+from django.urls import reverse
+from rest_framework import serializers
+from rest_framework.test import APITestCase
+
+from lazydog_api.metrics import percentile, registry, summarize
+from resource_item.models import ResourceItem
+
+
+class RequestMetricsDisabledTest(APITestCase):
+    def test_no_header_when_disabled(self):
+        response = self.client.get(reverse("resourceitem-list"))
+        self.assertNotIn("Server-Timing", response)
+
+
+@override_settings(REQUEST_METRICS_ENABLED=True)
+class RequestMetricsMiddlewareTest(APITestCase):
+    @classmethod
+    def setUpTestData(cls):
+        user = User.objects.create_user(username="owner", password="pw")
+        ResourceItem.objects.create(
+            title="Measured",
+            description="Instrumented resource",
+            user=user,
+            url="https://example.com/measured"
+        )
+
+    def setUp(self):
+        cache.clear()
+        registry.reset()
+
+    def test_server_timing_header(self):
+        response = self.client.get(reverse("resourceitem-list"))
+        timing = response["Server-Timing"]
+        self.assertIn('db;dur=', timing)
+        self.assertIn('desc="3 queries"', timing)
+        self.assertIn('render;dur=', timing)
+        self.assertIn('total;dur=', timing)
+
+    def test_serialize_timing_covers_serializer_data(self):
+        original = serializers.Serializer.to_representation
+
+        def slow_representation(serializer, instance):
+            time.sleep(0.05)
+            return original(serializer, instance)
+
+        with mock.patch.object(
+            serializers.Serializer, "to_representation", slow_representation
+        ):
+            response = self.client.get(reverse("resourceitem-list"))
+        timings = dict(
+            re.match(r"(\w+);dur=([\d.]+)", entry.strip()).groups()
+            for entry in response["Server-Timing"].split(",")
+        )
+        self.assertGreaterEqual(float(timings["serialize"]), 50)
+        self.assertLess(float(timings["render"]), 50)
+        self.assertLessEqual(
+            float(timings["serialize"]), float(timings["total"])
+        )
+        summary = registry.summary()["GET resourceitem-list"]
+        self.assertGreaterEqual(summary["serialize"], 50)
+
+    def test_samples_recorded_per_view(self):
+        for _ in range(3):
+            self.client.get(reverse("resourceitem-list"))
+        self.client.get(reverse("tag-list"))
+        summary = registry.summary()
+        self.assertEqual(summary["GET resourceitem-list"]["count"], 3)
+        self.assertEqual(summary["GET resourceitem-list"]["queries"], 3)
+        self.assertEqual(summary["GET tag-list"]["count"], 1)
+
+    def test_slowest_endpoints_command(self):
+        self.client.get(reverse("resourceitem-list"))
+        registry.publish()
+        out = StringIO()
+        call_command("slowest_endpoints", "--sort", "queries", stdout=out)
+        self.assertIn("GET resourceitem-list", out.getvalue())
+
+
+class MetricsSummaryTest(APITestCase):
+    def test_percentile_nearest_rank(self):
+        values = list(range(1, 101))
+        self.assertEqual(percentile(values, 50), 50)
+        self.assertEqual(percentile(values, 99), 99)
+        self.assertEqual(percentile([], 95), 0.0)
+
+    def test_summarize(self):
+        stats = summarize(
+            [(10.0, 2.0, 4, 1.0, 5.0), (30.0, 6.0, 2, 3.0, 7.0)]
+        )
+        self.assertEqual(stats["count"], 2)
+        self.assertEqual(stats["p50"], 10.0)
+        self.assertEqual(stats["p99"], 30.0)
+        self.assertEqual(stats["queries"], 3)
+        self.assertEqual(stats["db"], 4.0)
+        self.assertEqual(stats["render"], 2.0)
+        self.assertEqual(stats["serialize"], 6.0)
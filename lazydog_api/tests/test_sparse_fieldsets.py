@@ -0,0 +1,112 @@
+"""
+Unit tests for sparse fieldsets (?fields= / ?omit=).
+
+Covered cases:
+- Only the requested fields are rendered, unknown names are ignored
+- ?omit= drops fields from list and detail responses
+- Unrequested text columns are not selected and unused prefetches are
+  skipped
+- Write requests ignore the parameters
+"""
+
+from django.contrib.auth.models import User
+from django.db import connection
+from django.test.utils import CaptureQueriesContext
+from django.urls import reverse
+from rest_framework import status
+from rest_framework.test import APITestCase
+
+from category.models import Category
+from comment.models import Comment
+from flag.models import Flag
+from resource_item.models import ResourceItem
+from tag.models import Tag
+
+
+class SparseFieldsetTest(APITestCase):
+    @classmethod
+    def setUpTestData(cls):
+        cls.user = User.objects.create_user(username="sparse", password="pw")
+        cls.category = Category.objects.create(name="Sparse")
+        cls.item = ResourceItem.objects.create(
+            title="Sparse",
+            description="A long description nobody asked for",
+            user=cls.user,
+            category=cls.category,
+            url="https://example.com/sparse",
+        )
+        cls.item.tags.set([Tag.objects.create(name="sparse")])
+        cls.comment = Comment.objects.create(
+            user=cls.user, resource_item=cls.item, content="Long comment"
+        )
+        Flag.objects.create(
+            user=cls.user, resource=cls.item, reason="Long reason"
+        )
+        cls.list_url = reverse("resourceitem-list")
+        cls.detail_url = reverse("resourceitem-detail", args=[cls.item.pk])
+
+    def get_with_queries(self, url, params):
+        with CaptureQueriesContext(connection) as queries:
+            response = self.client.get(url, params)
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        return response, " ".join(q["sql"] for q in queries.captured_queries)
+
+    def test_fields_limits_rendered_fields(self):
+        response = self.client.get(
+            self.list_url, {"fields": "id,title,url,unknown"}
+        )
+        self.assertEqual(
+            set(response.data[0]), {"id", "title", "url"}
+        )
+
+    def test_omit_drops_fields(self):
+        for url in (self.list_url, self.detail_url):
+            data = self.client.get(url, {"omit": "description,tags"}).data
+            item = data[0] if isinstance(data, list) else data
+            self.assertNotIn("description", item)
+            self.assertNotIn("tags", item)
+            self.assertIn("title", item)
+
+    def test_unrequested_columns_are_not_loaded(self):
+        """
+        The description column is never selected and the tag prefetch
+        is skipped when tags are not requested.
+        """
+        response, sql = self.get_with_queries(
+            self.list_url, {"fields": "id,title,url"}
+        )
+        self.assertEqual(response.data[0]["title"], "Sparse")
+        self.assertNotIn('"resource_item_resourceitem"."description"', sql)
+        self.assertNotIn("resource_item_resourceitem_tags", sql)
+
+    def test_requested_relations_are_still_loaded(self):
+        response, sql = self.get_with_queries(
+            self.list_url, {"fields": "id,category,tags"}
+        )
+        self.assertEqual(response.data[0]["category"], self.category.pk)
+        self.assertEqual(len(response.data[0]["tags"]), 1)
+        self.assertNotIn('"resource_item_resourceitem"."description"', sql)
+
+    def test_comment_content_is_not_loaded(self):
+        response, sql = self.get_with_queries(
+            reverse("comment-list"), {"fields": "id,resource_item"}
+        )
+        self.assertEqual(set(response.data[0]), {"id", "resource_item"})
+        self.assertNotIn('"comment_comment"."content"', sql)
+
+    def test_flag_reason_is_not_loaded(self):
+        self.client.force_authenticate(self.user)
+        response, sql = self.get_with_queries(
+            reverse("flag-list"), {"omit": "reason"}
+        )
+        self.assertNotIn("reason", response.data[0])
+        self.assertNotIn('"flag_flag"."reason"', sql)
+
+    def test_write_requests_ignore_sparse_parameters(self):
+        self.client.force_authenticate(self.user)
+        response = self.client.patch(
+            f"{self.detail_url}?fields=id", {"title": "Renamed"}
+        )
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertEqual(response.data["title"], "Renamed")
+        self.assertIn("description", response.data)
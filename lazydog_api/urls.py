@@ -18,6 +18,10 @@ from django.urls import path, include
 from django.contrib.auth.models import User
 from rest_framework import routers, serializers, viewsets
 
+from comment.views import AsyncCommentView
+from rating.views import AsyncRatingView
+from resource_item.views import AsyncResourceItemView
+
 
 class UserSerializer(serializers.HyperlinkedModelSerializer):
     class Meta:
@@ -44,4 +48,17 @@ urlpatterns = [
     path('api/v1/resources/', include('resource_item.urls')),
     path('api/v1/tags/', include('tag.urls')),
     path('api/v1/bookmark/', include('bookmark.urls')),
+    # Async read-only endpoints, meant to be served through asgi.py.
+    path('api/v1/async/resources/', AsyncResourceItemView.as_view(),
+         name='async-resourceitem-list'),
+    path('api/v1/async/resources/<int:pk>/', AsyncResourceItemView.as_view(),
+         name='async-resourceitem-detail'),
+    path('api/v1/async/comments/', AsyncCommentView.as_view(),
+         name='async-comment-list'),
+    path('api/v1/async/comments/<int:pk>/', AsyncCommentView.as_view(),
+         name='async-comment-detail'),
+    path('api/v1/async/ratings/', AsyncRatingView.as_view(),
+         name='async-rating-list'),
+    path('api/v1/async/ratings/<int:pk>/', AsyncRatingView.as_view(),
+         name='async-rating-detail'),
 ]
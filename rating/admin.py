@@ -1,12 +1,15 @@
 from django.contrib import admin
+from lazydog_api.admin import LargeTableAdminMixin
 from .models import Rating
 
 
 @admin.register(Rating)
-class RatingAdmin(admin.ModelAdmin):
+class RatingAdmin(LargeTableAdminMixin, admin.ModelAdmin):
     list_display = ('user', 'resource_item', 'score', 'created_at')
+    list_select_related = ('user', 'resource_item')
     search_fields = ('user__username', 'resource_item__title')
     list_filter = ('score', 'created_at')
     ordering = ('-created_at',)
     readonly_fields = ('created_at', 'updated_at')
     date_hierarchy = 'created_at'
+    raw_id_fields = ('user', 'resource_item')
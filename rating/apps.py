@@ -4,3 +4,7 @@ from django.apps import AppConfig
 class RatingConfig(AppConfig):
     default_auto_field = "django.db.models.BigAutoField"
     name = "rating"
+
+    def ready(self):
+        # Register the signal handlers that maintain the rating aggregates.
+        from . import signals  # noqa: F401
@@ -0,0 +1,116 @@
+from django.core.management.base import BaseCommand, CommandError
+from django.db import transaction
+from django.db.models import Count, Q, Sum
+from django.utils import timezone
+
+from rating.models import Rating
+from resource_item.models import RATING_HISTOGRAM_FIELDS, ResourceItem
+
+AGGREGATE_FIELDS = [
+    "rating_count", "rating_sum", *RATING_HISTOGRAM_FIELDS.values()
+]
+
+
+class Command(BaseCommand):
+    """
+    Recompute ResourceItem.rating_count / rating_sum and the per-score
+    histogram counters from the Rating table.
+
+    Resource items are processed in chunks of --batch-size. Each chunk's
+    rows are locked with SELECT ... FOR UPDATE before its true values are
+    computed with one grouped aggregate query, so a rating written
+    meanwhile either is counted or applies its delta after the chunk's
+    correction, never lost. Drifted rows are reported and, unless --check
+    is given, corrected with one bulk_update per chunk. Also used to
+    backfill the histogram.
+    """
+    help = "Rebuild the denormalized rating aggregates on resource items."
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            "--check",
+            action="store_true",
+            help="Only report drift; exit with an error if any is found.",
+        )
+        parser.add_argument(
+            "--batch-size",
+            type=int,
+            default=1000,
+            help="Number of resource items checked and written per batch.",
+        )
+
+    def handle(self, *args, **options):
+        drifted = 0
+        last_id = 0
+        while True:
+            ids = list(ResourceItem.objects.filter(
+                id__gt=last_id
+            ).order_by("id").values_list("id", flat=True)[
+                :options["batch_size"]
+            ])
+            if not ids:
+                break
+            last_id = ids[-1]
+            with transaction.atomic():
+                drifted += self.rebuild_chunk(ids, options["check"])
+
+        if options["check"]:
+            if drifted:
+                raise CommandError(
+                    f"{drifted} resource item(s) have drifted "
+                    "rating aggregates."
+                )
+            self.stdout.write(self.style.SUCCESS("No drift found."))
+            return
+
+        self.stdout.write(self.style.SUCCESS(
+            f"Rebuilt rating aggregates for {drifted} resource item(s)."
+        ))
+
+    def rebuild_chunk(self, ids, check):
+        """
+        Compare and, unless `check`, correct the resource items `ids`.
+        Must run inside a transaction. Returns the number of drifted rows.
+        """
+        items = ResourceItem.objects.filter(id__in=ids).only(
+            "id", "changed_at", *AGGREGATE_FIELDS
+        ).order_by("id")
+        if not check:
+            items = items.select_for_update()
+        items = list(items)
+
+        per_score = {
+            field: Count("id", filter=Q(score=score))
+            for score, field in RATING_HISTOGRAM_FIELDS.items()
+        }
+        expected = {
+            row["resource_item"]: tuple(row[f] for f in AGGREGATE_FIELDS)
+            for row in Rating.objects.filter(
+                resource_item__in=ids
+            ).order_by().values("resource_item").annotate(
+                rating_count=Count("id"), rating_sum=Sum("score"), **per_score
+            )
+        }
+        empty = (0,) * len(AGGREGATE_FIELDS)
+
+        drifted = []
+        now = timezone.now()
+        for item in items:
+            actual = expected.get(item.pk, empty)
+            stored = tuple(getattr(item, f) for f in AGGREGATE_FIELDS)
+            if stored != actual:
+                self.stdout.write(
+                    f"Resource {item.pk}: stored "
+                    f"{'/'.join(map(str, stored))}, "
+                    f"actual {'/'.join(map(str, actual))}"
+                )
+                for field, value in zip(AGGREGATE_FIELDS, actual):
+                    setattr(item, field, value)
+                item.changed_at = now
+                drifted.append(item)
+
+        if drifted and not check:
+            ResourceItem.objects.bulk_update(
+                drifted, [*AGGREGATE_FIELDS, "changed_at"]
+            )
+        return len(drifted)
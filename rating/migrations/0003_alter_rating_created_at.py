@@ -0,0 +1,18 @@
+# Generated by Django 5.1.9 on 2026-10-17 23:25
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('rating', '0002_rating_item_user_created_idx'),
+    ]
+
+    operations = [
+        migrations.AlterField(
+            model_name='rating',
+            name='created_at',
+            field=models.DateTimeField(auto_now_add=True, db_index=True),
+        ),
+    ]
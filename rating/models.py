@@ -1,4 +1,4 @@
-from django.db import models
+from django.db import models, transaction
 from django.contrib.auth.models import User
 from resource_item.models import ResourceItem
 from django.core.exceptions import ValidationError
@@ -17,18 +17,19 @@ class Rating(models.Model):
         (5, '5 stars'),
     ]
 
-    user = models.ForeignKey(User, on_delete=models.CASCADE, db_index=True)
+    user = models.ForeignKey(User, on_delete=models.CASCADE, db_index=False)
     resource_item = models.ForeignKey(
         ResourceItem,
         on_delete=models.CASCADE,
         related_name='ratings',
-        db_index=True
+        db_index=False
     )
     score = models.PositiveSmallIntegerField(
         choices=SCORE_CHOICES,
         default=1
     )
-    created_at = models.DateTimeField(auto_now_add=True)
+    # Indexed for the admin's date hierarchy and newest-first ordering.
+    created_at = models.DateTimeField(auto_now_add=True, db_index=True)
     updated_at = models.DateTimeField(auto_now=True)
 
     class Meta:
@@ -40,8 +41,42 @@ class Rating(models.Model):
                 name='unique_rating_per_user_item'
             )
         ]
+        # One index per filterable column, in the list's default order.
+        # They also cover the plain foreign key lookups.
+        indexes = [
+            models.Index(
+                fields=['resource_item', '-created_at'],
+                name='rating_item_created_idx',
+            ),
+            models.Index(
+                fields=['user', '-created_at'],
+                name='rating_user_created_idx',
+            ),
+        ]
         ordering = ['-created_at']
 
+    @classmethod
+    def from_db(cls, db, field_names, values):
+        """
+        Remember the loaded score and resource item so the aggregate
+        signal handlers can apply the right delta when the rating changes.
+        """
+        instance = super().from_db(db, field_names, values)
+        instance._loaded_values = dict(zip(field_names, values))
+        return instance
+
+    def save(self, *args, **kwargs):
+        """
+        Save the rating and update the resource aggregates in the same
+        transaction (see rating.signals).
+        """
+        with transaction.atomic(using=kwargs.get('using')):
+            super().save(*args, **kwargs)
+        self._loaded_values = {
+            'resource_item_id': self.resource_item_id,
+            'score': self.score,
+        }
+
     def clean(self):
         if not (1 <= self.score <= 5):
             raise ValidationError('Score must be between 1 and 5.')
@@ -1,9 +1,13 @@
 from rest_framework import serializers
 from rest_framework.exceptions import ValidationError
 from .models import Rating
+from lazydog_api.serializers import (
+    SparseFieldsetSerializerMixin, TimedSerializerMixin,
+)
 
 
-class RatingSerializer(serializers.ModelSerializer):
+class RatingSerializer(TimedSerializerMixin, SparseFieldsetSerializerMixin,
+                       serializers.ModelSerializer):
     """
     Serializer for the Rating model.
     Handles validation of ratings and ensures
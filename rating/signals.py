@@ -0,0 +1,73 @@
+"""
+Keep ResourceItem.rating_count / rating_sum and the per-score histogram
+counters in step with the Rating table.
+
+The handlers run for every write path that goes through the model layer:
+RatingSerializer, RatingViewSet, the admin (including bulk delete actions)
+and cascades from deleted users or resources.
+"""
+from django.db.models.signals import post_delete, post_save, pre_save
+from django.dispatch import receiver
+
+from resource_item.models import ResourceItem
+from .models import Rating
+
+
+@receiver(pre_save, sender=Rating)
+def remember_previous_rating(sender, instance, **kwargs):
+    """
+    Record the score and resource the rating had before this save.
+    Instances loaded from the database already carry these values, so the
+    extra lookup only happens for hand-built instances with a primary key.
+    """
+    previous = getattr(instance, '_loaded_values', None)
+    if instance.pk is None or instance._state.adding:
+        instance._previous_rating = None
+    elif previous and {'score', 'resource_item_id'} <= previous.keys():
+        instance._previous_rating = (
+            previous['resource_item_id'], previous['score']
+        )
+    else:
+        instance._previous_rating = Rating.objects.filter(
+            pk=instance.pk
+        ).values_list('resource_item_id', 'score').first()
+
+
+@receiver(post_save, sender=Rating)
+def add_rating_to_aggregates(sender, instance, created, **kwargs):
+    previous = getattr(instance, '_previous_rating', None)
+    if created or previous is None:
+        ResourceItem.apply_rating_delta(
+            instance.resource_item_id, 1, instance.score, {instance.score: 1}
+        )
+        return
+
+    old_resource_id, old_score = previous
+    if old_resource_id == instance.resource_item_id:
+        # A new score moves one count from the old bucket to the new one.
+        ResourceItem.apply_rating_delta(
+            instance.resource_item_id,
+            0,
+            instance.score - old_score,
+            {old_score: -1, instance.score: 1}
+            if old_score != instance.score else None,
+        )
+    else:
+        ResourceItem.apply_rating_delta(
+            old_resource_id, -1, -old_score, {old_score: -1}
+        )
+        ResourceItem.apply_rating_delta(
+            instance.resource_item_id, 1, instance.score, {instance.score: 1}
+        )
+
+
+@receiver(post_delete, sender=Rating)
+def remove_rating_from_aggregates(sender, instance, **kwargs):
+    loaded = getattr(instance, '_loaded_values', None) or {}
+    score = loaded.get('score', instance.score)
+    ResourceItem.apply_rating_delta(
+        loaded.get('resource_item_id', instance.resource_item_id),
+        -1,
+        -score,
+        {score: -1},
+    )
@@ -1,3 +1,269 @@
-from django.test import TestCase
+"""
+Unit tests for the denormalized rating aggregates on ResourceItem.
 
-# Create your tests here.
+Covers:
+- Aggregates follow ratings created, updated and deleted through the API
+- Moving a rating to another resource
+- Bulk (queryset) deletion as used by the admin
+- Ordering resources by rating_avg
+- The rebuild_rating_aggregates management command, chunk by chunk with
+  the resource rows locked
+- Per-score histogram counters: a score change moves one count between
+  buckets, the summary endpoint reads one row, ?expand=rating_histogram
+  embeds the histogram and the rebuild command repairs it
+"""
+from io import StringIO
+
+from django.contrib.auth.models import User
+from django.core.management import call_command
+from django.core.management.base import CommandError
+from django.db import connection
+from django.test.utils import CaptureQueriesContext
+from django.urls import reverse
+from rest_framework import status
+from rest_framework.test import APITestCase
+
+from rating.models import Rating
+from resource_item.models import RATING_HISTOGRAM_FIELDS, ResourceItem
+
+
+class RatingAggregateTest(APITestCase):
+    @classmethod
+    def setUpTestData(cls):
+        cls.owner = User.objects.create_user(
+            username="owner", password="testpassword"
+        )
+        cls.rater1 = User.objects.create_user(
+            username="rater1", password="testpassword"
+        )
+        cls.rater2 = User.objects.create_user(
+            username="rater2", password="testpassword"
+        )
+        cls.resource1 = ResourceItem.objects.create(
+            title="Resource 1",
+            user=cls.owner,
+            url="https://example.com/rated-1"
+        )
+        cls.resource2 = ResourceItem.objects.create(
+            title="Resource 2",
+            user=cls.owner,
+            url="https://example.com/rated-2"
+        )
+        cls.list_url = reverse("rating-list")
+
+    def assertAggregates(self, resource, count, total):
+        resource.refresh_from_db()
+        self.assertEqual(resource.rating_count, count)
+        self.assertEqual(resource.rating_sum, total)
+        self.assertAlmostEqual(
+            resource.rating_avg, total / count if count else 0.0
+        )
+
+    def test_create_update_delete_through_api(self):
+        """Aggregates follow every API write on a rating."""
+        self.client.login(username="rater1", password="testpassword")
+        response = self.client.post(self.list_url, {
+            "resource_item": self.resource1.pk, "score": 4
+        })
+        self.assertEqual(response.status_code, status.HTTP_201_CREATED)
+        self.assertAggregates(self.resource1, 1, 4)
+
+        detail_url = reverse("rating-detail", args=[response.data["id"]])
+        response = self.client.patch(detail_url, {
+            "resource_item": self.resource1.pk, "score": 2
+        })
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertAggregates(self.resource1, 1, 2)
+
+        response = self.client.delete(detail_url)
+        self.assertEqual(response.status_code, status.HTTP_204_NO_CONTENT)
+        self.assertAggregates(self.resource1, 0, 0)
+
+    def test_moving_rating_between_resources(self):
+        """Changing resource_item moves the score to the new resource."""
+        rating = Rating.objects.create(
+            user=self.rater1, resource_item=self.resource1, score=5
+        )
+        rating = Rating.objects.get(pk=rating.pk)
+        rating.resource_item = self.resource2
+        rating.save()
+        self.assertAggregates(self.resource1, 0, 0)
+        self.assertAggregates(self.resource2, 1, 5)
+
+    def test_queryset_delete(self):
+        """Bulk deletes, as done by the admin action, are subtracted."""
+        Rating.objects.create(
+            user=self.rater1, resource_item=self.resource1, score=3
+        )
+        Rating.objects.create(
+            user=self.rater2, resource_item=self.resource1, score=5
+        )
+        self.assertAggregates(self.resource1, 2, 8)
+        Rating.objects.filter(user=self.rater1).delete()
+        self.assertAggregates(self.resource1, 1, 5)
+
+    def test_order_resources_by_rating_avg(self):
+        """?ordering=-rating_avg lists the best rated resource first."""
+        Rating.objects.create(
+            user=self.rater1, resource_item=self.resource1, score=2
+        )
+        Rating.objects.create(
+            user=self.rater1, resource_item=self.resource2, score=5
+        )
+        response = self.client.get(
+            reverse("resourceitem-list"), {"ordering": "-rating_avg"}
+        )
+        self.assertEqual(
+            [item["id"] for item in response.data],
+            [self.resource2.pk, self.resource1.pk]
+        )
+        self.assertEqual(response.data[0]["rating_avg"], 5.0)
+        self.assertEqual(response.data[0]["rating_count"], 1)
+
+    def test_rebuild_command_fixes_drift(self):
+        """The command reports drift with --check and repairs it."""
+        Rating.objects.create(
+            user=self.rater1, resource_item=self.resource1, score=4
+        )
+        ResourceItem.objects.filter(pk=self.resource1.pk).update(
+            rating_count=7, rating_sum=1
+        )
+        with self.assertRaises(CommandError):
+            call_command(
+                "rebuild_rating_aggregates", "--check", stdout=StringIO()
+            )
+        call_command("rebuild_rating_aggregates", stdout=StringIO())
+        self.assertAggregates(self.resource1, 1, 4)
+        call_command(
+            "rebuild_rating_aggregates", "--check", stdout=StringIO()
+        )
+
+    def test_rebuild_command_works_in_locked_chunks(self):
+        """Every chunk is corrected; its rows are locked on PostgreSQL."""
+        Rating.objects.create(
+            user=self.rater1, resource_item=self.resource1, score=4
+        )
+        Rating.objects.create(
+            user=self.rater1, resource_item=self.resource2, score=2
+        )
+        ResourceItem.objects.update(rating_count=9, rating_sum=9)
+        with CaptureQueriesContext(connection) as queries:
+            call_command(
+                "rebuild_rating_aggregates", "--batch-size", "1",
+                stdout=StringIO(),
+            )
+        self.assertAggregates(self.resource1, 1, 4)
+        self.assertAggregates(self.resource2, 1, 2)
+        if connection.features.has_select_for_update:
+            locks = [
+                query["sql"] for query in queries.captured_queries
+                if "FOR UPDATE" in query["sql"]
+            ]
+            self.assertEqual(len(locks), 2)
+
+
+class RatingHistogramTest(APITestCase):
+    @classmethod
+    def setUpTestData(cls):
+        cls.owner = User.objects.create_user(username="owner", password="pw")
+        cls.raters = [
+            User.objects.create_user(username=f"rater{n}", password="pw")
+            for n in range(3)
+        ]
+        cls.resource1 = ResourceItem.objects.create(
+            title="Histogram 1",
+            user=cls.owner,
+            url="https://example.com/histogram-1"
+        )
+        cls.resource2 = ResourceItem.objects.create(
+            title="Histogram 2",
+            user=cls.owner,
+            url="https://example.com/histogram-2"
+        )
+
+    def assertHistogram(self, resource, expected):
+        resource.refresh_from_db()
+        full = {score: 0 for score, _ in Rating.SCORE_CHOICES}
+        full.update(expected)
+        self.assertEqual(resource.rating_histogram, full)
+
+    def test_fields_match_score_choices(self):
+        self.assertEqual(
+            list(RATING_HISTOGRAM_FIELDS),
+            [score for score, _ in Rating.SCORE_CHOICES],
+        )
+
+    def test_counters_follow_create_update_delete(self):
+        rating = Rating.objects.create(
+            user=self.raters[0], resource_item=self.resource1, score=4
+        )
+        Rating.objects.create(
+            user=self.raters[1], resource_item=self.resource1, score=4
+        )
+        self.assertHistogram(self.resource1, {4: 2})
+
+        rating = Rating.objects.get(pk=rating.pk)
+        rating.score = 1
+        rating.save()
+        self.assertHistogram(self.resource1, {1: 1, 4: 1})
+
+        rating.save()
+        self.assertHistogram(self.resource1, {1: 1, 4: 1})
+
+        rating.delete()
+        self.assertHistogram(self.resource1, {4: 1})
+
+    def test_moving_rating_moves_its_count(self):
+        rating = Rating.objects.create(
+            user=self.raters[0], resource_item=self.resource1, score=3
+        )
+        rating = Rating.objects.get(pk=rating.pk)
+        rating.resource_item = self.resource2
+        rating.score = 5
+        rating.save()
+        self.assertHistogram(self.resource1, {})
+        self.assertHistogram(self.resource2, {5: 1})
+
+    def test_summary_endpoint_reads_one_row(self):
+        for rater, score in zip(self.raters, (5, 5, 2)):
+            Rating.objects.create(
+                user=rater, resource_item=self.resource1, score=score
+            )
+        url = reverse("resourceitem-rating-summary", args=[self.resource1.pk])
+        with self.assertNumQueries(1):
+            response = self.client.get(url)
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertEqual(response.data["count"], 3)
+        self.assertEqual(response.data["average"], 4.0)
+        self.assertEqual(
+            response.data["histogram"], {1: 0, 2: 1, 3: 0, 4: 0, 5: 2}
+        )
+
+    def test_summary_of_unknown_resource_is_404(self):
+        url = reverse("resourceitem-rating-summary", args=[9999])
+        self.assertEqual(
+            self.client.get(url).status_code, status.HTTP_404_NOT_FOUND
+        )
+
+    def test_histogram_is_embedded_on_request(self):
+        Rating.objects.create(
+            user=self.raters[0], resource_item=self.resource1, score=3
+        )
+        url = reverse("resourceitem-detail", args=[self.resource1.pk])
+        self.assertNotIn("rating_histogram", self.client.get(url).data)
+        response = self.client.get(url, {"expand": "rating_histogram"})
+        self.assertEqual(response.data["rating_histogram"]["3"], 1)
+
+    def test_rebuild_command_repairs_histogram(self):
+        Rating.objects.create(
+            user=self.raters[0], resource_item=self.resource1, score=2
+        )
+        ResourceItem.objects.filter(pk=self.resource1.pk).update(
+            rating_2_count=0, rating_5_count=4
+        )
+        with self.assertRaises(CommandError):
+            call_command(
+                "rebuild_rating_aggregates", "--check", stdout=StringIO()
+            )
+        call_command("rebuild_rating_aggregates", stdout=StringIO())
+        self.assertHistogram(self.resource1, {2: 1})
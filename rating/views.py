@@ -2,10 +2,13 @@ from django_filters.rest_framework import DjangoFilterBackend
 from rest_framework import viewsets, filters
 from .models import Rating
 from .serializers import RatingSerializer
+from lazydog_api.async_views import AsyncReadOnlyView
+from lazydog_api.mixins import SparseFieldsetMixin
+from lazydog_api.pagination import EstimatedCountPagination
 from lazydog_api.permissions import IsOwnerOrReadOnly
 
 
-class RatingViewSet(viewsets.ModelViewSet):
+class RatingViewSet(SparseFieldsetMixin, viewsets.ModelViewSet):
     """
     API endpoint that allows ratings to be viewed, created, edited, or deleted.
 
@@ -13,6 +16,10 @@ class RatingViewSet(viewsets.ModelViewSet):
     - Filter by resource_item and user
     - Search by resource title
     - Order by created_at
+
+    Pagination:
+    - Opt-in page numbers with ?page= / ?page_size=; the total is
+      estimated or capped unless ?count=exact is given
     """
 
     serializer_class = RatingSerializer
@@ -27,6 +34,16 @@ class RatingViewSet(viewsets.ModelViewSet):
     search_fields = ["resource_item__title"]
     ordering_fields = ["created_at", "score"]
     ordering = ["-created_at"]
+    pagination_class = EstimatedCountPagination
 
     def perform_create(self, serializer):
         serializer.save(user=self.request.user)
+
+
+class AsyncRatingView(AsyncReadOnlyView):
+    """
+    Async read-only rating list and detail for the ASGI application.
+    """
+    queryset = Rating.objects.all()
+    serializer_class = RatingSerializer
+    filter_fields = ["resource_item", "user"]
@@ -1,12 +1,15 @@
 from django.contrib import admin
+from lazydog_api.admin import LargeTableAdminMixin
 from .models import ResourceItem
 
 
 @admin.register(ResourceItem)
-class ResourceItemAdmin(admin.ModelAdmin):
+class ResourceItemAdmin(LargeTableAdminMixin, admin.ModelAdmin):
     list_display = ('title', 'category', 'user', 'created_at')
+    list_select_related = ('category', 'user')
     search_fields = ('title', 'description', 'url')
     list_filter = ('category', 'created_at')
     ordering = ('-created_at',)
     readonly_fields = ('created_at', 'updated_at')
     autocomplete_fields = ('category',)
+    raw_id_fields = ('user',)
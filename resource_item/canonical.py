@@ -0,0 +1,52 @@
+"""
+URL canonicalization used to detect resources that point at the same page.
+
+Two URLs are treated as the same resource when they only differ in
+scheme (http/https), host case, a default port, a trailing slash, the
+fragment, the order of query parameters or tracking parameters such as
+utm_*.
+"""
+import hashlib
+from urllib.parse import parse_qsl, urlencode, urlsplit, urlunsplit
+
+TRACKING_PARAMS = {"fbclid", "gclid", "dclid", "msclkid", "mc_cid", "mc_eid"}
+TRACKING_PREFIXES = ("utm_",)
+DEFAULT_PORTS = {80, 443}
+
+
+def is_tracking_param(name):
+    name = name.lower()
+    return name in TRACKING_PARAMS or name.startswith(TRACKING_PREFIXES)
+
+
+def canonicalize_url(url):
+    """
+    Return the canonical form of `url`.
+    """
+    parts = urlsplit(url.strip())
+    scheme = parts.scheme.lower()
+    if scheme == "http":
+        scheme = "https"
+
+    netloc = (parts.hostname or "").lower()
+    try:
+        port = parts.port
+    except ValueError:
+        port = None
+    if port and port not in DEFAULT_PORTS:
+        netloc = f"{netloc}:{port}"
+
+    path = parts.path.rstrip("/") or "/"
+    query = urlencode(sorted(
+        (name, value)
+        for name, value in parse_qsl(parts.query, keep_blank_values=True)
+        if not is_tracking_param(name)
+    ))
+    return urlunsplit((scheme, netloc, path, query, ""))
+
+
+def url_hash(url):
+    """
+    Fixed-width (64 hex characters) SHA-256 digest of the canonical URL.
+    """
+    return hashlib.sha256(canonicalize_url(url).encode()).hexdigest()
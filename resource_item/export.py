@@ -0,0 +1,82 @@
+"""
+NDJSON export of the resource catalog, shared by the export.ndjson
+endpoint and `manage.py export_resources`.
+
+Rows are read with QuerySet.iterator(), which uses a server-side cursor
+on PostgreSQL, and tags are prefetched once per chunk, so memory use
+depends on the chunk size rather than on the size of the catalog. Each
+line is one resource; the format is the one `manage.py import_resources`
+reads.
+
+ASGI servers read a synchronous iterator to the end before sending the
+first byte, so under ASGI the endpoint streams `aiter_ndjson` instead.
+"""
+import json
+from itertools import islice
+
+from asgiref.sync import sync_to_async
+
+from django.core.serializers.json import DjangoJSONEncoder
+from django.db.models import Count, IntegerField, OuterRef, Prefetch, Subquery
+from django.db.models.functions import Coalesce
+
+from bookmark.models import Bookmark
+from tag.models import Tag
+from .models import ResourceItem
+
+EXPORT_CHUNK_SIZE = 2000
+
+
+def export_queryset():
+    """
+    All resources in primary key order, with everything a row needs.
+    """
+    bookmark_count = Bookmark.objects.filter(
+        resource=OuterRef("pk")
+    ).order_by().values("resource").annotate(count=Count("*")).values("count")
+    return ResourceItem.objects.select_related("category").prefetch_related(
+        Prefetch("tags", queryset=Tag.objects.only("tag_id", "name"))
+    ).annotate(
+        bookmark_count=Coalesce(
+            Subquery(bookmark_count, output_field=IntegerField()), 0
+        )
+    ).defer("search_vector").order_by("id")
+
+
+def export_row(item):
+    return {
+        "id": item.pk,
+        "title": item.title,
+        "description": item.description,
+        "url": item.url,
+        "user": item.user_id,
+        "category": item.category.name if item.category else None,
+        "tags": [tag.name for tag in item.tags.all()],
+        "rating_count": item.rating_count,
+        "rating_sum": item.rating_sum,
+        "rating_avg": item.rating_avg,
+        "bookmark_count": item.bookmark_count,
+        "created_at": item.created_at,
+        "updated_at": item.updated_at,
+    }
+
+
+def iter_ndjson(queryset=None, chunk_size=EXPORT_CHUNK_SIZE):
+    """
+    Yield the export one line (one resource) at a time.
+    """
+    if queryset is None:
+        queryset = export_queryset()
+    for item in queryset.iterator(chunk_size=chunk_size):
+        yield json.dumps(export_row(item), cls=DjangoJSONEncoder) + "\n"
+
+
+async def aiter_ndjson(queryset=None, chunk_size=EXPORT_CHUNK_SIZE):
+    """
+    Async version of iter_ndjson for ASGI responses. The rows are still
+    read by the sync ORM, one chunk of lines per hop to the sync thread.
+    """
+    lines = iter_ndjson(queryset, chunk_size)
+    next_chunk = sync_to_async(lambda: list(islice(lines, chunk_size)))
+    while chunk := await next_chunk():
+        yield "".join(chunk)
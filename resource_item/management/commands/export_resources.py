@@ -0,0 +1,46 @@
+from django.core.management.base import BaseCommand
+
+from resource_item.export import EXPORT_CHUNK_SIZE, iter_ndjson
+
+
+class Command(BaseCommand):
+    """
+    Write every resource as one JSON object per line (NDJSON).
+
+    Rows are streamed in chunks (see resource_item/export.py), so the
+    command runs in constant memory whatever the size of the catalog.
+    """
+    help = "Export all resource items as NDJSON."
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            "--output",
+            "-o",
+            help="File to write to (default: standard output).",
+        )
+        parser.add_argument(
+            "--chunk-size",
+            type=int,
+            default=EXPORT_CHUNK_SIZE,
+            help="Number of rows fetched per database round-trip.",
+        )
+
+    def handle(self, *args, **options):
+        lines = iter_ndjson(chunk_size=options["chunk_size"])
+        if not options["output"]:
+            count = self.write_lines(self.stdout, lines)
+            self.stderr.write(f"Exported {count} resource item(s).")
+            return
+
+        with open(options["output"], "w", encoding="utf-8") as output:
+            count = self.write_lines(output, lines)
+        self.stdout.write(self.style.SUCCESS(
+            f"Exported {count} resource item(s) to {options['output']}."
+        ))
+
+    @staticmethod
+    def write_lines(output, lines):
+        count = 0
+        for count, line in enumerate(lines, start=1):
+            output.write(line)
+        return count
@@ -0,0 +1,54 @@
+from django.core.management.base import BaseCommand, CommandError
+
+from resource_item.canonical import canonicalize_url
+from resource_item.models import ResourceItem
+
+
+class Command(BaseCommand):
+    """
+    List resource items whose URLs canonicalize to the same address.
+
+    All rows are read once, in primary key order, and grouped by canonical
+    URL in memory. Only rows created before the url_hash column existed
+    can still be duplicates; the oldest row of each cluster is listed
+    first and is the one holding the hash.
+    """
+    help = "Report resource items that share a canonical URL."
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            "--check",
+            action="store_true",
+            help="Exit with an error if any duplicates are found.",
+        )
+        parser.add_argument(
+            "--chunk-size",
+            type=int,
+            default=2000,
+            help="Number of rows fetched per database round-trip.",
+        )
+
+    def handle(self, *args, **options):
+        clusters = {}
+        rows = ResourceItem.objects.order_by("id").values_list("id", "url")
+        for pk, url in rows.iterator(chunk_size=options["chunk_size"]):
+            clusters.setdefault(canonicalize_url(url), []).append((pk, url))
+
+        duplicates = {
+            canonical: members for canonical, members in clusters.items()
+            if len(members) > 1
+        }
+        for canonical, members in duplicates.items():
+            self.stdout.write(canonical)
+            for pk, url in members:
+                self.stdout.write(f"  {pk}: {url}")
+
+        if options["check"] and duplicates:
+            raise CommandError(
+                f"{len(duplicates)} canonical URL(s) are used by more than "
+                "one resource item."
+            )
+        self.stdout.write(self.style.SUCCESS(
+            f"Found {len(duplicates)} duplicate cluster(s) "
+            f"({sum(len(m) for m in duplicates.values())} resource items)."
+        ))
@@ -0,0 +1,225 @@
+import json
+import time
+from functools import partial
+from itertools import islice
+
+import validators
+from django.contrib.auth.models import User
+from django.core.management.base import BaseCommand, CommandError
+from django.db import DatabaseError, transaction
+
+from category.models import Category
+from lazydog_api.cache import bump_generation
+from resource_item.canonical import url_hash
+from resource_item.models import ResourceItem
+from tag.models import Tag
+
+REQUIRED_FIELDS = ("title", "url")
+
+
+class Command(BaseCommand):
+    """
+    Import resource items from an NDJSON file, one object per line, in the
+    format written by export_resources: title, url, description, plus the
+    category name and a list of tag names.
+
+    Category and tag names are resolved through in-memory name -> id maps
+    loaded once; missing ones are created once, in bulk, the first time
+    they appear. Every batch of lines is written in its own transaction
+    with bulk_create, so after a failure the import can be resumed with
+    --start-line from the first line of the failed batch. Lines whose
+    canonical URL already exists, or whose title the owner already uses,
+    are skipped, which also makes re-running an import harmless.
+    """
+    help = "Import resource items (with categories and tags) from NDJSON."
+
+    def add_arguments(self, parser):
+        parser.add_argument("path", help="NDJSON file to import.")
+        parser.add_argument(
+            "--user",
+            required=True,
+            help="Username that will own the imported resources.",
+        )
+        parser.add_argument(
+            "--batch-size",
+            type=int,
+            default=500,
+            help="Number of lines written per transaction.",
+        )
+        parser.add_argument(
+            "--start-line",
+            type=int,
+            default=1,
+            help="First line (1-based) to import; use it to resume.",
+        )
+
+    def handle(self, *args, **options):
+        try:
+            self.user = User.objects.get(username=options["user"])
+        except User.DoesNotExist:
+            raise CommandError(f"User {options['user']!r} does not exist.")
+
+        self.categories = dict(Category.objects.values_list("name", "id"))
+        self.tags = dict(Tag.objects.values_list("name", "tag_id"))
+        self.created_names = {"category": 0, "tag": 0}
+
+        start_line = max(options["start_line"], 1)
+        imported = skipped = 0
+        started = time.perf_counter()
+        with open(options["path"], encoding="utf-8") as source:
+            lines = enumerate(source, start=1)
+            for _ in islice(lines, start_line - 1):
+                pass
+            while True:
+                batch = list(islice(lines, options["batch_size"]))
+                if not batch:
+                    break
+                try:
+                    created, duplicates = self.import_batch(batch)
+                except (CommandError, DatabaseError) as error:
+                    raise CommandError(
+                        f"{error} Nothing from line {batch[0][0]} on was "
+                        f"imported; resume with --start-line {batch[0][0]}."
+                    )
+                imported += created
+                skipped += duplicates
+                elapsed = time.perf_counter() - started
+                self.stdout.write(
+                    f"Line {batch[-1][0]}: {imported} imported, {skipped} "
+                    f"skipped ({imported / elapsed:.0f} rows/s)"
+                )
+
+        elapsed = time.perf_counter() - started
+        self.stdout.write(self.style.SUCCESS(
+            f"Imported {imported} resource item(s), skipped {skipped}, "
+            f"created {self.created_names['category']} category(ies) and "
+            f"{self.created_names['tag']} tag(s) in {elapsed:.1f}s "
+            f"({imported / elapsed if elapsed else 0:.0f} rows/s)."
+        ))
+
+    def parse_line(self, number, line):
+        try:
+            row = json.loads(line)
+        except ValueError as error:
+            raise CommandError(f"Line {number}: invalid JSON ({error}).")
+        if not isinstance(row, dict):
+            raise CommandError(f"Line {number}: expected a JSON object.")
+        missing = [field for field in REQUIRED_FIELDS if not row.get(field)]
+        if missing:
+            raise CommandError(
+                f"Line {number}: missing {', '.join(missing)}."
+            )
+        for field in (*REQUIRED_FIELDS, "description"):
+            if not isinstance(row.get(field, ""), (str, type(None))):
+                raise CommandError(f"Line {number}: {field} must be a string.")
+        if not isinstance(row.get("category"), (str, type(None))):
+            raise CommandError(
+                f"Line {number}: category must be a string or null."
+            )
+        tags = row.get("tags")
+        if tags is not None and not (
+            isinstance(tags, list)
+            and all(isinstance(name, str) for name in tags)
+        ):
+            raise CommandError(
+                f"Line {number}: tags must be a list of strings."
+            )
+        # Checked here rather than left to the INSERT, which would fail
+        # the whole batch without naming the line.
+        for field in ("title", "url"):
+            if len(row[field]) > 200:
+                raise CommandError(
+                    f"Line {number}: {field} is longer than 200 characters."
+                )
+        if not validators.url(row["url"]):
+            raise CommandError(f"Line {number}: url is not a valid URL.")
+        description = row.get("description") or ""
+        if len(description) > 500:
+            raise CommandError(
+                f"Line {number}: description is longer than 500 characters."
+            )
+        return row
+
+    def import_batch(self, batch):
+        """
+        Write one batch of (line number, line) pairs. Returns the number of
+        created and skipped rows.
+        """
+        rows = [
+            self.parse_line(number, line)
+            for number, line in batch if line.strip()
+        ]
+        with transaction.atomic():
+            rows, skipped = self.exclude_duplicates(rows)
+            self.create_missing_names(rows)
+            items = ResourceItem.objects.bulk_create([
+                ResourceItem(
+                    title=row["title"],
+                    description=row.get("description") or "",
+                    url=row["url"],
+                    url_hash=row["url_hash"],
+                    user=self.user,
+                    category_id=self.categories.get(row.get("category")),
+                )
+                for row in rows
+            ])
+            ResourceItem.tags.through.objects.bulk_create([
+                ResourceItem.tags.through(
+                    resourceitem_id=item.pk, tag_id=self.tags[name]
+                )
+                for item, row in zip(items, rows)
+                for name in dict.fromkeys(row.get("tags") or ())
+            ])
+        return len(items), skipped
+
+    def exclude_duplicates(self, rows):
+        """
+        Drop rows whose canonical URL exists, or whose title the owner
+        already uses, in the database or earlier in the batch.
+        """
+        for row in rows:
+            row["url_hash"] = url_hash(row["url"])
+        hashes = set(ResourceItem.objects.filter(
+            url_hash__in=[row["url_hash"] for row in rows]
+        ).values_list("url_hash", flat=True))
+        titles = set(ResourceItem.objects.filter(
+            user=self.user, title__in=[row["title"] for row in rows]
+        ).values_list("title", flat=True))
+
+        kept = []
+        for row in rows:
+            if row["url_hash"] in hashes or row["title"] in titles:
+                continue
+            hashes.add(row["url_hash"])
+            titles.add(row["title"])
+            kept.append(row)
+        return kept, len(rows) - len(kept)
+
+    def create_missing_names(self, rows):
+        """
+        Create the categories and tags this batch refers to that do not
+        exist yet, and add them to the name maps.
+        """
+        new_categories = {
+            row["category"] for row in rows
+            if row.get("category") and row["category"] not in self.categories
+        }
+        if new_categories:
+            created = Category.objects.bulk_create(
+                [Category(name=name) for name in sorted(new_categories)]
+            )
+            self.categories.update((c.name, c.pk) for c in created)
+            self.created_names["category"] += len(created)
+            # bulk_create sends no post_save signal.
+            transaction.on_commit(partial(bump_generation, "category"))
+
+        new_tags = {
+            name for row in rows for name in row.get("tags") or ()
+            if name not in self.tags
+        }
+        if new_tags:
+            created = Tag.objects.bulk_create_with_slugs(
+                [Tag(name=name) for name in sorted(new_tags)]
+            )
+            self.tags.update((tag.name, tag.pk) for tag in created)
+            self.created_names["tag"] += len(created)
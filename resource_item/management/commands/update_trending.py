@@ -0,0 +1,125 @@
+import math
+from collections import defaultdict
+from datetime import timedelta
+
+from django.conf import settings
+from django.core.management.base import BaseCommand
+from django.db import transaction
+from django.db.models import F
+from django.utils import timezone
+
+from bookmark.models import Bookmark
+from comment.models import Comment
+from rating.models import Rating
+from resource_item.models import TrendingScore, TrendingState
+
+# (model, resource foreign key, weight) of every event that counts
+# towards a resource's trending score.
+EVENT_SOURCES = [
+    (Rating, "resource_item_id", 2.0),
+    (Bookmark, "resource_id", 3.0),
+    (Comment, "resource_item_id", 1.0),
+]
+
+# Scores whose current (decayed) value drops below this are removed.
+MIN_SCORE = 0.01
+
+# Stored scores grow by exp(decay * elapsed) relative to the current time;
+# past this factor they are rescaled to a new reference time.
+MAX_GROWTH = 1e6
+
+
+class Command(BaseCommand):
+    """
+    Incrementally update the trending score table.
+
+    Only events created since the previous run (the watermark) are read.
+    The watermark trails the current time by TRENDING_SETTLE_SECONDS:
+    created_at is set before the event's transaction commits, so a run
+    must not move past events that may still become visible.
+    Their decayed weights are added to the stored scores in one upsert,
+    and scores that decayed below MIN_SCORE are dropped, so the table only
+    holds recently active resources.
+    """
+    help = "Add new ratings, bookmarks and comments to the trending scores."
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            "--rebuild",
+            action="store_true",
+            help="Discard all scores and recount the last "
+                 "TRENDING_WINDOW_DAYS of activity.",
+        )
+        parser.add_argument(
+            "--batch-size",
+            type=int,
+            default=1000,
+            help="Number of scores written per INSERT batch.",
+        )
+
+    def handle(self, *args, **options):
+        now = timezone.now()
+        until = now - timedelta(seconds=settings.TRENDING_SETTLE_SECONDS)
+        decay = math.log(2) / (settings.TRENDING_HALF_LIFE_HOURS * 3600)
+
+        with transaction.atomic():
+            state, _ = TrendingState.objects.select_for_update(
+            ).get_or_create(pk=1)
+            if options["rebuild"]:
+                TrendingScore.objects.all().delete()
+                state.watermark = state.reference_at = None
+
+            since = state.watermark or until - timedelta(
+                days=settings.TRENDING_WINDOW_DAYS
+            )
+            reference = state.reference_at or now
+
+            growth = decay * (now - reference).total_seconds()
+            if growth > math.log(MAX_GROWTH):
+                TrendingScore.objects.update(
+                    score=F("score") * math.exp(-growth)
+                )
+                reference = now
+
+            deltas = defaultdict(float)
+            events = 0
+            for model, resource_field, weight in EVENT_SOURCES:
+                rows = model.objects.filter(
+                    created_at__gt=since, created_at__lte=until
+                ).order_by().values_list(resource_field, "created_at")
+                for resource_id, created_at in rows.iterator():
+                    age = (created_at - reference).total_seconds()
+                    deltas[resource_id] += weight * math.exp(decay * age)
+                    events += 1
+
+            stored = dict(TrendingScore.objects.filter(
+                resource_id__in=list(deltas)
+            ).values_list("resource_id", "score"))
+            TrendingScore.objects.bulk_create(
+                [
+                    TrendingScore(
+                        resource_id=resource_id,
+                        score=stored.get(resource_id, 0.0) + delta,
+                    )
+                    for resource_id, delta in deltas.items()
+                ],
+                update_conflicts=True,
+                unique_fields=["resource"],
+                update_fields=["score"],
+                batch_size=options["batch_size"],
+            )
+
+            # A stored score s is currently worth s * exp(-growth).
+            growth = decay * (now - reference).total_seconds()
+            pruned, _ = TrendingScore.objects.filter(
+                score__lt=MIN_SCORE * math.exp(growth)
+            ).delete()
+
+            state.watermark = until
+            state.reference_at = reference
+            state.save()
+
+        self.stdout.write(self.style.SUCCESS(
+            f"Counted {events} event(s) for {len(deltas)} resource(s); "
+            f"pruned {pruned} score(s)."
+        ))
@@ -0,0 +1,47 @@
+# Generated by Django 5.1.9 on 2026-10-17 22:45
+
+import django.db.models.expressions
+import django.db.models.functions.comparison
+from django.db import migrations, models
+
+
+def backfill_rating_aggregates(apps, schema_editor):
+    """Populate the new aggregate columns from the existing ratings."""
+    ResourceItem = apps.get_model('resource_item', 'ResourceItem')
+    Rating = apps.get_model('rating', 'Rating')
+    totals = Rating.objects.values('resource_item').annotate(
+        count=models.Count('id'), total=models.Sum('score')
+    )
+    for row in totals.iterator():
+        ResourceItem.objects.filter(pk=row['resource_item']).update(
+            rating_count=row['count'], rating_sum=row['total']
+        )
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('rating', '0001_initial'),
+        ('resource_item', '0004_alter_resourceitem_category_and_more'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='resourceitem',
+            name='rating_count',
+            field=models.PositiveIntegerField(default=0, editable=False, help_text='Number of ratings given to this resource.'),
+        ),
+        migrations.AddField(
+            model_name='resourceitem',
+            name='rating_sum',
+            field=models.PositiveIntegerField(default=0, editable=False, help_text='Sum of all rating scores given to this resource.'),
+        ),
+        migrations.AddField(
+            model_name='resourceitem',
+            name='rating_avg',
+            field=models.GeneratedField(db_persist=True, expression=models.Case(models.When(rating_count=0, then=0.0), default=django.db.models.expressions.CombinedExpression(django.db.models.functions.comparison.Cast('rating_sum', models.FloatField()), '/', models.F('rating_count'))), help_text='Average rating score (0 when there are no ratings).', output_field=models.FloatField()),
+        ),
+        migrations.RunPython(
+            backfill_rating_aggregates, migrations.RunPython.noop
+        ),
+    ]
@@ -0,0 +1,68 @@
+# Generated by Django 5.1.9 on 2026-10-17 22:47
+
+import django.contrib.postgres.search
+from django.db import migrations
+
+# The trigger and GIN index only exist on PostgreSQL; on SQLite (dev and CI)
+# the column stays empty and search falls back to ILIKE.
+FORWARD_SQL = [
+    """
+    CREATE OR REPLACE FUNCTION resource_item_search_vector_update()
+    RETURNS trigger AS $$
+    BEGIN
+        NEW.search_vector :=
+            setweight(to_tsvector('pg_catalog.english',
+                                  coalesce(NEW.title, '')), 'A') ||
+            setweight(to_tsvector('pg_catalog.english',
+                                  coalesce(NEW.description, '')), 'B');
+        RETURN NEW;
+    END
+    $$ LANGUAGE plpgsql;
+    """,
+    """
+    CREATE TRIGGER resource_item_search_vector_trigger
+    BEFORE INSERT OR UPDATE OF title, description
+    ON resource_item_resourceitem
+    FOR EACH ROW EXECUTE FUNCTION resource_item_search_vector_update();
+    """,
+    # Fire the trigger once for the existing rows.
+    "UPDATE resource_item_resourceitem SET title = title;",
+    """
+    CREATE INDEX resource_item_search_vector_gin
+    ON resource_item_resourceitem USING GIN (search_vector);
+    """,
+]
+
+BACKWARD_SQL = [
+    "DROP INDEX IF EXISTS resource_item_search_vector_gin;",
+    "DROP TRIGGER IF EXISTS resource_item_search_vector_trigger "
+    "ON resource_item_resourceitem;",
+    "DROP FUNCTION IF EXISTS resource_item_search_vector_update();",
+]
+
+
+def run_on_postgresql(statements):
+    def run(apps, schema_editor):
+        if schema_editor.connection.vendor != 'postgresql':
+            return
+        for statement in statements:
+            schema_editor.execute(statement)
+    return run
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('resource_item', '0005_resourceitem_rating_aggregates'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='resourceitem',
+            name='search_vector',
+            field=django.contrib.postgres.search.SearchVectorField(editable=False, help_text='Full-text search document (title and description), maintained by a database trigger on PostgreSQL.', null=True),
+        ),
+        migrations.RunPython(
+            run_on_postgresql(FORWARD_SQL), run_on_postgresql(BACKWARD_SQL)
+        ),
+    ]
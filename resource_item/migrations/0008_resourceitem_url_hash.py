@@ -0,0 +1,54 @@
+# Generated by Django 5.1.9 on 2026-10-17 23:12
+
+from django.db import migrations, models
+
+from resource_item.canonical import url_hash
+
+
+def backfill_url_hash(apps, schema_editor):
+    """
+    Hash every existing URL. When several rows share a canonical URL only
+    the oldest gets the hash; the others keep NULL until they are merged
+    (see `manage.py find_duplicate_urls`).
+    """
+    ResourceItem = apps.get_model('resource_item', 'ResourceItem')
+    seen = set()
+    batch = []
+    items = ResourceItem.objects.only('id', 'url').order_by('id')
+    for item in items.iterator(chunk_size=2000):
+        digest = url_hash(item.url)
+        if digest in seen:
+            continue
+        seen.add(digest)
+        item.url_hash = digest
+        batch.append(item)
+        if len(batch) >= 2000:
+            ResourceItem.objects.bulk_update(batch, ['url_hash'])
+            batch = []
+    ResourceItem.objects.bulk_update(batch, ['url_hash'])
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('resource_item', '0007_trendingstate_trendingscore'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='resourceitem',
+            name='url_hash',
+            field=models.CharField(editable=False, help_text='SHA-256 of the canonical URL, set on save.', max_length=64, null=True),
+        ),
+        migrations.RunPython(backfill_url_hash, migrations.RunPython.noop),
+        migrations.AlterField(
+            model_name='resourceitem',
+            name='url_hash',
+            field=models.CharField(editable=False, help_text='SHA-256 of the canonical URL, set on save.', max_length=64, null=True, unique=True),
+        ),
+        migrations.AlterField(
+            model_name='resourceitem',
+            name='url',
+            field=models.URLField(help_text='A URL pointing to the resource, unique once canonicalized.'),
+        ),
+    ]
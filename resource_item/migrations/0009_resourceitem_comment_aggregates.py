@@ -0,0 +1,40 @@
+# Generated by Django 5.1.9 on 2026-10-17 23:16
+
+from django.db import migrations, models
+
+
+def backfill_comment_aggregates(apps, schema_editor):
+    """Populate the new comment columns from the existing comments."""
+    ResourceItem = apps.get_model('resource_item', 'ResourceItem')
+    Comment = apps.get_model('comment', 'Comment')
+    totals = Comment.objects.values('resource_item').annotate(
+        count=models.Count('id'), latest=models.Max('created_at')
+    )
+    for row in totals.iterator():
+        ResourceItem.objects.filter(pk=row['resource_item']).update(
+            comment_count=row['count'], last_commented_at=row['latest']
+        )
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('comment', '0002_comment_search_vector'),
+        ('resource_item', '0008_resourceitem_url_hash'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='resourceitem',
+            name='comment_count',
+            field=models.PositiveIntegerField(default=0, editable=False, help_text='Number of comments on this resource.'),
+        ),
+        migrations.AddField(
+            model_name='resourceitem',
+            name='last_commented_at',
+            field=models.DateTimeField(editable=False, help_text='When the newest comment on this resource was written.', null=True),
+        ),
+        migrations.RunPython(
+            backfill_comment_aggregates, migrations.RunPython.noop
+        ),
+    ]
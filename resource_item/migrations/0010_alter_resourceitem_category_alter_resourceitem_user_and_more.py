@@ -0,0 +1,36 @@
+# Generated by Django 5.1.9 on 2026-10-17 23:19
+
+import django.db.models.deletion
+from django.conf import settings
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('category', '0002_alter_category_name'),
+        ('resource_item', '0009_resourceitem_comment_aggregates'),
+        ('tag', '0002_alter_tag_description_alter_tag_slug'),
+        migrations.swappable_dependency(settings.AUTH_USER_MODEL),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name='resourceitem',
+            index=models.Index(fields=['category', '-created_at', '-id'], name='resource_category_created_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='resourceitem',
+            index=models.Index(fields=['user', '-created_at', '-id'], name='resource_user_created_idx'),
+        ),
+        migrations.AlterField(
+            model_name='resourceitem',
+            name='category',
+            field=models.ForeignKey(blank=True, db_index=False, help_text='Optional. The main topic/category for this resource.', null=True, on_delete=django.db.models.deletion.CASCADE, related_name='resource_items', to='category.category'),
+        ),
+        migrations.AlterField(
+            model_name='resourceitem',
+            name='user',
+            field=models.ForeignKey(db_index=False, help_text='The user who uploaded this resource.', on_delete=django.db.models.deletion.CASCADE, related_name='resources', to=settings.AUTH_USER_MODEL),
+        ),
+    ]
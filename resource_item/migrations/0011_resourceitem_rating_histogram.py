@@ -0,0 +1,55 @@
+# Generated by Django 5.1.9 on 2026-10-17 23:29
+
+from django.db import migrations, models
+
+
+def backfill_rating_histogram(apps, schema_editor):
+    """Populate the per-score counters from the existing ratings."""
+    ResourceItem = apps.get_model('resource_item', 'ResourceItem')
+    Rating = apps.get_model('rating', 'Rating')
+    totals = Rating.objects.values('resource_item', 'score').annotate(
+        count=models.Count('id')
+    ).order_by()
+    for row in totals.iterator():
+        ResourceItem.objects.filter(pk=row['resource_item']).update(
+            **{f"rating_{row['score']}_count": row['count']}
+        )
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('rating', '0003_alter_rating_created_at'),
+        ('resource_item', '0010_alter_resourceitem_category_alter_resourceitem_user_and_more'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='resourceitem',
+            name='rating_1_count',
+            field=models.PositiveIntegerField(default=0, editable=False, help_text='Number of 1-star ratings given to this resource.'),
+        ),
+        migrations.AddField(
+            model_name='resourceitem',
+            name='rating_2_count',
+            field=models.PositiveIntegerField(default=0, editable=False, help_text='Number of 2-star ratings given to this resource.'),
+        ),
+        migrations.AddField(
+            model_name='resourceitem',
+            name='rating_3_count',
+            field=models.PositiveIntegerField(default=0, editable=False, help_text='Number of 3-star ratings given to this resource.'),
+        ),
+        migrations.AddField(
+            model_name='resourceitem',
+            name='rating_4_count',
+            field=models.PositiveIntegerField(default=0, editable=False, help_text='Number of 4-star ratings given to this resource.'),
+        ),
+        migrations.AddField(
+            model_name='resourceitem',
+            name='rating_5_count',
+            field=models.PositiveIntegerField(default=0, editable=False, help_text='Number of 5-star ratings given to this resource.'),
+        ),
+        migrations.RunPython(
+            backfill_rating_histogram, migrations.RunPython.noop
+        ),
+    ]
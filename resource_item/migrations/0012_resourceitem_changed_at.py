@@ -0,0 +1,27 @@
+# Generated by Django 5.1.9 on 2026-10-17 23:58
+
+import django.utils.timezone
+from django.db import migrations, models
+
+
+def copy_updated_at(apps, schema_editor):
+    """Start every resource with changed_at equal to updated_at."""
+    ResourceItem = apps.get_model('resource_item', 'ResourceItem')
+    ResourceItem.objects.update(changed_at=models.F('updated_at'))
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('resource_item', '0011_resourceitem_rating_histogram'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='resourceitem',
+            name='changed_at',
+            field=models.DateTimeField(auto_now=True, default=django.utils.timezone.now, editable=False, help_text='Timestamp when this resource or its rating and comment aggregates last changed.'),
+            preserve_default=False,
+        ),
+        migrations.RunPython(copy_updated_at, migrations.RunPython.noop),
+    ]
@@ -1,8 +1,25 @@
 from django.db import models
+from django.db.models import Case, F, FloatField, When
+from django.db.models.functions import Cast, Now
 from django.contrib.auth.models import User
+from django.contrib.postgres.search import SearchVectorField
 from django.core.exceptions import ValidationError
 from category.models import Category
 from tag.models import Tag
+from .canonical import url_hash
+
+# Histogram counter column per rating score (see Rating.SCORE_CHOICES).
+RATING_HISTOGRAM_FIELDS = {
+    score: f"rating_{score}_count" for score in range(1, 6)
+}
+# Columns only written by the rating and comment signals, through
+# F-expression updates. A regular save() never writes them, so a stale
+# instance cannot undo concurrent deltas.
+DENORMALIZED_FIELDS = frozenset({
+    "rating_count", "rating_sum", *RATING_HISTOGRAM_FIELDS.values(),
+    "comment_count", "last_commented_at",
+})
+DUPLICATE_URL_MESSAGE = "resource item with this url already exists."
 
 
 class ResourceItem(models.Model):
@@ -17,11 +34,29 @@ class ResourceItem(models.Model):
         category (Category): Optional foreign key to the Category model;
             groups resources by topic.
         user (User): Foreign key to the user who created/uploaded the resource.
-        url (str): The (unique) URL to the resource.
+        url (str): The URL to the resource.
+        url_hash (str): SHA-256 of the canonical URL; unique, so equivalent
+            URLs cannot be stored twice.
         created_at (datetime): Timestamp when the resource was created.
         updated_at (datetime): Timestamp when the resource was last updated.
+        changed_at (datetime): Timestamp when the representation last
+            changed, including the rating and comment aggregates; the
+            ETag / Last-Modified validators are built from it.
         tags (Tag): Many-to-many field for categorizing resources by multiple
             tags.
+        search_vector (SearchVector): Weighted full-text document built from
+            title and description (PostgreSQL only).
+        rating_count (int): Number of ratings, maintained by the Rating model.
+        rating_sum (int): Sum of all rating scores, maintained by the Rating
+            model.
+        rating_avg (float): Average score computed by the database from
+            rating_sum and rating_count (0 when there are no ratings).
+        rating_1_count .. rating_5_count (int): Number of ratings per
+            score, maintained by the Rating model.
+        comment_count (int): Number of comments, maintained by the Comment
+            model.
+        last_commented_at (datetime): Creation time of the newest comment,
+            maintained by the Comment model.
     """
     title = models.CharField(
         max_length=200,
@@ -37,17 +72,25 @@ class ResourceItem(models.Model):
         related_name="resource_items",
         null=True,
         blank=True,
+        db_index=False,
         help_text="Optional. The main topic/category for this resource."
     )
     user = models.ForeignKey(
         User,
         on_delete=models.CASCADE,
         related_name="resources",
+        db_index=False,
         help_text="The user who uploaded this resource."
     )
     url = models.URLField(
+        help_text="A URL pointing to the resource, unique once canonicalized."
+    )
+    url_hash = models.CharField(
+        max_length=64,
         unique=True,
-        help_text="A unique URL pointing to the resource."
+        null=True,
+        editable=False,
+        help_text="SHA-256 of the canonical URL, set on save."
     )
     created_at = models.DateTimeField(
         auto_now_add=True,
@@ -58,12 +101,173 @@ class ResourceItem(models.Model):
         auto_now=True,
         help_text="Timestamp when this resource was last updated."
     )
+    changed_at = models.DateTimeField(
+        auto_now=True,
+        editable=False,
+        help_text="Timestamp when this resource or its rating and comment "
+                  "aggregates last changed."
+    )
     tags = models.ManyToManyField(
         Tag,
         blank=True,
         related_name="resources",
         help_text="Optional. One or more tags for this resource."
     )
+    search_vector = SearchVectorField(
+        null=True,
+        editable=False,
+        help_text="Full-text search document (title and description), "
+                  "maintained by a database trigger on PostgreSQL."
+    )
+    rating_count = models.PositiveIntegerField(
+        default=0,
+        editable=False,
+        help_text="Number of ratings given to this resource."
+    )
+    rating_sum = models.PositiveIntegerField(
+        default=0,
+        editable=False,
+        help_text="Sum of all rating scores given to this resource."
+    )
+    rating_avg = models.GeneratedField(
+        expression=Case(
+            When(rating_count=0, then=0.0),
+            default=Cast("rating_sum", FloatField()) / F("rating_count"),
+        ),
+        output_field=FloatField(),
+        db_persist=True,
+        help_text="Average rating score (0 when there are no ratings)."
+    )
+    rating_1_count = models.PositiveIntegerField(
+        default=0,
+        editable=False,
+        help_text="Number of 1-star ratings given to this resource."
+    )
+    rating_2_count = models.PositiveIntegerField(
+        default=0,
+        editable=False,
+        help_text="Number of 2-star ratings given to this resource."
+    )
+    rating_3_count = models.PositiveIntegerField(
+        default=0,
+        editable=False,
+        help_text="Number of 3-star ratings given to this resource."
+    )
+    rating_4_count = models.PositiveIntegerField(
+        default=0,
+        editable=False,
+        help_text="Number of 4-star ratings given to this resource."
+    )
+    rating_5_count = models.PositiveIntegerField(
+        default=0,
+        editable=False,
+        help_text="Number of 5-star ratings given to this resource."
+    )
+    comment_count = models.PositiveIntegerField(
+        default=0,
+        editable=False,
+        help_text="Number of comments on this resource."
+    )
+    last_commented_at = models.DateTimeField(
+        null=True,
+        editable=False,
+        help_text="When the newest comment on this resource was written."
+    )
+
+    @property
+    def rating_histogram(self):
+        """
+        Number of ratings per score, read from the stored counters.
+        """
+        return {
+            score: getattr(self, field)
+            for score, field in RATING_HISTOGRAM_FIELDS.items()
+        }
+
+    @classmethod
+    def apply_rating_delta(cls, pk, count, total, scores=None):
+        """
+        Atomically shift the stored rating aggregates of one resource.
+        `scores` maps a score to the change of its histogram counter.
+        The update is done in SQL with F-expressions so concurrent ratings
+        never overwrite each other's changes.
+        """
+        buckets = {
+            RATING_HISTOGRAM_FIELDS[score]: F(RATING_HISTOGRAM_FIELDS[score])
+            + delta
+            for score, delta in (scores or {}).items() if delta
+        }
+        if not count and not total and not buckets:
+            return
+        # changed_at is bumped as well, since the aggregates are part of
+        # the representation validated by ETag / Last-Modified.
+        cls.objects.filter(pk=pk).update(
+            rating_count=F("rating_count") + count,
+            rating_sum=F("rating_sum") + total,
+            changed_at=Now(),
+            **buckets,
+        )
+
+    @classmethod
+    def apply_comment_delta(cls, pk, count, last_commented_at):
+        """
+        Atomically shift the stored comment count of one resource and set
+        last_commented_at, which may be a value or an SQL expression
+        (see comment.signals).
+        """
+        cls.objects.filter(pk=pk).update(
+            comment_count=F("comment_count") + count,
+            last_commented_at=last_commented_at,
+            changed_at=Now(),
+        )
+
+    @classmethod
+    def from_db(cls, db, field_names, values):
+        """
+        Remember the loaded url, so save() only recomputes url_hash when
+        the canonical url was changed.
+        """
+        instance = super().from_db(db, field_names, values)
+        if "url" in field_names:
+            instance._loaded_url = values[field_names.index("url")]
+        return instance
+
+    def refresh_from_db(self, using=None, fields=None, from_queryset=None):
+        super().refresh_from_db(using, fields, from_queryset)
+        if "url" not in self.get_deferred_fields():
+            self._loaded_url = self.url
+
+    def save(self, *args, **kwargs):
+        """
+        Keep url_hash in sync with url. Bulk inserts must set it
+        themselves (see canonical.url_hash). The hash is only recomputed
+        when the canonical url changed, so legacy duplicates keep their
+        NULL hash (see migration 0008) and stay editable.
+
+        Updates leave out DENORMALIZED_FIELDS unless they are named in
+        update_fields explicitly.
+        """
+        url_loaded = "url" not in self.get_deferred_fields()
+        loaded_url = getattr(self, "_loaded_url", None)
+        if self._state.adding or url_loaded and (
+            loaded_url is None or url_hash(self.url) != url_hash(loaded_url)
+        ):
+            self.url_hash = url_hash(self.url)
+        update_fields = kwargs.get("update_fields")
+        if update_fields is not None and "url" in update_fields:
+            kwargs["update_fields"] = {*update_fields, "url_hash"}
+        elif update_fields is None and not self._state.adding:
+            deferred = self.get_deferred_fields()
+            kwargs["update_fields"] = [
+                field.name for field in self._meta.concrete_fields
+                if not field.primary_key
+                and not field.generated
+                and field.name not in DENORMALIZED_FIELDS
+                and field.attname not in deferred
+            ]
+        super().save(*args, **kwargs)
+        if url_loaded:
+            self._loaded_url = self.url
 
     def clean(self):
         """
@@ -78,6 +282,25 @@ class ResourceItem(models.Model):
                               f'(it has {len(self.description)}).'
             })
 
+    def validate_unique(self, exclude=None):
+        """
+        url is unique through url_hash, which model forms exclude as a
+        non-editable field; check the canonical URL here instead. An
+        unchanged URL is accepted, so legacy duplicates stay editable.
+        """
+        super().validate_unique(exclude)
+        if exclude and "url" in exclude or not self.url:
+            return
+        digest = url_hash(self.url)
+        loaded_url = getattr(self, "_loaded_url", None)
+        if loaded_url is not None and url_hash(loaded_url) == digest:
+            return
+        duplicates = ResourceItem.objects.filter(url_hash=digest)
+        if self.pk is not None:
+            duplicates = duplicates.exclude(pk=self.pk)
+        if duplicates.exists():
+            raise ValidationError({"url": DUPLICATE_URL_MESSAGE})
+
     def __str__(self):
         """
         Returns the string representation of the resource, which is its title.
@@ -87,6 +310,60 @@ class ResourceItem(models.Model):
     class Meta:
         """
         Metadata for the ResourceItem model.
-        Orders items by descending creation date (newest first).
+        Orders items by descending creation date (newest first). The
+        composite indexes serve the `category` and `user` filters in that
+        order, id included for the keyset pagination tie-breaker; they
+        replace the plain foreign key indexes.
         """
         ordering = ["-created_at"]
+        indexes = [
+            models.Index(
+                fields=["category", "-created_at", "-id"],
+                name="resource_category_created_idx",
+            ),
+            models.Index(
+                fields=["user", "-created_at", "-id"],
+                name="resource_user_created_idx",
+            ),
+        ]
+
+
+class TrendingScore(models.Model):
+    """
+    Time-decayed activity score of a resource, maintained incrementally by
+    `manage.py update_trending` from new ratings, bookmarks and comments.
+
+    Every event adds weight * exp(decay * (event time - reference time)),
+    with the reference time kept in TrendingState. All scores share the
+    same reference, so ordering by the stored value orders by the current
+    decayed score, and a score only changes when its resource gets new
+    activity.
+    """
+    resource = models.OneToOneField(
+        ResourceItem,
+        on_delete=models.CASCADE,
+        primary_key=True,
+        related_name="trending",
+    )
+    score = models.FloatField(default=0.0)
+
+    class Meta:
+        indexes = [
+            # Matches the keyset pagination order of the trending feed.
+            models.Index(
+                fields=["-score", "-resource"], name="trending_score_idx"
+            ),
+        ]
+
+    def __str__(self):
+        return f"{self.resource_id}: {self.score}"
+
+
+class TrendingState(models.Model):
+    """
+    Single-row bookkeeping for TrendingScore: events created up to
+    `watermark` have been counted, and scores are relative to
+    `reference_at`.
+    """
+    watermark = models.DateTimeField(null=True)
+    reference_at = models.DateTimeField(null=True)
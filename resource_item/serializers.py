@@ -1,24 +1,76 @@
+from contextlib import contextmanager
+
+from django.db import IntegrityError, transaction
 from rest_framework import serializers
-from .models import ResourceItem
+from rest_framework.settings import api_settings
+from .canonical import url_hash
+from .models import DUPLICATE_URL_MESSAGE, ResourceItem
 from category.models import Category
 import validators
 from tag.models import Tag
+from lazydog_api.serializers import (
+    SparseFieldsetSerializerMixin, TimedSerializerMixin,
+)
+
+DUPLICATE_TITLE_MESSAGE = "You already have a resource with this title."
+# Fields describing the requesting user's relation to a resource. They are
+# annotated by ResourceItemViewSet and only rendered for authenticated
+# requests.
+USER_STATE_FIELDS = ('my_rating', 'is_bookmarked')
 
 
-class ResourceItemSerializer(serializers.ModelSerializer):
+class CachedPrimaryKeyRelatedField(serializers.PrimaryKeyRelatedField):
+    """
+    PrimaryKeyRelatedField that resolves values from a {pk: instance} map
+    stored in the serializer context under `lookup_key`, when present.
+    Bulk endpoints fill the map once per batch so validating N items costs
+    one query per related model instead of one per value.
+    """
+
+    def __init__(self, **kwargs):
+        self.lookup_key = kwargs.pop('lookup_key')
+        super().__init__(**kwargs)
+
+    def to_internal_value(self, data):
+        lookup = self.context.get(self.lookup_key)
+        if lookup is None:
+            return super().to_internal_value(data)
+        if isinstance(data, bool):
+            self.fail('incorrect_type', data_type=type(data).__name__)
+        try:
+            return lookup[int(data)]
+        except KeyError:
+            self.fail('does_not_exist', pk_value=data)
+        except (TypeError, ValueError):
+            self.fail('incorrect_type', data_type=type(data).__name__)
+
+
+class ResourceItemSerializer(TimedSerializerMixin,
+                             SparseFieldsetSerializerMixin,
+                             serializers.ModelSerializer):
     """
     Serializer for the ResourceItem model.
     """
-    category = serializers.PrimaryKeyRelatedField(
+    category = CachedPrimaryKeyRelatedField(
         queryset=Category.objects.all(),
         required=True,
-        allow_null=True
+        allow_null=True,
+        lookup_key='category_lookup'
     )
 
-    tags = serializers.PrimaryKeyRelatedField(
+    tags = CachedPrimaryKeyRelatedField(
         queryset=Tag.objects.all(),
         many=True,  # Allow multiple predefined tags
-        required=False
+        required=False,
+        lookup_key='tag_lookup'
+    )
+
+    my_rating = serializers.IntegerField(read_only=True, allow_null=True)
+    is_bookmarked = serializers.BooleanField(read_only=True)
+    # Only rendered when "rating_histogram" is in the `expand` set of the
+    # serializer context (see ResourceItemViewSet.get_expand).
+    rating_histogram = serializers.DictField(
+        child=serializers.IntegerField(), read_only=True
     )
 
     class Meta:
@@ -28,8 +80,23 @@ class ResourceItemSerializer(serializers.ModelSerializer):
         model = ResourceItem
         fields = ['id', 'title', 'description',
                   'category', 'tags', 'user', 'url',
-                  'created_at', 'updated_at']
-        read_only_fields = ['user', 'created_at', 'updated_at']
+                  'created_at', 'updated_at',
+                  'rating_count', 'rating_sum', 'rating_avg',
+                  'comment_count', 'last_commented_at',
+                  'my_rating', 'is_bookmarked', 'rating_histogram']
+        read_only_fields = ['user', 'created_at', 'updated_at',
+                            'rating_count', 'rating_sum', 'rating_avg',
+                            'comment_count', 'last_commented_at']
+
+    def get_fields(self):
+        fields = super().get_fields()
+        request = self.context.get('request')
+        if request is None or not request.user.is_authenticated:
+            for name in USER_STATE_FIELDS:
+                fields.pop(name, None)
+        if 'rating_histogram' not in self.context.get('expand', ()):
+            fields.pop('rating_histogram', None)
+        return fields
 
     def validate_title(self, value):
         """
@@ -38,20 +105,31 @@ class ResourceItemSerializer(serializers.ModelSerializer):
         user = self.context['request'].user
         # Check if the title already exists for this user
         if ResourceItem.objects.filter(title=value, user=user).exists():
-            raise serializers.ValidationError(
-                "You already have a resource with this title."
-            )
+            raise serializers.ValidationError(DUPLICATE_TITLE_MESSAGE)
 
         return value
 
     def validate_url(self, value):
         """
-        Ensure the provided URL is valid.
+        Ensure the provided URL is valid and that no other resource has the
+        same canonical URL.
         """
         if not validators.url(value):
             raise serializers.ValidationError("Enter a valid URL.")
+        if self.url_taken(value):
+            raise serializers.ValidationError(DUPLICATE_URL_MESSAGE)
         return value
 
+    def url_taken(self, value):
+        value_hash = url_hash(value)
+        queryset = ResourceItem.objects.filter(url_hash=value_hash)
+        if self.instance is not None:
+            if url_hash(self.instance.url) == value_hash:
+                # Unchanged; legacy duplicates may keep their URL.
+                return False
+            queryset = queryset.exclude(pk=self.instance.pk)
+        return queryset.exists()
+
     def validate_description(self, value):
         """
         Ensure the description has a reasonable length.
@@ -79,6 +157,178 @@ class ResourceItemSerializer(serializers.ModelSerializer):
         tags = validated_data.pop('tags', [])
         # Extract tags before creating the resource
         validated_data['user'] = self.context['request'].user
-        resource_item = super().create(validated_data)  # Create the resource
+        with self.url_conflict_as_error():
+            resource_item = super().create(validated_data)
         resource_item.tags.set(tags)  # Assign predefined tags to the resource
+        # A new resource has no rating or bookmark yet; saves the queries
+        # the list annotations would cost.
+        resource_item.my_rating = None
+        resource_item.is_bookmarked = False
         return resource_item
+
+    def update(self, instance, validated_data):
+        with self.url_conflict_as_error():
+            return super().update(instance, validated_data)
+
+    @contextmanager
+    def url_conflict_as_error(self):
+        """
+        Report a url_hash conflict that slipped past validate_url (a
+        concurrent request took the URL) as a validation error.
+        """
+        try:
+            with transaction.atomic():
+                yield
+        except IntegrityError:
+            raise serializers.ValidationError({'url': [DUPLICATE_URL_MESSAGE]})
+
+
+class ResourceItemBulkSerializer(serializers.ListSerializer):
+    """
+    List serializer for creating many ResourceItems in one request.
+
+    Unlike a plain ListSerializer, invalid items do not fail the whole
+    batch: their errors are collected in `item_errors` (keyed by the item's
+    index in the request) and only the valid items are created. Related
+    categories and tags are loaded once for the batch, title and URL
+    uniqueness are checked with one query each, and the rows and their tag
+    links are written with one bulk_create each.
+    """
+
+    def to_internal_value(self, data):
+        if not isinstance(data, list):
+            message = self.error_messages['not_a_list'].format(
+                input_type=type(data).__name__
+            )
+            raise serializers.ValidationError({
+                api_settings.NON_FIELD_ERRORS_KEY: [message]
+            }, code='not_a_list')
+
+        if self.max_length is not None and len(data) > self.max_length:
+            message = self.error_messages['max_length'].format(
+                max_length=self.max_length
+            )
+            raise serializers.ValidationError({
+                api_settings.NON_FIELD_ERRORS_KEY: [message]
+            }, code='max_length')
+
+        self.load_related_objects(data)
+        self.item_errors = {}
+        valid = []
+        for index, item in enumerate(data):
+            try:
+                valid.append((index, self.run_child_validation(item)))
+            except serializers.ValidationError as exc:
+                self.item_errors[index] = exc.detail
+
+        valid = self.exclude_duplicates(valid)
+        self.item_indexes = [index for index, _ in valid]
+        return [attrs for _, attrs in valid]
+
+    def load_related_objects(self, data):
+        """
+        Fetch every category and tag referenced by the batch in one query
+        per model and expose them to CachedPrimaryKeyRelatedField.
+        """
+        category_ids, tag_ids = set(), set()
+        for item in data:
+            if not isinstance(item, dict):
+                continue
+            category = item.get('category')
+            if isinstance(category, (int, str)):
+                category_ids.add(category)
+            tags = item.get('tags')
+            if isinstance(tags, list):
+                tag_ids.update(
+                    tag for tag in tags if isinstance(tag, (int, str))
+                )
+        self.context['category_lookup'] = Category.objects.in_bulk(
+            _as_ints(category_ids)
+        )
+        self.context['tag_lookup'] = Tag.objects.in_bulk(_as_ints(tag_ids))
+
+    def exclude_duplicates(self, valid):
+        """
+        Reject items whose title (per user) or canonical URL already exists
+        in the database or earlier in the same batch.
+        """
+        if not valid:
+            return valid
+        user = self.context['request'].user
+        for _, attrs in valid:
+            attrs['url_hash'] = url_hash(attrs['url'])
+        titles = {attrs['title'] for _, attrs in valid}
+        hashes = {attrs['url_hash'] for _, attrs in valid}
+        taken_titles = set(ResourceItem.objects.filter(
+            user=user, title__in=titles
+        ).values_list('title', flat=True))
+        taken_hashes = set(ResourceItem.objects.filter(
+            url_hash__in=hashes
+        ).values_list('url_hash', flat=True))
+
+        unique = []
+        for index, attrs in valid:
+            errors = {}
+            if attrs['title'] in taken_titles:
+                errors['title'] = [DUPLICATE_TITLE_MESSAGE]
+            if attrs['url_hash'] in taken_hashes:
+                errors['url'] = [DUPLICATE_URL_MESSAGE]
+            if errors:
+                self.item_errors[index] = errors
+                continue
+            taken_titles.add(attrs['title'])
+            taken_hashes.add(attrs['url_hash'])
+            unique.append((index, attrs))
+        return unique
+
+    def create(self, validated_data):
+        tags_per_item = [attrs.pop('tags', []) for attrs in validated_data]
+        items = [ResourceItem(**attrs) for attrs in validated_data]
+        through = ResourceItem.tags.through
+        try:
+            with transaction.atomic():
+                items = ResourceItem.objects.bulk_create(items)
+                through.objects.bulk_create([
+                    through(resourceitem_id=item.pk, tag_id=tag.pk)
+                    for item, tags in zip(items, tags_per_item)
+                    for tag in dict.fromkeys(tags)
+                ])
+        except IntegrityError:
+            # Another request created one of these URLs after validation.
+            raise serializers.ValidationError({
+                api_settings.NON_FIELD_ERRORS_KEY: [
+                    "The batch conflicts with resources created meanwhile. "
+                    "Please retry."
+                ]
+            })
+        return items
+
+
+class ResourceItemBulkItemSerializer(ResourceItemSerializer):
+    """
+    Per-item serializer used by the bulk endpoint. Uniqueness of title and
+    URL is checked batch-wide by ResourceItemBulkSerializer instead of one
+    query per item.
+    """
+
+    class Meta(ResourceItemSerializer.Meta):
+        list_serializer_class = ResourceItemBulkSerializer
+
+    def validate_title(self, value):
+        return value
+
+    def url_taken(self, value):
+        return False
+
+
+def _as_ints(values):
+    """Return the members of `values` that can be used as integer PKs."""
+    ints = set()
+    for value in values:
+        if isinstance(value, bool):
+            continue
+        try:
+            ints.add(int(value))
+        except (TypeError, ValueError):
+            continue
+    return ints
@@ -0,0 +1,168 @@
+"""
+Unit tests for the ResourceItem bulk create endpoint.
+
+Covered cases:
+- Creating several resources with tags in one request
+- Per-item validation errors without aborting the batch
+- Wrongly typed category and tag references are per-item errors
+- Duplicate titles/URLs against the database and within the batch
+- Fixed query count regardless of batch size
+- Rejection of non-list payloads, oversized batches and anonymous users
+"""
+
+from django.contrib.auth.models import User
+from django.db import connection
+from django.test.utils import CaptureQueriesContext
+from django.urls import reverse
+from rest_framework import status
+from rest_framework.test import APITestCase
+
+from category.models import Category
+from resource_item.models import ResourceItem
+from resource_item.views import ResourceItemViewSet
+from tag.models import Tag
+
+
+class ResourceItemBulkCreateTest(APITestCase):
+    @classmethod
+    def setUpTestData(cls):
+        """Create a user, a category, two tags and one existing resource."""
+        cls.user = User.objects.create_user(username="owner", password="pw")
+        cls.category = Category.objects.create(name="books")
+        cls.tag_python = Tag.objects.create(name="python")
+        cls.tag_django = Tag.objects.create(name="django")
+        cls.existing = ResourceItem.objects.create(
+            title="Existing",
+            description="Already stored resource",
+            user=cls.user,
+            category=cls.category,
+            url="https://example.com/existing"
+        )
+        cls.bulk_url = reverse("resourceitem-bulk")
+
+    def setUp(self):
+        self.client.force_authenticate(self.user)
+
+    def item(self, i, **overrides):
+        data = {
+            "title": f"Bulk {i}",
+            "description": "Bulk created resource",
+            "category": self.category.pk,
+            "tags": [self.tag_python.pk, self.tag_django.pk],
+            "url": f"https://example.com/bulk-{i}",
+        }
+        data.update(overrides)
+        return data
+
+    def test_bulk_create(self):
+        """All valid items are created with their tags."""
+        response = self.client.post(
+            self.bulk_url, [self.item(i) for i in range(3)], format="json"
+        )
+        self.assertEqual(response.status_code, status.HTTP_201_CREATED)
+        self.assertEqual(len(response.data["created"]), 3)
+        self.assertEqual(response.data["errors"], [])
+        created = ResourceItem.objects.get(title="Bulk 1")
+        self.assertEqual(created.user, self.user)
+        self.assertEqual(created.tags.count(), 2)
+        self.assertCountEqual(
+            response.data["created"][0]["tags"],
+            [self.tag_python.pk, self.tag_django.pk]
+        )
+
+    def test_invalid_items_do_not_abort_batch(self):
+        """Invalid items are reported by index; the rest are created."""
+        payload = [
+            self.item(0),
+            self.item(1, url="not-a-url"),
+            self.item(2, category=9999),
+            self.item(3, tags=[9999]),
+            self.item(4),
+        ]
+        response = self.client.post(self.bulk_url, payload, format="json")
+        self.assertEqual(response.status_code, status.HTTP_201_CREATED)
+        self.assertEqual(
+            [item["title"] for item in response.data["created"]],
+            ["Bulk 0", "Bulk 4"]
+        )
+        errors = {e["index"]: e["errors"] for e in response.data["errors"]}
+        self.assertEqual(sorted(errors), [1, 2, 3])
+        self.assertIn("url", errors[1])
+        self.assertIn("category", errors[2])
+        self.assertIn("tags", errors[3])
+
+    def test_wrongly_typed_references_are_item_errors(self):
+        """Lists or objects as category / tag ids do not fail the batch."""
+        payload = [
+            self.item(0, category=[self.category.pk]),
+            self.item(1, category={"id": self.category.pk}),
+            self.item(2, tags=[[self.tag_python.pk]]),
+            self.item(3),
+        ]
+        response = self.client.post(self.bulk_url, payload, format="json")
+        self.assertEqual(response.status_code, status.HTTP_201_CREATED)
+        self.assertEqual(
+            [item["title"] for item in response.data["created"]], ["Bulk 3"]
+        )
+        errors = {e["index"]: e["errors"] for e in response.data["errors"]}
+        self.assertIn("category", errors[0])
+        self.assertIn("category", errors[1])
+        self.assertIn("tags", errors[2])
+
+    def test_duplicates_against_database_and_batch(self):
+        """Existing and repeated titles/URLs are rejected per item."""
+        payload = [
+            self.item(0, title="Existing"),
+            self.item(1, url="https://example.com/existing"),
+            self.item(2),
+            self.item(3, url="https://example.com/bulk-2"),
+            self.item(4, title="Bulk 2"),
+        ]
+        response = self.client.post(self.bulk_url, payload, format="json")
+        self.assertEqual(len(response.data["created"]), 1)
+        errors = {e["index"]: e["errors"] for e in response.data["errors"]}
+        self.assertEqual(list(errors[0]), ["title"])
+        self.assertEqual(list(errors[1]), ["url"])
+        self.assertEqual(list(errors[3]), ["url"])
+        self.assertEqual(list(errors[4]), ["title"])
+
+    def test_query_count_is_independent_of_batch_size(self):
+        """A batch of 5 and a batch of 50 run the same number of queries."""
+        def count_queries(start, size):
+            payload = [self.item(i) for i in range(start, start + size)]
+            with CaptureQueriesContext(connection) as context:
+                response = self.client.post(
+                    self.bulk_url, payload, format="json"
+                )
+            self.assertEqual(len(response.data["created"]), size)
+            return len(context.captured_queries)
+
+        self.assertEqual(count_queries(0, 5), count_queries(100, 50))
+
+    def test_all_invalid_returns_400(self):
+        """When nothing can be created the response is a 400."""
+        response = self.client.post(
+            self.bulk_url, [self.item(0, url="bad")], format="json"
+        )
+        self.assertEqual(response.status_code, status.HTTP_400_BAD_REQUEST)
+        self.assertEqual(response.data["created"], [])
+
+    def test_payload_must_be_a_list(self):
+        response = self.client.post(self.bulk_url, self.item(0), format="json")
+        self.assertEqual(response.status_code, status.HTTP_400_BAD_REQUEST)
+        self.assertIn("non_field_errors", response.data)
+
+    def test_batch_size_limit(self):
+        limit = ResourceItemViewSet.bulk_max_items
+        payload = [self.item(i) for i in range(limit + 1)]
+        response = self.client.post(self.bulk_url, payload, format="json")
+        self.assertEqual(response.status_code, status.HTTP_400_BAD_REQUEST)
+        self.assertFalse(ResourceItem.objects.filter(title="Bulk 0").exists())
+
+    def test_anonymous_forbidden(self):
+        self.client.force_authenticate(None)
+        response = self.client.post(
+            self.bulk_url, [self.item(0)], format="json"
+        )
+        self.assertIn(response.status_code, [
+            status.HTTP_401_UNAUTHORIZED, status.HTTP_403_FORBIDDEN])
@@ -0,0 +1,203 @@
+"""
+Unit tests for canonical URL deduplication.
+
+Covered cases:
+- canonicalize_url normalizes scheme, host, port, slashes, fragments and
+  query parameters
+- Creating or bulk-creating a resource with an equivalent URL is rejected
+- Editing a resource keeps its own URL valid
+- Legacy duplicates without a hash stay editable; moving one onto a taken
+  URL is a 400, not a 500
+- The admin form reports an equivalent URL as a form error
+- find_duplicate_urls clusters rows stored before the hash existed
+"""
+from io import StringIO
+from unittest import mock
+
+from django.contrib.auth.models import User
+from django.core.management import call_command
+from django.core.management.base import CommandError
+from django.db import IntegrityError
+from django.test import SimpleTestCase
+from django.urls import reverse
+from rest_framework import status
+from rest_framework.test import APITestCase
+
+from resource_item.canonical import canonicalize_url, url_hash
+from resource_item.models import ResourceItem
+from resource_item.serializers import (
+    DUPLICATE_URL_MESSAGE,
+    ResourceItemSerializer,
+)
+
+
+class CanonicalizeUrlTest(SimpleTestCase):
+    def test_equivalent_urls_share_a_canonical_form(self):
+        for url in (
+            "https://x.com/a",
+            "https://x.com/a/",
+            "HTTP://X.COM/a",
+            "http://x.com:80/a#section",
+            "https://x.com/a?utm_source=news&utm_medium=mail",
+            "https://x.com/a/?fbclid=abc",
+        ):
+            self.assertEqual(canonicalize_url(url), "https://x.com/a", url)
+
+    def test_meaningful_differences_are_kept(self):
+        self.assertEqual(
+            canonicalize_url("https://x.com/a?b=2&a=1"),
+            "https://x.com/a?a=1&b=2",
+        )
+        self.assertEqual(
+            canonicalize_url("https://x.com:8443/A"), "https://x.com:8443/A"
+        )
+        self.assertNotEqual(url_hash("https://x.com/a"),
+                            url_hash("https://x.com/b"))
+        self.assertEqual(len(url_hash("https://x.com/a")), 64)
+
+
+class CanonicalUrlDeduplicationTest(APITestCase):
+    @classmethod
+    def setUpTestData(cls):
+        cls.user = User.objects.create_user(username="owner", password="pw")
+        cls.item = ResourceItem.objects.create(
+            title="Canonical",
+            description="The original resource",
+            user=cls.user,
+            url="https://example.com/guide",
+        )
+        cls.list_url = reverse("resourceitem-list")
+
+    def setUp(self):
+        self.client.force_authenticate(self.user)
+
+    def payload(self, url, title="Copy"):
+        return {
+            "title": title,
+            "description": "A resource pointing to the same page",
+            "url": url,
+            "category": None,
+        }
+
+    def test_model_sets_the_hash_and_enforces_it(self):
+        self.assertEqual(self.item.url_hash,
+                         url_hash("https://example.com/guide"))
+        with self.assertRaises(IntegrityError):
+            ResourceItem.objects.create(
+                title="Clash", user=self.user,
+                url="HTTP://EXAMPLE.COM/guide/?utm_campaign=x",
+            )
+
+    def test_create_rejects_equivalent_url(self):
+        response = self.client.post(
+            self.list_url,
+            self.payload("http://example.com/guide/?utm_source=feed"),
+            format="json",
+        )
+        self.assertEqual(response.status_code, status.HTTP_400_BAD_REQUEST)
+        self.assertEqual(response.data["url"], [DUPLICATE_URL_MESSAGE])
+
+    def test_update_keeps_own_url(self):
+        response = self.client.patch(
+            reverse("resourceitem-detail", args=[self.item.pk]),
+            {"url": "https://example.com/guide/"},
+            format="json",
+        )
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+
+    def test_bulk_rejects_equivalent_urls(self):
+        response = self.client.post(
+            reverse("resourceitem-bulk"),
+            [
+                self.payload("https://example.com/guide#top", "One"),
+                self.payload("https://example.com/new", "Two"),
+                self.payload("http://example.com/new/", "Three"),
+            ],
+            format="json",
+        )
+        self.assertEqual(response.status_code, status.HTTP_201_CREATED)
+        self.assertEqual(
+            [error["index"] for error in response.data["errors"]], [0, 2]
+        )
+        created = ResourceItem.objects.get(title="Two")
+        self.assertEqual(created.url_hash, url_hash("https://example.com/new"))
+
+    def test_find_duplicate_urls_clusters_legacy_rows(self):
+        legacy = ResourceItem.objects.create(
+            title="Legacy", user=self.user, url="https://example.com/other"
+        )
+        # Rows stored before url_hash existed have no hash.
+        ResourceItem.objects.filter(pk=legacy.pk).update(
+            url="https://EXAMPLE.com/guide/", url_hash=None
+        )
+        out = StringIO()
+        with self.assertRaises(CommandError):
+            call_command("find_duplicate_urls", "--check", stdout=out)
+        output = out.getvalue()
+        self.assertIn("https://example.com/guide", output)
+        self.assertIn(f"{self.item.pk}: https://example.com/guide", output)
+        self.assertIn(f"{legacy.pk}: https://EXAMPLE.com/guide/", output)
+
+    def test_legacy_duplicate_stays_editable(self):
+        legacy = ResourceItem.objects.create(
+            title="Legacy", user=self.user, url="https://example.com/other"
+        )
+        ResourceItem.objects.filter(pk=legacy.pk).update(
+            url="https://EXAMPLE.com/guide/", url_hash=None
+        )
+        detail_url = reverse("resourceitem-detail", args=[legacy.pk])
+        response = self.client.patch(
+            detail_url, {"description": "Edited description"}, format="json"
+        )
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        legacy.refresh_from_db()
+        legacy.title = "Legacy (admin)"
+        legacy.save()
+        self.assertIsNone(legacy.url_hash)
+
+        response = self.client.patch(
+            detail_url, {"url": "https://example.com/guide#top"}, format="json"
+        )
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        response = self.client.patch(
+            detail_url, {"url": "https://example.com/fresh"}, format="json"
+        )
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        legacy.refresh_from_db()
+        self.assertEqual(legacy.url_hash, url_hash("https://example.com/fresh"))
+
+    def test_concurrent_url_conflict_is_a_validation_error(self):
+        other = ResourceItem.objects.create(
+            title="Other", user=self.user, url="https://example.com/other"
+        )
+        with mock.patch.object(
+            ResourceItemSerializer, "url_taken", return_value=False
+        ):
+            response = self.client.patch(
+                reverse("resourceitem-detail", args=[other.pk]),
+                {"url": "https://example.com/guide"},
+                format="json",
+            )
+        self.assertEqual(response.status_code, status.HTTP_400_BAD_REQUEST)
+        self.assertEqual(response.data["url"], [DUPLICATE_URL_MESSAGE])
+
+    def test_admin_form_rejects_equivalent_url(self):
+        admin = User.objects.create_superuser(
+            username="admin", password="pw", email="admin@example.com"
+        )
+        self.client.force_login(admin)
+        response = self.client.post(
+            reverse("admin:resource_item_resourceitem_add"),
+            {
+                "title": "Admin copy",
+                "description": "Added through the admin",
+                "user": self.user.pk,
+                "url": "https://EXAMPLE.com/guide/",
+            },
+        )
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertEqual(
+            response.context["adminform"].form.errors["url"],
+            [DUPLICATE_URL_MESSAGE],
+        )
+        self.assertEqual(ResourceItem.objects.count(), 1)
@@ -0,0 +1,122 @@
+"""
+Unit tests for conditional GET support on the ResourceItem endpoints.
+
+Covered cases:
+- ETag and Last-Modified headers on list and detail responses
+- 304 Not Modified without serializing when validators match
+- Fresh 200 after an edit, a new rating, a new comment or a different
+  query
+- Ratings and comments move changed_at but leave updated_at alone
+- Paginated pages are validated from their own rows, without an aggregate
+  query over the whole list
+"""
+
+from django.contrib.auth.models import User
+from django.urls import reverse
+from rest_framework import status
+from rest_framework.test import APITestCase
+
+from comment.models import Comment
+from rating.models import Rating
+from resource_item.models import ResourceItem
+
+
+class ResourceItemConditionalGetTest(APITestCase):
+    @classmethod
+    def setUpTestData(cls):
+        cls.owner = User.objects.create_user(username="owner", password="pw")
+        cls.rater = User.objects.create_user(username="rater", password="pw")
+        cls.item = ResourceItem.objects.create(
+            title="Cached",
+            description="Conditional GET resource",
+            user=cls.owner,
+            url="https://example.com/cached"
+        )
+        cls.list_url = reverse("resourceitem-list")
+        cls.detail_url = reverse("resourceitem-detail", args=[cls.item.pk])
+
+    def test_headers_present(self):
+        for url in (self.list_url, self.detail_url):
+            response = self.client.get(url)
+            self.assertIn("ETag", response)
+            self.assertIn("Last-Modified", response)
+
+    def test_list_not_modified_skips_serialization(self):
+        """A matching ETag costs only the aggregate query."""
+        etag = self.client.get(self.list_url)["ETag"]
+        with self.assertNumQueries(1):
+            response = self.client.get(
+                self.list_url, HTTP_IF_NONE_MATCH=etag
+            )
+        self.assertEqual(response.status_code, status.HTTP_304_NOT_MODIFIED)
+        self.assertEqual(response.content, b"")
+
+    def test_detail_not_modified(self):
+        etag = self.client.get(self.detail_url)["ETag"]
+        response = self.client.get(self.detail_url, HTTP_IF_NONE_MATCH=etag)
+        self.assertEqual(response.status_code, status.HTTP_304_NOT_MODIFIED)
+
+    def test_edit_changes_etag(self):
+        etag = self.client.get(self.detail_url)["ETag"]
+        self.client.force_authenticate(self.owner)
+        self.client.patch(self.detail_url, {"title": "Edited"})
+        response = self.client.get(self.detail_url, HTTP_IF_NONE_MATCH=etag)
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+
+    def test_new_rating_changes_etag(self):
+        """Rating aggregates are part of the representation."""
+        etag = self.client.get(self.list_url)["ETag"]
+        Rating.objects.create(user=self.rater, resource_item=self.item, score=5)
+        response = self.client.get(self.list_url, HTTP_IF_NONE_MATCH=etag)
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+
+    def test_new_comment_changes_etag(self):
+        etag = self.client.get(self.detail_url)["ETag"]
+        Comment.objects.create(
+            user=self.rater, resource_item=self.item, content="Nice"
+        )
+        response = self.client.get(self.detail_url, HTTP_IF_NONE_MATCH=etag)
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+
+    def test_activity_keeps_updated_at(self):
+        """updated_at only follows the owner's edits."""
+        Rating.objects.create(user=self.rater, resource_item=self.item, score=5)
+        Comment.objects.create(
+            user=self.rater, resource_item=self.item, content="Nice"
+        )
+        item = ResourceItem.objects.get(pk=self.item.pk)
+        self.assertEqual(item.updated_at, self.item.updated_at)
+        self.assertGreater(item.changed_at, self.item.changed_at)
+
+    def test_page_validated_from_its_rows(self):
+        ResourceItem.objects.create(
+            title="Second",
+            description="Conditional GET resource",
+            user=self.owner,
+            url="https://example.com/cached-2",
+        )
+        params = {"page_size": 1}
+        etag = self.client.get(self.list_url, params)["ETag"]
+        # The page and its tag prefetch; no aggregate over the list.
+        with self.assertNumQueries(2):
+            response = self.client.get(
+                self.list_url, params, HTTP_IF_NONE_MATCH=etag
+            )
+        self.assertEqual(response.status_code, status.HTTP_304_NOT_MODIFIED)
+
+        # The newest row is on the page; deleting it changes the page.
+        ResourceItem.objects.get(title="Second").delete()
+        response = self.client.get(
+            self.list_url, params, HTTP_IF_NONE_MATCH=etag
+        )
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertEqual(
+            [item["id"] for item in response.data["results"]], [self.item.pk]
+        )
+
+    def test_etag_depends_on_query(self):
+        etag = self.client.get(self.list_url)["ETag"]
+        response = self.client.get(
+            self.list_url, {"ordering": "title"}, HTTP_IF_NONE_MATCH=etag
+        )
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
@@ -0,0 +1,107 @@
+"""
+Unit tests for the NDJSON catalog export.
+
+Covered cases:
+- export.ndjson streams one JSON object per resource, staff only
+- Under ASGI the response streams from an async iterator
+- Rows carry category and tag names, rating aggregates and bookmark counts
+- Queries grow with the number of chunks, not the number of rows
+- The export_resources command writes the same lines to a file
+"""
+import json
+import os
+import tempfile
+from io import StringIO
+
+from django.contrib.auth.models import User
+from django.core.management import call_command
+from django.urls import reverse
+from rest_framework import status
+from rest_framework.test import APITestCase
+
+from bookmark.models import Bookmark
+from category.models import Category
+from resource_item.export import iter_ndjson
+from resource_item.models import ResourceItem
+from tag.models import Tag
+
+
+class ResourceExportTest(APITestCase):
+    @classmethod
+    def setUpTestData(cls):
+        cls.owner = User.objects.create_user(username="owner", password="pw")
+        cls.staff = User.objects.create_user(
+            username="staff", password="pw", is_staff=True
+        )
+        cls.category = Category.objects.create(name="Guides")
+        cls.tags = [Tag.objects.create(name=f"export-{n}") for n in range(2)]
+        cls.items = []
+        for n in range(5):
+            item = ResourceItem.objects.create(
+                title=f"Export {n}",
+                user=cls.owner,
+                category=cls.category if n % 2 else None,
+                url=f"https://example.com/export-{n}",
+            )
+            item.tags.set(cls.tags[:n % 3])
+            cls.items.append(item)
+        Bookmark.objects.create(user=cls.staff, resource=cls.items[1])
+        Bookmark.objects.create(user=cls.owner, resource=cls.items[1])
+        cls.export_url = reverse("resourceitem-export")
+
+    def read_stream(self, response):
+        content = b"".join(response.streaming_content).decode()
+        return [json.loads(line) for line in content.splitlines()]
+
+    def test_export_requires_staff(self):
+        self.client.force_authenticate(self.owner)
+        response = self.client.get(self.export_url)
+        self.assertEqual(response.status_code, status.HTTP_403_FORBIDDEN)
+
+    def test_export_streams_every_resource(self):
+        self.client.force_authenticate(self.staff)
+        response = self.client.get(self.export_url)
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertTrue(response.streaming)
+        self.assertEqual(response["Content-Type"], "application/x-ndjson")
+
+        rows = self.read_stream(response)
+        self.assertEqual(
+            [row["id"] for row in rows], [item.pk for item in self.items]
+        )
+        self.assertEqual(rows[1]["category"], "Guides")
+        self.assertIsNone(rows[0]["category"])
+        self.assertEqual(rows[2]["tags"], ["export-0", "export-1"])
+        self.assertEqual(rows[1]["bookmark_count"], 2)
+        self.assertEqual(rows[0]["bookmark_count"], 0)
+        self.assertEqual(rows[0]["rating_avg"], 0.0)
+
+    async def test_asgi_export_streams_asynchronously(self):
+        await self.async_client.aforce_login(self.staff)
+        response = await self.async_client.get(self.export_url)
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertTrue(response.is_async)
+        content = b"".join([chunk async for chunk in response])
+        rows = [json.loads(line) for line in content.decode().splitlines()]
+        self.assertEqual(
+            [row["id"] for row in rows], [item.pk for item in self.items]
+        )
+
+    def test_queries_scale_with_chunks_not_rows(self):
+        """
+        The rows come from one cursor read chunk by chunk; each chunk
+        adds one tag prefetch.
+        """
+        with self.assertNumQueries(1 + 3):
+            lines = list(iter_ndjson(chunk_size=2))
+        self.assertEqual(len(lines), 5)
+
+    def test_export_command_writes_file(self):
+        with tempfile.TemporaryDirectory() as directory:
+            path = os.path.join(directory, "resources.ndjson")
+            out = StringIO()
+            call_command("export_resources", "--output", path, stdout=out)
+            with open(path, encoding="utf-8") as export:
+                rows = [json.loads(line) for line in export]
+        self.assertEqual(len(rows), 5)
+        self.assertIn("Exported 5 resource item(s)", out.getvalue())
@@ -0,0 +1,142 @@
+"""
+Unit tests for the import_resources management command.
+
+Covered cases:
+- Rows are created with their categories and tags resolved by name
+- Each missing category and tag is created exactly once
+- Existing URLs and titles are skipped, so re-running is harmless
+- Throughput is reported
+- A bad line aborts with the line to resume from, and --start-line resumes
+- Wrongly typed fields, over-long titles and invalid URLs are reported
+  with their line number
+- The export_resources output can be imported again
+"""
+import json
+import os
+import tempfile
+from io import StringIO
+
+from django.contrib.auth.models import User
+from django.core.management import call_command
+from django.core.management.base import CommandError
+from django.test import TestCase
+
+from category.models import Category
+from resource_item.models import ResourceItem
+from tag.models import Tag
+
+
+class ImportResourcesTest(TestCase):
+    @classmethod
+    def setUpTestData(cls):
+        cls.user = User.objects.create_user(username="seeder", password="pw")
+        Category.objects.create(name="Existing")
+
+    def setUp(self):
+        self.directory = tempfile.TemporaryDirectory()
+        self.addCleanup(self.directory.cleanup)
+
+    def write_file(self, lines):
+        path = os.path.join(self.directory.name, "resources.ndjson")
+        with open(path, "w", encoding="utf-8") as output:
+            for line in lines:
+                output.write(
+                    (line if isinstance(line, str) else json.dumps(line))
+                    + "\n"
+                )
+        return path
+
+    def run_import(self, path, *args):
+        out = StringIO()
+        call_command(
+            "import_resources", path, "--user", "seeder", *args, stdout=out
+        )
+        return out.getvalue()
+
+    def rows(self, count, start=0):
+        return [
+            {
+                "title": f"Imported {n}",
+                "url": f"https://example.com/imported-{n}",
+                "description": "Seed data",
+                "category": "Existing" if n % 2 else "New",
+                "tags": ["python", f"tag-{n % 3}"],
+            }
+            for n in range(start, start + count)
+        ]
+
+    def test_import_creates_rows_with_names_resolved(self):
+        path = self.write_file(self.rows(10))
+        output = self.run_import(path, "--batch-size", "4")
+
+        self.assertEqual(ResourceItem.objects.count(), 10)
+        self.assertEqual(
+            set(Category.objects.values_list("name", flat=True)),
+            {"Existing", "New"},
+        )
+        self.assertEqual(Tag.objects.count(), 4)
+        item = ResourceItem.objects.get(title="Imported 4")
+        self.assertEqual(item.user, self.user)
+        self.assertEqual(item.category.name, "New")
+        self.assertEqual(
+            sorted(item.tags.values_list("name", flat=True)),
+            ["python", "tag-1"],
+        )
+        self.assertIn("rows/s", output)
+        self.assertIn("created 1 category(ies) and 4 tag(s)", output)
+
+    def test_duplicates_are_skipped(self):
+        path = self.write_file(self.rows(3) + self.rows(1))
+        self.run_import(path)
+        output = self.run_import(path)
+        self.assertEqual(ResourceItem.objects.count(), 3)
+        self.assertIn("Imported 0 resource item(s), skipped 4", output)
+
+    def test_failure_reports_resume_line_and_start_line_resumes(self):
+        lines = self.rows(4) + ["{not json"] + self.rows(3, start=4)
+        path = self.write_file(lines)
+        with self.assertRaisesMessage(
+            CommandError, "resume with --start-line 5"
+        ):
+            self.run_import(path, "--batch-size", "2")
+        # The batch holding line 5 (lines 5-6) was rolled back.
+        self.assertEqual(ResourceItem.objects.count(), 4)
+
+        self.run_import(path, "--start-line", "6")
+        self.assertEqual(ResourceItem.objects.count(), 7)
+
+    def test_wrong_types_are_reported_with_line_number(self):
+        for field, value, message in (
+            ("tags", "python", "Line 2: tags must be a list of strings."),
+            ("tags", ["python", 3], "Line 2: tags must be a list of strings."),
+            ("category", ["New"], "Line 2: category must be a string or null."),
+            ("title", 7, "Line 2: title must be a string."),
+            ("title", "x" * 201,
+             "Line 2: title is longer than 200 characters."),
+            ("url", "not a url", "Line 2: url is not a valid URL."),
+        ):
+            with self.subTest(field=field, value=value):
+                rows = self.rows(2)
+                rows[1][field] = value
+                with self.assertRaisesMessage(CommandError, message):
+                    self.run_import(self.write_file(rows))
+        self.assertFalse(ResourceItem.objects.exists())
+
+    def test_export_output_can_be_imported(self):
+        source = User.objects.create_user(username="source", password="pw")
+        item = ResourceItem.objects.create(
+            title="Round trip",
+            url="https://example.com/round-trip",
+            user=source,
+            category=Category.objects.get(name="Existing"),
+        )
+        item.tags.set([Tag.objects.create(name="exported")])
+        path = os.path.join(self.directory.name, "export.ndjson")
+        call_command("export_resources", "--output", path, stdout=StringIO())
+        item.delete()
+
+        self.run_import(path)
+        imported = ResourceItem.objects.get(url="https://example.com/round-trip")
+        self.assertEqual(imported.user, self.user)
+        self.assertEqual(list(imported.tags.values_list("name", flat=True)),
+                         ["exported"])
@@ -12,6 +12,7 @@ Covered cases:
 - Field length constraint for description
 - String representation
 - Default ordering (by created_at desc)
+- Saving a stale instance keeps the rating and comment aggregates
 """
 
 from django.test import TestCase
@@ -20,6 +21,8 @@ from category.models import Category
 from tag.models import Tag
 from resource_item.models import ResourceItem
 from django.db import IntegrityError, transaction
+from comment.models import Comment
+from rating.models import Rating
 
 
 class ResourceItemModelTest(TestCase):
@@ -144,3 +147,25 @@ class ResourceItemModelTest(TestCase):
         qs = ResourceItem.objects.all()
         self.assertEqual(qs.first(), item2)
         self.assertEqual(qs.last(), item1)
+
+    def test_stale_save_keeps_aggregates(self):
+        """A save() from an instance loaded before new ratings and
+        comments must not reset the counters they maintain."""
+        item = ResourceItem.objects.create(
+            title="Stale",
+            description="Loaded before the activity",
+            user=self.user,
+            url="https://stale.com"
+        )
+        Rating.objects.create(user=self.user, resource_item=item, score=4)
+        Comment.objects.create(
+            user=self.user, resource_item=item, content="Hello"
+        )
+        item.title = "Edited"
+        item.save()
+        item.refresh_from_db()
+        self.assertEqual(item.title, "Edited")
+        self.assertEqual((item.rating_count, item.rating_sum), (1, 4))
+        self.assertEqual(item.rating_4_count, 1)
+        self.assertEqual(item.comment_count, 1)
+        self.assertIsNotNone(item.last_commented_at)
@@ -0,0 +1,124 @@
+"""
+Unit tests for keyset pagination on the ResourceItem list endpoint.
+
+Covered cases:
+- Unpaginated list when the client does not opt in
+- Walking forward through all pages without gaps or duplicates
+- Tie-breaking on id when created_at values collide
+- Walking back with the previous cursor
+- Keyset ordering follows ?ordering=title
+- Invalid cursors are rejected, including malformed ordering values and
+  cursors taken under another ordering
+"""
+import json
+from base64 import b64encode
+from urllib.parse import urlencode
+
+from django.contrib.auth.models import User
+from django.urls import reverse
+from django.utils import timezone
+from rest_framework import status
+from rest_framework.test import APITestCase
+
+from category.models import Category
+from resource_item.models import ResourceItem
+
+
+class ResourceItemPaginationTest(APITestCase):
+    @classmethod
+    def setUpTestData(cls):
+        """Create a user, a category and seven resource items."""
+        cls.user = User.objects.create_user(username="owner", password="pw")
+        cls.category = Category.objects.create(name="books")
+        cls.items = [
+            ResourceItem.objects.create(
+                title=f"Item {chr(ord('G') - i)}",
+                description="Paginated resource",
+                user=cls.user,
+                category=cls.category,
+                url=f"https://example.com/page-{i}"
+            )
+            for i in range(7)
+        ]
+        cls.list_url = reverse("resourceitem-list")
+
+    def collect(self, url):
+        """Follow `next` links and return every id seen, page by page."""
+        pages = []
+        while url:
+            response = self.client.get(url)
+            self.assertEqual(response.status_code, status.HTTP_200_OK)
+            pages.append([item["id"] for item in response.data["results"]])
+            url = response.data["next"]
+        return pages
+
+    def test_list_is_unpaginated_by_default(self):
+        """Without cursor or page_size the response stays a plain list."""
+        response = self.client.get(self.list_url)
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertIsInstance(response.data, list)
+        self.assertEqual(len(response.data), 7)
+
+    def test_walk_all_pages(self):
+        """Every item appears exactly once, newest first."""
+        pages = self.collect(f"{self.list_url}?page_size=3")
+        self.assertEqual([len(page) for page in pages], [3, 3, 1])
+        ids = [pk for page in pages for pk in page]
+        self.assertEqual(ids, [item.pk for item in reversed(self.items)])
+
+    def test_tie_breaker_on_identical_timestamps(self):
+        """Rows sharing created_at are split across pages by id."""
+        ResourceItem.objects.update(created_at=timezone.now())
+        pages = self.collect(f"{self.list_url}?page_size=2")
+        ids = [pk for page in pages for pk in page]
+        self.assertEqual(ids, sorted(ids, reverse=True))
+        self.assertEqual(len(set(ids)), 7)
+
+    def test_previous_link_returns_previous_page(self):
+        """The previous cursor of page two yields page one again."""
+        first = self.client.get(f"{self.list_url}?page_size=3")
+        second = self.client.get(first.data["next"])
+        self.assertIsNone(first.data["previous"])
+        back = self.client.get(second.data["previous"])
+        self.assertEqual(back.data["results"], first.data["results"])
+
+    def test_keyset_follows_ordering_filter(self):
+        """?ordering=title pages through titles in ascending order."""
+        pages = self.collect(f"{self.list_url}?ordering=title&page_size=4")
+        ids = [pk for page in pages for pk in page]
+        titles = [ResourceItem.objects.get(pk=pk).title for pk in ids]
+        self.assertEqual(titles, sorted(titles))
+        self.assertEqual(len(ids), 7)
+
+    def test_invalid_cursor(self):
+        """A cursor that cannot be decoded returns 404."""
+        response = self.client.get(f"{self.list_url}?cursor=not-a-cursor")
+        self.assertEqual(response.status_code, status.HTTP_404_NOT_FOUND)
+
+    def test_malformed_cursor_positions(self):
+        """Bad ordering values in a well-formed cursor return 404."""
+        for position in (
+            ["-created_at", "garbage", 1],
+            ["-created_at", None, 1],
+            ["-created_at", [1], 1],
+            ["-created_at", "2026-01-01T00:00:00+00:00", "x"],
+            ["-title", "Item A", 1],
+            ["garbage", 1],
+        ):
+            with self.subTest(position=position):
+                cursor = b64encode(
+                    urlencode({"p": json.dumps(position)}).encode()
+                ).decode()
+                response = self.client.get(self.list_url, {"cursor": cursor})
+                self.assertEqual(
+                    response.status_code, status.HTTP_404_NOT_FOUND
+                )
+
+    def test_cursor_bound_to_its_ordering(self):
+        """A ?ordering=title cursor is not reused for the default order."""
+        first = self.client.get(
+            self.list_url, {"ordering": "title", "page_size": 3}
+        )
+        cursor = first.data["next"].split("cursor=")[1].split("&")[0]
+        response = self.client.get(f"{self.list_url}?cursor={cursor}")
+        self.assertEqual(response.status_code, status.HTTP_404_NOT_FOUND)
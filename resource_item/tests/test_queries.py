@@ -0,0 +1,91 @@
+"""
+Query-count regression tests for the ResourceItem API endpoints.
+
+A list response must cost a fixed number of queries no matter how many
+items (and tags per item) it contains.
+
+Covered cases:
+- Unpaginated list with few and many items
+- Keyset-paginated list with small and large page sizes
+- Detail view
+"""
+
+from django.contrib.auth.models import User
+from django.urls import reverse
+from rest_framework import status
+from rest_framework.test import APITestCase
+
+from category.models import Category
+from resource_item.models import ResourceItem
+from tag.models import Tag
+
+# One query for the resource rows (category and user joined) plus one
+# prefetch query for all of their tags.
+DETAIL_QUERIES = 2
+# Unpaginated lists also run one aggregate query for their ETag /
+# Last-Modified; pages build them from their own rows.
+LIST_QUERIES = DETAIL_QUERIES + 1
+PAGE_QUERIES = DETAIL_QUERIES
+
+
+class ResourceItemQueryCountTest(APITestCase):
+    @classmethod
+    def setUpTestData(cls):
+        """Create a user, a category and three tags."""
+        cls.user = User.objects.create_user(username="owner", password="pw")
+        cls.category = Category.objects.create(name="books")
+        cls.tags = [Tag.objects.create(name=f"tag-{i}") for i in range(3)]
+        cls.list_url = reverse("resourceitem-list")
+
+    def create_items(self, count):
+        """Create `count` more tagged resource items."""
+        start = ResourceItem.objects.count()
+        for i in range(start, start + count):
+            item = ResourceItem.objects.create(
+                title=f"Item {i}",
+                description="Query count resource",
+                user=self.user,
+                category=self.category,
+                url=f"https://example.com/queries-{i}"
+            )
+            item.tags.set(self.tags)
+
+    def test_list_query_count_is_constant(self):
+        """Listing 2 or 25 items costs the same number of queries."""
+        self.create_items(2)
+        with self.assertNumQueries(LIST_QUERIES):
+            response = self.client.get(self.list_url)
+        self.assertEqual(len(response.data), 2)
+
+        self.create_items(25)
+        with self.assertNumQueries(LIST_QUERIES):
+            response = self.client.get(self.list_url)
+        self.assertEqual(len(response.data), 27)
+
+    def test_paginated_query_count_is_constant(self):
+        """Page size does not change the number of queries per page."""
+        self.create_items(30)
+        for page_size in (5, 30):
+            with self.assertNumQueries(PAGE_QUERIES):
+                response = self.client.get(
+                    self.list_url, {"page_size": page_size}
+                )
+            self.assertEqual(response.status_code, status.HTTP_200_OK)
+            self.assertEqual(len(response.data["results"]), page_size)
+
+    def test_tags_rendered_from_prefetch(self):
+        """Every item in the list still renders all of its tags."""
+        self.create_items(3)
+        response = self.client.get(self.list_url)
+        expected = sorted(tag.pk for tag in self.tags)
+        for item in response.data:
+            self.assertEqual(sorted(item["tags"]), expected)
+
+    def test_detail_query_count(self):
+        """Retrieving a single item costs two queries."""
+        self.create_items(1)
+        item = ResourceItem.objects.get()
+        url = reverse("resourceitem-detail", args=[item.pk])
+        with self.assertNumQueries(DETAIL_QUERIES):
+            response = self.client.get(url)
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
@@ -0,0 +1,143 @@
+"""
+Unit tests for full-text search on the ResourceItem and Comment endpoints.
+
+Covered cases:
+- ILIKE fallback on backends other than PostgreSQL
+- Trigger-maintained search vector on PostgreSQL
+- Relevance ordering (title matches before description matches)
+- Explicit ?ordering= overrides relevance ordering
+- Keyset pages of a ranked search keep rank order
+"""
+
+import unittest
+
+from django.contrib.auth.models import User
+from django.db import connection
+from django.db.models import Case, FloatField, Value, When
+from django.urls import reverse
+from rest_framework import status
+from rest_framework.request import Request
+from rest_framework.test import APIRequestFactory, APITestCase
+
+from lazydog_api.filters import RANK_ANNOTATION
+from lazydog_api.pagination import KeysetCursorPagination
+
+from comment.models import Comment
+from resource_item.models import ResourceItem
+
+requires_postgresql = unittest.skipUnless(
+    connection.vendor == "postgresql", "PostgreSQL full-text search only"
+)
+
+
+class FullTextSearchTest(APITestCase):
+    @classmethod
+    def setUpTestData(cls):
+        """Create two resources mentioning 'django' in different fields."""
+        cls.user = User.objects.create_user(username="owner", password="pw")
+        cls.in_description = ResourceItem.objects.create(
+            title="Web frameworks compared",
+            description="Covers flask and django in depth",
+            user=cls.user,
+            url="https://example.com/search-1"
+        )
+        cls.in_title = ResourceItem.objects.create(
+            title="Django for beginners",
+            description="A gentle introduction",
+            user=cls.user,
+            url="https://example.com/search-2"
+        )
+        cls.comment = Comment.objects.create(
+            user=cls.user,
+            resource_item=cls.in_description,
+            content="Great walkthrough of the ORM"
+        )
+        cls.list_url = reverse("resourceitem-list")
+        cls.comment_url = reverse("comment-list")
+
+    def search_ids(self, url, **params):
+        response = self.client.get(url, params)
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        return [item["id"] for item in response.data]
+
+    def test_search_matches_title_and_description(self):
+        """Both resources are found whichever field holds the term."""
+        ids = self.search_ids(self.list_url, search="django")
+        self.assertCountEqual(
+            ids, [self.in_title.pk, self.in_description.pk]
+        )
+
+    def test_search_without_match(self):
+        """A term that appears nowhere returns an empty list."""
+        self.assertEqual(self.search_ids(self.list_url, search="rails"), [])
+
+    def test_comment_search_by_resource_title(self):
+        """Comments are found through the title of their resource."""
+        ids = self.search_ids(self.comment_url, search="frameworks")
+        self.assertEqual(ids, [self.comment.pk])
+
+    def test_explicit_ordering_wins(self):
+        """?ordering= is applied instead of relevance ordering."""
+        ids = self.search_ids(
+            self.list_url, search="django", ordering="title"
+        )
+        self.assertEqual(ids, [self.in_title.pk, self.in_description.pk])
+
+    @requires_postgresql
+    def test_search_vector_maintained_by_trigger(self):
+        """The trigger fills the vector on insert and on title change."""
+        item = ResourceItem.objects.get(pk=self.in_title.pk)
+        self.assertTrue(
+            ResourceItem.objects.filter(
+                pk=item.pk, search_vector="beginner"
+            ).exists()
+        )
+        item.title = "Flask for beginners"
+        item.save()
+        self.assertFalse(
+            ResourceItem.objects.filter(
+                pk=item.pk, search_vector="django"
+            ).exists()
+        )
+
+    @requires_postgresql
+    def test_title_match_ranks_first(self):
+        """Title hits (weight A) rank above description hits (weight B)."""
+        ids = self.search_ids(self.list_url, search="django")
+        self.assertEqual(ids, [self.in_title.pk, self.in_description.pk])
+
+    @requires_postgresql
+    def test_ranked_search_pages_keep_rank_order(self):
+        """Each page of ?search= continues in relevance order."""
+        response = self.client.get(
+            self.list_url, {"search": "django", "page_size": 1}
+        )
+        ids = [item["id"] for item in response.data["results"]]
+        response = self.client.get(response.data["next"])
+        ids += [item["id"] for item in response.data["results"]]
+        self.assertEqual(ids, [self.in_title.pk, self.in_description.pk])
+
+    def test_keyset_pages_by_rank_annotation(self):
+        """
+        The paginator seeks on the rank whenever it is annotated and no
+        ?ordering= was given; checked with a stand-in rank on any backend.
+        """
+        queryset = ResourceItem.objects.annotate(**{
+            RANK_ANNOTATION: Case(
+                # The older resource ranks first, against created_at order.
+                When(title__icontains="frameworks", then=Value(0.9)),
+                default=Value(0.1),
+                output_field=FloatField(),
+            )
+        })
+        factory = APIRequestFactory()
+        ids = []
+        url = "/?page_size=1"
+        while url:
+            paginator = KeysetCursorPagination()
+            page = paginator.paginate_queryset(
+                queryset, Request(factory.get(url))
+            )
+            ids += [item.pk for item in page]
+            url = paginator.get_next_link()
+        self.assertEqual(ids, [self.in_description.pk, self.in_title.pk])
@@ -0,0 +1,141 @@
+"""
+Unit tests for the trending score table and feed.
+
+Covered cases:
+- update_trending weighs ratings, bookmarks and comments with time decay
+- Later runs only read events created since the watermark
+- The watermark trails the clock, so late commits are counted next run
+- Scores that decayed away are pruned, --rebuild recounts the window
+- GET /trending/ lists scored resources, highest first, with cursors
+"""
+import math
+from datetime import timedelta
+from io import StringIO
+from unittest import mock
+
+from django.conf import settings
+from django.contrib.auth.models import User
+from django.core.management import call_command
+from django.urls import reverse
+from django.test import override_settings
+from django.utils import timezone
+from rest_framework.test import APITestCase
+
+from bookmark.models import Bookmark
+from comment.models import Comment
+from rating.models import Rating
+from resource_item.models import ResourceItem, TrendingScore, TrendingState
+
+NOW_PATH = "resource_item.management.commands.update_trending.timezone.now"
+
+
+@override_settings(TRENDING_SETTLE_SECONDS=0)
+class TrendingTest(APITestCase):
+    @classmethod
+    def setUpTestData(cls):
+        cls.owner = User.objects.create_user(username="owner", password="pw")
+        cls.fan = User.objects.create_user(username="fan", password="pw")
+        cls.items = [
+            ResourceItem.objects.create(
+                title=f"Trending {n}",
+                user=cls.owner,
+                url=f"https://example.com/trending-{n}",
+            )
+            for n in range(3)
+        ]
+        cls.now = timezone.now()
+        cls.trending_url = reverse("resourceitem-trending")
+
+    def run_command(self, at=None, *args):
+        with mock.patch(NOW_PATH, return_value=at or self.now):
+            call_command("update_trending", *args, stdout=StringIO())
+
+    def scores(self):
+        return dict(
+            TrendingScore.objects.values_list("resource_id", "score")
+        )
+
+    def age(self, model, hours):
+        model.objects.update(created_at=self.now - timedelta(hours=hours))
+
+    def test_recent_activity_outranks_old_activity(self):
+        Bookmark.objects.create(user=self.fan, resource=self.items[0])
+        self.age(Bookmark, settings.TRENDING_HALF_LIFE_HOURS)
+        Comment.objects.create(
+            user=self.fan, resource_item=self.items[1], content="Nice"
+        )
+        Rating.objects.create(
+            user=self.fan, resource_item=self.items[1], score=5
+        )
+        self.age(Comment, 0)
+        self.age(Rating, 0)
+
+        self.run_command()
+        scores = self.scores()
+        # One half-life old bookmark (3.0) is worth half.
+        self.assertAlmostEqual(scores[self.items[0].pk], 1.5)
+        self.assertAlmostEqual(scores[self.items[1].pk], 3.0)
+        self.assertNotIn(self.items[2].pk, scores)
+
+    def test_incremental_run_only_adds_new_events(self):
+        Bookmark.objects.create(user=self.fan, resource=self.items[0])
+        self.age(Bookmark, 0)
+        self.run_command()
+
+        later = self.now + timedelta(hours=1)
+        Comment.objects.create(
+            user=self.fan, resource_item=self.items[0], content="Again"
+        )
+        Comment.objects.update(created_at=later)
+        self.run_command(later)
+
+        decay = math.log(2) / (settings.TRENDING_HALF_LIFE_HOURS * 3600)
+        expected = 3.0 + math.exp(decay * 3600)
+        self.assertAlmostEqual(self.scores()[self.items[0].pk], expected)
+        self.assertEqual(TrendingState.objects.get().watermark, later)
+
+    @override_settings(TRENDING_SETTLE_SECONDS=60)
+    def test_watermark_waits_for_late_commits(self):
+        Bookmark.objects.create(user=self.fan, resource=self.items[0])
+        self.age(Bookmark, 0)
+        self.run_command()
+        self.assertEqual(self.scores(), {})
+        self.assertEqual(
+            TrendingState.objects.get().watermark,
+            self.now - timedelta(seconds=60),
+        )
+
+        self.run_command(self.now + timedelta(seconds=60))
+        self.assertIn(self.items[0].pk, self.scores())
+
+    def test_decayed_scores_are_pruned_and_rebuild_recounts(self):
+        Comment.objects.create(
+            user=self.fan, resource_item=self.items[0], content="Old"
+        )
+        self.age(Comment, 0)
+        self.run_command()
+        self.assertIn(self.items[0].pk, self.scores())
+
+        self.run_command(self.now + timedelta(days=30))
+        self.assertEqual(self.scores(), {})
+
+        self.run_command(self.now, "--rebuild")
+        self.assertAlmostEqual(self.scores()[self.items[0].pk], 1.0)
+
+    def test_trending_feed_is_ordered_and_paginated(self):
+        TrendingScore.objects.bulk_create([
+            TrendingScore(resource=self.items[0], score=1.0),
+            TrendingScore(resource=self.items[1], score=5.0),
+            TrendingScore(resource=self.items[2], score=3.0),
+        ])
+        response = self.client.get(self.trending_url, {"page_size": 2})
+        self.assertEqual(
+            [item["id"] for item in response.data["results"]],
+            [self.items[1].pk, self.items[2].pk],
+        )
+        response = self.client.get(response.data["next"])
+        self.assertEqual(
+            [item["id"] for item in response.data["results"]],
+            [self.items[0].pk],
+        )
+        self.assertIsNone(response.data["next"])
@@ -0,0 +1,127 @@
+"""
+Unit tests for the per-user `my_rating` / `is_bookmarked` fields.
+
+Covered cases:
+- Anonymous responses do not contain the fields
+- Authenticated list and detail responses carry the user's own state
+- A list page costs a constant number of queries
+- Bookmarking changes the list ETag
+- ?omit= leaves the subqueries out of the SQL, ?fields= can select them
+"""
+
+from django.contrib.auth.models import User
+from django.db import connection
+from django.test.utils import CaptureQueriesContext
+from django.urls import reverse
+from rest_framework import status
+from rest_framework.test import APITestCase
+
+from bookmark.models import Bookmark
+from rating.models import Rating
+from resource_item.models import ResourceItem
+
+# The resource rows with both subqueries, the tag prefetch, the ETag
+# aggregate and the user's bookmark aggregate for the ETag.
+AUTHENTICATED_LIST_QUERIES = 4
+
+
+class UserStateTest(APITestCase):
+    @classmethod
+    def setUpTestData(cls):
+        cls.user = User.objects.create_user(username="me", password="pw")
+        cls.other = User.objects.create_user(username="other", password="pw")
+        cls.rated = ResourceItem.objects.create(
+            title="Rated",
+            description="Rated by me",
+            user=cls.other,
+            url="https://example.com/state-rated",
+        )
+        cls.bookmarked = ResourceItem.objects.create(
+            title="Bookmarked",
+            description="Bookmarked by me",
+            user=cls.other,
+            url="https://example.com/state-bookmarked",
+        )
+        Rating.objects.create(user=cls.user, resource_item=cls.rated, score=4)
+        Rating.objects.create(
+            user=cls.other, resource_item=cls.bookmarked, score=2
+        )
+        Bookmark.objects.create(user=cls.user, resource=cls.bookmarked)
+        Bookmark.objects.create(user=cls.other, resource=cls.rated)
+        cls.list_url = reverse("resourceitem-list")
+
+    def create_items(self, count):
+        start = ResourceItem.objects.count()
+        for n in range(start, start + count):
+            item = ResourceItem.objects.create(
+                title=f"State {n}",
+                description="Padding",
+                user=self.other,
+                url=f"https://example.com/state-{n}",
+            )
+            Rating.objects.create(user=self.user, resource_item=item, score=3)
+            Bookmark.objects.create(user=self.user, resource=item)
+
+    def states(self, response):
+        return {
+            item["id"]: (item["my_rating"], item["is_bookmarked"])
+            for item in response.data
+        }
+
+    def test_anonymous_response_has_no_user_state(self):
+        response = self.client.get(self.list_url)
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        for item in response.data:
+            self.assertNotIn("my_rating", item)
+            self.assertNotIn("is_bookmarked", item)
+
+    def test_list_shows_own_state(self):
+        self.client.force_authenticate(self.user)
+        response = self.client.get(self.list_url)
+        self.assertEqual(self.states(response), {
+            self.rated.pk: (4, False),
+            self.bookmarked.pk: (None, True),
+        })
+
+    def test_detail_shows_own_state(self):
+        self.client.force_authenticate(self.other)
+        response = self.client.get(
+            reverse("resourceitem-detail", args=[self.bookmarked.pk])
+        )
+        self.assertEqual(response.data["my_rating"], 2)
+        self.assertFalse(response.data["is_bookmarked"])
+
+    def test_list_query_count_is_constant(self):
+        self.client.force_authenticate(self.user)
+        with self.assertNumQueries(AUTHENTICATED_LIST_QUERIES):
+            self.client.get(self.list_url)
+        self.create_items(10)
+        with self.assertNumQueries(AUTHENTICATED_LIST_QUERIES):
+            response = self.client.get(self.list_url)
+        self.assertEqual(len(response.data), 12)
+
+    def test_bookmark_changes_etag(self):
+        self.client.force_authenticate(self.user)
+        etag = self.client.get(self.list_url)["ETag"]
+        Bookmark.objects.create(user=self.user, resource=self.rated)
+        response = self.client.get(self.list_url, HTTP_IF_NONE_MATCH=etag)
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertTrue(self.states(response)[self.rated.pk][1])
+
+    def test_omitted_state_is_not_queried(self):
+        self.client.force_authenticate(self.user)
+        with CaptureQueriesContext(connection) as queries:
+            response = self.client.get(
+                self.list_url, {"omit": "my_rating,is_bookmarked"}
+            )
+        self.assertNotIn("my_rating", response.data[0])
+        sql = " ".join(q["sql"] for q in queries.captured_queries)
+        self.assertNotIn("rating_rating", sql)
+
+    def test_sparse_fieldset_keeps_state(self):
+        self.client.force_authenticate(self.user)
+        response = self.client.get(
+            reverse("resourceitem-detail", args=[self.rated.pk]),
+            {"fields": "id,my_rating"},
+        )
+        self.assertEqual(response.data, {"id": self.rated.pk, "my_rating": 4})
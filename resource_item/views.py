@@ -1,19 +1,87 @@
-from rest_framework import viewsets, filters
+from rest_framework import viewsets, filters, permissions, status
+from rest_framework.decorators import action
+from rest_framework.response import Response
+from django.core.handlers.asgi import ASGIRequest
+from django.db.models import Count, Exists, F, Max, OuterRef, Subquery
+from django.http import StreamingHttpResponse
+from django.shortcuts import get_object_or_404
 from django_filters.rest_framework import DjangoFilterBackend
-from .models import ResourceItem
-from .serializers import ResourceItemSerializer
+from .export import aiter_ndjson, iter_ndjson
+from .models import RATING_HISTOGRAM_FIELDS, ResourceItem
+from .serializers import (
+    USER_STATE_FIELDS, ResourceItemBulkItemSerializer, ResourceItemSerializer,
+)
+from bookmark.models import Bookmark
+from rating.models import Rating
+from lazydog_api.async_views import AsyncReadOnlyView
+from lazydog_api.filters import FullTextSearchFilter
+from lazydog_api.mixins import ConditionalGetMixin, SparseFieldsetMixin
 from lazydog_api.permissions import IsOwnerOrAdminOrReadOnly
+from lazydog_api.pagination import KeysetCursorPagination
 
 
-class ResourceItemViewSet(viewsets.ModelViewSet):
+class TrendingPagination(KeysetCursorPagination):
+    """
+    Always-on keyset pagination over the trending feed, highest score
+    first. The order is fixed; ?ordering= does not apply.
+    """
+    page_size = 20
+    ordering = ("-trending_score",)
+
+    def is_requested(self, request):
+        return True
+
+    def get_ordering(self, request, queryset, view):
+        return self.ordering
+
+
+class ResourceItemViewSet(SparseFieldsetMixin, ConditionalGetMixin,
+                          viewsets.ModelViewSet):
     """
     API endpoint that allows resource items to be viewed, created,
     edited, or deleted.
 
     Filtering:
     - Filter by category and tags
-    - Search by title and description
-    - Order by created_at and title
+    - Search by title and description (ranked full-text search on
+      PostgreSQL)
+    - Order by created_at, title, rating_avg, rating_count and
+      comment_count
+
+    Pagination:
+    - Opt-in keyset pagination with ?page_size= and the returned cursors
+
+    Sparse fieldsets:
+    - ?fields=id,title,url or ?omit=description; columns behind unrequested
+      fields are not loaded
+
+    Per-user state:
+    - For authenticated requests every resource carries `my_rating` (the
+      user's score or null) and `is_bookmarked`, computed by correlated
+      subqueries in the same query as the resources
+
+    Caching:
+    - List and detail responses carry ETag/Last-Modified and answer
+      conditional requests with 304 Not Modified; authenticated responses
+      get a per-user ETag and no Last-Modified. The validators come from
+      `changed_at`, so new ratings and comments invalidate them while
+      `updated_at` keeps tracking owner edits
+
+    Ratings:
+    - GET /<id>/ratings/summary/ returns the rating count, average and
+      per-score histogram from the stored counters, without reading the
+      ratings; ?expand=rating_histogram embeds the histogram in list and
+      detail responses
+
+    Trending:
+    - GET /trending/ lists recently active resources by their decayed
+      activity score (see `manage.py update_trending`)
+
+    Export:
+    - GET /export.ndjson/ streams the whole catalog as NDJSON (staff only)
+
+    Bulk creation:
+    - POST a JSON array to /bulk/ to create up to 1000 resources at once
 
     Permissions:
     - Anyone can view resources
@@ -22,15 +90,210 @@ class ResourceItemViewSet(viewsets.ModelViewSet):
     """
 
     serializer_class = ResourceItemSerializer
-    queryset = ResourceItem.objects.all()
+    # Join the FK columns and fetch all tags in one extra query, so a list
+    # response costs the same number of queries regardless of its length.
+    # The search document is only used in WHERE clauses, never rendered.
+    queryset = ResourceItem.objects.select_related(
+        "category", "user"
+    ).prefetch_related("tags").defer("search_vector")
     permission_classes = [IsOwnerOrAdminOrReadOnly]
+    pagination_class = KeysetCursorPagination
+    # updated_at only follows owner edits; changed_at also follows the
+    # rating and comment aggregates.
+    last_modified_field = "changed_at"
 
     filter_backends = [
         DjangoFilterBackend,
-        filters.SearchFilter,
         filters.OrderingFilter,
+        FullTextSearchFilter,
     ]
     filterset_fields = ["category", "tags", "user"]
-    ordering_fields = ["created_at", "title"]
+    ordering_fields = [
+        "created_at", "title", "rating_avg", "rating_count", "comment_count"
+    ]
     search_fields = ["title", "description"]
+    search_vector_fields = ["search_vector"]
     ordering = ["-created_at"]
+
+    # Largest JSON array accepted by the bulk endpoint.
+    bulk_max_items = 1000
+    expandable_fields = {"rating_histogram"}
+
+    def get_expand(self):
+        """
+        Return the set of requested `?expand=` fields this view supports.
+        """
+        requested = self.request.query_params.get("expand", "")
+        return {
+            name.strip() for name in requested.split(",")
+        } & self.expandable_fields
+
+    def get_serializer_context(self):
+        context = super().get_serializer_context()
+        context["expand"] = self.get_expand()
+        return context
+
+    def get_user_state_fields(self):
+        """
+        Return the USER_STATE_FIELDS to annotate: none for anonymous
+        requests, otherwise those not excluded by a sparse fieldset.
+        """
+        if not self.request.user.is_authenticated:
+            return set()
+        fields, omit = self.get_sparse_fieldset()
+        return {
+            name for name in USER_STATE_FIELDS
+            if (fields is None or name in fields) and name not in (omit or ())
+        }
+
+    def get_queryset(self):
+        queryset = super().get_queryset()
+        wanted = self.get_user_state_fields()
+        user = self.request.user
+        # Both subqueries are answered from the (user, resource) unique
+        # indexes of Rating and Bookmark.
+        if "my_rating" in wanted:
+            queryset = queryset.annotate(my_rating=Subquery(
+                Rating.objects.filter(
+                    user=user, resource_item=OuterRef("pk")
+                ).values("score")[:1]
+            ))
+        if "is_bookmarked" in wanted:
+            queryset = queryset.annotate(is_bookmarked=Exists(
+                Bookmark.objects.filter(user=user, resource=OuterRef("pk"))
+            ))
+        return queryset
+
+    def get_etag(self, request, *parts):
+        """
+        Authenticated responses also depend on the user's bookmarks, which
+        do not touch the resources' changed_at. Their count and newest ID
+        go into the ETag. Ratings do bump changed_at already.
+        """
+        if request.user.is_authenticated:
+            bookmarks = Bookmark.objects.filter(
+                user=request.user
+            ).order_by().aggregate(count=Count("pk"), latest=Max("pk"))
+            parts += (
+                request.user.pk, bookmarks["count"], bookmarks["latest"]
+            )
+        return super().get_etag(request, *parts)
+
+    def conditional_response(self, request, etag, last_modified, render):
+        # A bookmark removal leaves no timestamp behind, so per-user
+        # responses are validated by their ETag only.
+        if request.user.is_authenticated:
+            last_modified = None
+        return super().conditional_response(
+            request, etag, last_modified, render
+        )
+
+    @action(
+        detail=False,
+        methods=["get"],
+        pagination_class=TrendingPagination,
+    )
+    def trending(self, request):
+        """
+        List resources that have a trending score, highest first. Filters
+        and sparse fieldsets apply as on the list endpoint.
+        """
+        queryset = self.filter_queryset(self.get_queryset()).filter(
+            trending__isnull=False
+        ).annotate(trending_score=F("trending__score"))
+        page = self.paginate_queryset(queryset)
+        serializer = self.get_serializer(page, many=True)
+        return self.get_paginated_response(serializer.data)
+
+    @action(detail=True, methods=["get"], url_path="ratings/summary")
+    def rating_summary(self, request, pk=None):
+        """
+        Return the rating distribution of one resource. Reads one row of
+        counters however many ratings the resource has.
+        """
+        item = get_object_or_404(
+            ResourceItem.objects.only(
+                "id", "rating_count", "rating_avg",
+                *RATING_HISTOGRAM_FIELDS.values(),
+            ),
+            pk=pk,
+        )
+        return Response({
+            "resource": item.pk,
+            "count": item.rating_count,
+            "average": item.rating_avg,
+            "histogram": item.rating_histogram,
+        })
+
+    @action(
+        detail=False,
+        methods=["get"],
+        url_path="export.ndjson",
+        permission_classes=[permissions.IsAdminUser],
+    )
+    def export(self, request):
+        """
+        Stream every resource as one JSON object per line.
+
+        Under ASGI a synchronous iterator would be buffered in full before
+        the first byte is sent, so ASGI requests get the async iterator.
+        """
+        if isinstance(request._request, ASGIRequest):
+            lines = aiter_ndjson()
+        else:
+            lines = iter_ndjson()
+        response = StreamingHttpResponse(
+            lines, content_type="application/x-ndjson"
+        )
+        response["Content-Disposition"] = (
+            'attachment; filename="resources.ndjson"'
+        )
+        return response
+
+    @action(detail=False, methods=["post"], url_path="bulk")
+    def bulk(self, request):
+        """
+        Create many resources from a JSON array in one request.
+
+        Valid items are created even when others fail validation. The
+        response lists the created resources and, for every rejected item,
+        its index in the request and the validation errors.
+        """
+        serializer = ResourceItemBulkItemSerializer(
+            data=request.data,
+            many=True,
+            max_length=self.bulk_max_items,
+            context=self.get_serializer_context(),
+        )
+        serializer.is_valid(raise_exception=True)
+        items = serializer.save(user=request.user)
+
+        created = self.get_queryset().filter(
+            pk__in=[item.pk for item in items]
+        ).order_by("id")
+        errors = [
+            {"index": index, "errors": detail}
+            for index, detail in sorted(serializer.item_errors.items())
+        ]
+        data = {
+            "created": ResourceItemSerializer(
+                created, many=True, context=self.get_serializer_context()
+            ).data,
+            "errors": errors,
+        }
+        if not items:
+            return Response(data, status=status.HTTP_400_BAD_REQUEST)
+        return Response(data, status=status.HTTP_201_CREATED)
+
+
+class AsyncResourceItemView(AsyncReadOnlyView):
+    """
+    Async read-only resource list and detail for the ASGI application.
+    """
+    queryset = ResourceItem.objects.prefetch_related(
+        "tags"
+    ).defer("search_vector")
+    serializer_class = ResourceItemSerializer
+    filter_fields = ["category", "tags", "user"]
+    # The per-user subqueries of ResourceItemViewSet are not run here.
+    omit_fields = USER_STATE_FIELDS
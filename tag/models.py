@@ -1,6 +1,81 @@
-from django.db import models
+import re
+from functools import partial
+
+from django.db import IntegrityError, models, transaction
+from django.db.models import Q
 from django.utils.text import slugify
 
+# How often Tag.save recomputes the slug when a concurrent insert took it.
+SLUG_RETRIES = 3
+
+
+def next_free_slug(base_slug, taken):
+    """
+    Return `base_slug`, or `base_slug-N` with the smallest N >= 1, that is
+    not in the `taken` set of slugs.
+    """
+    if base_slug not in taken:
+        return base_slug
+    pattern = re.compile(rf"^{re.escape(base_slug)}-(\d+)$")
+    used = {
+        int(match.group(1))
+        for match in map(pattern.match, taken) if match
+    }
+    counter = 1
+    while counter in used:
+        counter += 1
+    return f"{base_slug}-{counter}"
+
+
+class TagManager(models.Manager):
+    """
+    Slug allocation helpers. Every existing slug that could collide with
+    a base slug (the base itself and its "-N" variants) shares its prefix,
+    so one `startswith` query on the indexed slug column finds them all.
+    """
+
+    def taken_slugs(self, base_slugs):
+        base_slugs = set(base_slugs)
+        if not base_slugs:
+            return set()
+        # Only the slug itself and its numbered variants. The prefix gives
+        # the database an index range to scan; the regex then drops longer
+        # slugs within it ("python-tips" for "python").
+        candidates = Q()
+        for base_slug in base_slugs:
+            candidates |= Q(slug=base_slug) | Q(
+                slug__startswith=f"{base_slug}-",
+                slug__regex=rf"^{re.escape(base_slug)}-\d+$",
+            )
+        return set(self.filter(candidates).values_list("slug", flat=True))
+
+    def allocate_slug(self, name):
+        base_slug = slugify(name)
+        return next_free_slug(base_slug, self.taken_slugs([base_slug]))
+
+    def bulk_create_with_slugs(self, tags, batch_size=None):
+        """
+        Assign unique slugs to every tag without one, then insert the
+        whole batch with bulk_create. Needs one slug query regardless of
+        the number of tags or collisions.
+
+        bulk_create sends no post_save signals, so the tag list cache is
+        invalidated here, once the transaction commits.
+        """
+        from lazydog_api.cache import bump_generation
+
+        tags = list(tags)
+        pending = [tag for tag in tags if not tag.slug]
+        taken = self.taken_slugs(slugify(tag.name) for tag in pending)
+        taken.update(tag.slug for tag in tags if tag.slug)
+        for tag in pending:
+            tag.slug = next_free_slug(slugify(tag.name), taken)
+            taken.add(tag.slug)
+
+        created = self.bulk_create(tags, batch_size=batch_size)
+        transaction.on_commit(partial(bump_generation, "tag"))
+        return created
+
 
 class Tag(models.Model):
     """
@@ -14,22 +89,29 @@ class Tag(models.Model):
     updated_at = models.DateTimeField(auto_now=True)
     slug = models.SlugField(max_length=100, unique=True, blank=True, null=True)
 
+    objects = TagManager()
+
     def save(self, *args, **kwargs):
         """
         Generates a unique slug from the name, appending a number if necessary.
-        """
-        if not self.slug:
-            base_slug = slugify(self.name)
-            slug = base_slug
-            counter = 1
 
-            while Tag.objects.filter(slug=slug).exists():
-                slug = f"{base_slug}-{counter}"
-                counter += 1
-
-            self.slug = slug
+        The free slug is found with a single query. If a concurrent save
+        claims the same slug first, the insert fails on the unique index
+        and the slug is allocated again.
+        """
+        if self.slug:
+            return super().save(*args, **kwargs)
 
-        super().save(*args, **kwargs)
+        for attempt in range(SLUG_RETRIES):
+            self.slug = Tag.objects.allocate_slug(self.name)
+            try:
+                with transaction.atomic():
+                    return super().save(*args, **kwargs)
+            except IntegrityError:
+                slug_conflict = Tag.objects.filter(slug=self.slug).exists()
+                self.slug = None
+                if not slug_conflict or attempt == SLUG_RETRIES - 1:
+                    raise
 
     def __str__(self):
         return self.name
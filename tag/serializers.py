@@ -1,8 +1,12 @@
 from rest_framework import serializers
 from .models import Tag
+from lazydog_api.serializers import (
+    SparseFieldsetSerializerMixin, TimedSerializerMixin,
+)
 
 
-class TagSerializer(serializers.ModelSerializer):
+class TagSerializer(TimedSerializerMixin, SparseFieldsetSerializerMixin,
+                    serializers.ModelSerializer):
     """
     Converts Tag model instances to JSON format for API responses.
     Ensures users can only use existing tags.
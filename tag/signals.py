@@ -0,0 +1,20 @@
+from functools import partial
+
+from django.db import transaction
+from django.db.models.signals import post_delete, post_save
+from django.dispatch import receiver
+
+from lazydog_api.cache import bump_generation
+from .models import Tag
+
+
+@receiver(post_save, sender=Tag)
+@receiver(post_delete, sender=Tag)
+def invalidate_tag_list_cache(sender, **kwargs):
+    """
+    Drop every cached tag list once a tag changes.
+
+    The bump waits for the commit: a request between the bump and the
+    commit would otherwise cache the old rows under the new generation.
+    """
+    transaction.on_commit(partial(bump_generation, 'tag'))
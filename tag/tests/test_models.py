@@ -9,10 +9,13 @@ Focus areas:
 - Field definitions and defaults
 - Auto-generated fields and timestamps
 - Slug uniqueness logic
+- Single-query slug allocation and bulk_create_with_slugs
 - __str__ method output
 """
+from unittest import mock
+
 from django.test import TestCase
-from tag.models import Tag
+from tag.models import Tag, next_free_slug
 from django.db import IntegrityError
 
 
@@ -60,3 +63,83 @@ class TagModelTestCase(TestCase):
         Tag.objects.create(name="Unique")
         with self.assertRaises(IntegrityError):
             Tag.objects.create(name="Unique")
+
+    def test_slug_allocation_uses_one_query_despite_collisions(self):
+        """
+        Test that finding a free slug costs one query however many
+        suffixed slugs already exist.
+        """
+        Tag.objects.bulk_create(
+            [Tag(name="python", slug="python")]
+            + [Tag(name=f"python {n}", slug=f"python-{n}") for n in range(1, 51)]
+        )
+        with self.assertNumQueries(1):
+            slug = Tag.objects.allocate_slug("Python")
+        self.assertEqual(slug, "python-51")
+
+    def test_next_free_slug_fills_gaps_and_ignores_other_prefixes(self):
+        """
+        Test that the smallest free suffix is used and that slugs which
+        merely share the prefix (python-django) are not counted.
+        """
+        taken = {"python", "python-1", "python-3", "python-django"}
+        self.assertEqual(next_free_slug("python", taken), "python-2")
+        self.assertEqual(next_free_slug("rust", taken), "rust")
+
+    def test_taken_slugs_only_loads_numbered_variants(self):
+        """
+        Test that the slug lookup returns the base slug and its numbered
+        variants, but not longer slugs that share the prefix.
+        """
+        for slug in ("python", "python-2", "python-django", "pythonic",
+                     "python-3-tips"):
+            Tag.objects.create(name=slug, slug=slug)
+        self.assertEqual(
+            Tag.objects.taken_slugs(["python"]), {"python", "python-2"}
+        )
+
+    def test_save_retries_when_slug_is_taken_concurrently(self):
+        """
+        Test that save allocates a new slug if another insert claimed the
+        allocated one between the lookup and the insert.
+
+        WHY: the lookup and insert are not atomic; the unique index is
+        the final arbiter and a lost race must not surface as an error.
+        """
+        Tag.objects.create(name="Race")
+        real_allocate = Tag.objects.allocate_slug
+        stale = iter(["race"])
+
+        def allocate(name):
+            return next(stale, None) or real_allocate(name)
+
+        with mock.patch.object(Tag.objects, "allocate_slug", allocate):
+            tag = Tag.objects.create(name="Race!")
+        self.assertEqual(tag.slug, "race-1")
+
+    def test_bulk_create_with_slugs_assigns_unique_slugs(self):
+        """
+        Test that a batch of colliding names gets unique slugs, including
+        collisions inside the batch, with one slug query and one insert.
+        """
+        Tag.objects.create(name="Django")
+        tags = [Tag(name="Django!"), Tag(name="django?"), Tag(name="Flask")]
+        with self.assertNumQueries(2):
+            Tag.objects.bulk_create_with_slugs(tags)
+        self.assertEqual(
+            sorted(Tag.objects.values_list("slug", flat=True)),
+            ["django", "django-1", "django-2", "flask"],
+        )
+
+    def test_bulk_create_with_slugs_keeps_explicit_slugs(self):
+        """
+        Test that tags which already carry a slug keep it and that the
+        generated slugs avoid it.
+        """
+        Tag.objects.bulk_create_with_slugs(
+            [Tag(name="Go Lang", slug="go-lang-1"), Tag(name="Go lang!")]
+        )
+        self.assertEqual(
+            sorted(Tag.objects.values_list("slug", flat=True)),
+            ["go-lang", "go-lang-1"],
+        )
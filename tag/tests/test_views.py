@@ -17,6 +17,7 @@ Recommended test user structure:
     - Test user: admin_user
 """
 from rest_framework.test import APITestCase
+from django.core.cache import cache
 from django.urls import reverse
 from rest_framework import status
 from django.contrib.auth.models import User
@@ -47,6 +48,13 @@ class TagAPITestCase(APITestCase):
         cls.url = reverse("tag-list")
         cls.url_detail = reverse("tag-detail", args=[cls.tag.tag_id])
 
+    def setUp(self):
+        """
+        Start every test with an empty list response cache, since cached
+        lists outlive the per-test database rollback.
+        """
+        cache.clear()
+
     # CREATE
     def test_create_tag_authenticated_admin(self):
         """
@@ -163,3 +171,53 @@ class TagAPITestCase(APITestCase):
         self.client.login(username="testuser1", password="testpassword1")
         response = self.client.delete(self.url_detail)
         self.assertEqual(response.status_code, status.HTTP_403_FORBIDDEN)
+
+    # CONDITIONAL GET
+    def test_list_not_modified_with_matching_etag(self):
+        """
+        Ensure GET /tags/ returns 304 when If-None-Match matches the ETag,
+        and a fresh 200 once a tag changes.
+        """
+        response = self.client.get(self.url)
+        etag = response["ETag"]
+        response = self.client.get(self.url, HTTP_IF_NONE_MATCH=etag)
+        self.assertEqual(response.status_code, status.HTTP_304_NOT_MODIFIED)
+
+        with self.captureOnCommitCallbacks(execute=True):
+            Tag.objects.create(name='Another Tag')
+        response = self.client.get(self.url, HTTP_IF_NONE_MATCH=etag)
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertNotEqual(response["ETag"], etag)
+
+    def test_detail_not_modified_with_matching_etag(self):
+        """
+        Ensure GET /tags/<id>/ returns 304 when If-None-Match matches.
+        """
+        etag = self.client.get(self.url_detail)["ETag"]
+        response = self.client.get(self.url_detail, HTTP_IF_NONE_MATCH=etag)
+        self.assertEqual(response.status_code, status.HTTP_304_NOT_MODIFIED)
+
+    # RESPONSE CACHE
+    def test_list_served_from_cache(self):
+        """
+        Ensure a repeated GET /tags/ is answered from the cache without
+        touching the database.
+        """
+        first = self.client.get(self.url)
+        self.assertEqual(first["X-Cache"], "MISS")
+        with self.assertNumQueries(0):
+            second = self.client.get(self.url)
+        self.assertEqual(second["X-Cache"], "HIT")
+        self.assertEqual(second.content, first.content)
+
+    def test_list_cache_invalidated_on_create(self):
+        """
+        Ensure creating a tag as admin invalidates the cached list.
+        """
+        self.client.get(self.url)
+        self.client.login(username="adminuser", password="adminpassword")
+        with self.captureOnCommitCallbacks(execute=True):
+            self.client.post(self.url, {"name": "Fresh Tag"})
+        response = self.client.get(self.url)
+        self.assertEqual(response["X-Cache"], "MISS")
+        self.assertIn("Fresh Tag", [tag["name"] for tag in response.json()])
@@ -1,17 +1,24 @@
 from rest_framework import viewsets
 from .models import Tag
 from .serializers import TagSerializer
+from lazydog_api.cache import CachedListMixin
+from lazydog_api.mixins import ConditionalGetMixin, SparseFieldsetMixin
 from lazydog_api.permissions import AdminOnly
 
 
-class TagViewSet(viewsets.ModelViewSet):
+class TagViewSet(CachedListMixin, SparseFieldsetMixin, ConditionalGetMixin,
+                 viewsets.ModelViewSet):
     """
     API endpoint to manage tags.
     - Unauthenticated users: Can view tags.
     - Authenticated users: Can assign/remove predefined tags but cannot
       create new ones.
     - Admins/superusers: Full CRUD permissions.
+    List and detail responses support conditional requests
+    (ETag / Last-Modified). JSON list responses are served from the
+    versioned response cache, invalidated by tag/signals.py.
     """
     queryset = Tag.objects.all()
     serializer_class = TagSerializer
     permission_classes = [AdminOnly]
+    cache_namespace = 'tag'